@@ -108,4 +108,32 @@ def create_app(config_class=AppConfig):
     app.register_blueprint(main_blueprint)
     app.register_blueprint(claude_blueprint)
 
+    # Build the in-memory skill index used by /main/match-skills
+    from app.utils.skill_index import init_skill_index
+    init_skill_index(app)
+
+    # Tiered (in-process + database) translation cache
+    from app.utils.translation_cache import init_translation_cache
+    init_translation_cache(app)
+
+    # Full-text org search (tsvector on Postgres, FTS5 on SQLite)
+    from app.utils.org_search import init_org_search
+    init_org_search(app)
+
+    # Cached facet counts for the directory sidebar
+    from app.utils.org_facets import init_facet_cache
+    init_facet_cache(app)
+
+    # Cached directory and org profile responses (memory or Redis)
+    from app.utils.response_cache import init_response_cache
+    init_response_cache(app)
+
+    # Where uploaded images are stored (GCS or a local directory)
+    from app.utils.object_storage import init_object_storage
+    init_object_storage(app)
+
+    # Background pool that resizes and uploads org images
+    from app.utils.image_jobs import init_image_jobs
+    init_image_jobs(app)
+
     return app
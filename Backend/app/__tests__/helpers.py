@@ -0,0 +1,113 @@
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+# Make create_app() pick up the in-memory SQLite configuration
+os.environ["CONFIG_CLASS"] = "app.config.TestConfig"
+
+from app import create_app, db
+from app.utils.response_cache import invalidate_org_responses
+from app.models import (
+    User,
+    OrgProfile,
+    SkillsNeeded,
+    FocusArea,
+    org_skills_connection,
+)
+
+
+class QueryCounter:
+    """Collects the SQL statements executed while it is active"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries():
+    """Count the statements sent to the database inside the block"""
+    counter = QueryCounter()
+    event.listen(db.engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, "before_cursor_execute", counter)
+
+
+def make_test_app():
+    """Create an app bound to a fresh in-memory database"""
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    return app
+
+
+def make_org(name, skills=(), focus_areas=(), is_admin=True):
+    """
+    Create an admin user and their organisation profile
+    Args:
+        name (str): Organisation name, also used to derive the admin's email
+        skills (iterable): (skill, status, description) tuples
+        focus_areas (iterable): Focus area names
+    Returns:
+        OrgProfile: The committed organisation profile
+    """
+    user = User(
+        first_name="Test",
+        last_name="Admin",
+        email=f"{name.lower().replace(' ', '_')}@example.com",
+        password="test_password",
+        is_admin=is_admin,
+    )
+    db.session.add(user)
+    db.session.flush()
+
+    org = OrgProfile(
+        user_id=user.id,
+        org_name=name,
+        org_overview=f"{name} overview",
+        org_mission_statement=f"{name} mission",
+        org_email=f"info@{name.lower().replace(' ', '')}.org",
+        org_phone="0700000000",
+        org_district_town="Town",
+        org_county="Nairobi",
+        org_po_box="00100",
+        org_country="Kenya",
+    )
+    db.session.add(org)
+    db.session.flush()
+
+    for area_name in focus_areas:
+        area = FocusArea.query.filter_by(name=area_name).first()
+        if not area:
+            area = FocusArea(name=area_name)
+            db.session.add(area)
+        org.focus_areas.append(area)
+
+    db.session.flush()
+
+    for skill_name, status, description in skills:
+        skill = SkillsNeeded.query.filter_by(skill=skill_name, status=status).first()
+        if not skill:
+            skill = SkillsNeeded(skill=skill_name, status=status)
+            db.session.add(skill)
+            db.session.flush()
+        db.session.execute(
+            org_skills_connection.insert().values(
+                org_id=org.id, skill_id=skill.id, description=description
+            )
+        )
+
+    db.session.commit()
+    # As the profile routes do after a write
+    invalidate_org_responses(user.id)
+    return org
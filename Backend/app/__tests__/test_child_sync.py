@@ -0,0 +1,110 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import OrgInitiatives, OrgProjects
+
+
+class TestEditProjectsAndInitiatives(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        org = make_org("Child Sync Org")
+        self.org_id = org.id
+        self.user_id = org.user_id
+        db.session.add_all(
+            [
+                OrgProjects(org_id=self.org_id, project_name=f"Project {i}",
+                            project_description="d", project_status="ongoing")
+                for i in range(3)
+            ]
+            + [
+                OrgInitiatives(org_id=self.org_id, initiative_name=f"Initiative {i}",
+                               initiative_description="d")
+                for i in range(2)
+            ]
+        )
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def project_payload(self):
+        return [
+            {**project.serialize(), "user_id": self.user_id}
+            for project in OrgProjects.query.filter_by(org_id=self.org_id).order_by(OrgProjects.id)
+        ]
+
+    def test_projects_are_updated_inserted_and_deleted(self):
+        payload = self.project_payload()
+        payload[0]["project_status"] = "completed"
+        del payload[2]
+        payload.append({"project_name": "New", "project_description": "d",
+                        "project_status": "upcoming", "user_id": self.user_id})
+
+        response = self.client.post("/profile/edit_projects", json=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json()["changes"],
+            {"inserted": 1, "updated": [1], "deleted": [3], "unchanged": [2]},
+        )
+        projects = OrgProjects.query.filter_by(org_id=self.org_id).order_by(OrgProjects.id).all()
+        self.assertEqual(
+            [(p.project_name, p.project_status) for p in projects],
+            [("Project 0", "completed"), ("Project 1", "ongoing"), ("New", "upcoming")],
+        )
+
+    def test_unchanged_save_is_read_only(self):
+        payload = self.project_payload()
+
+        with count_queries() as queries:
+            response = self.client.post("/profile/edit_projects", json=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(s.lstrip().upper().startswith("SELECT") for s in queries.statements))
+
+    def test_large_save_uses_constant_statements(self):
+        payload = self.project_payload()
+        for project in payload:
+            project["project_description"] = "changed"
+        payload = payload[1:] + [
+            {"project_name": f"New {i}", "project_description": "d",
+             "project_status": "ongoing", "user_id": self.user_id}
+            for i in range(40)
+        ]
+
+        with count_queries() as queries:
+            self.client.post("/profile/edit_projects", json=payload)
+
+        writes = [s for s in queries.statements if not s.lstrip().upper().startswith("SELECT")]
+        # UPDATE, INSERT and DELETE of the projects, plus the org's updated_at
+        self.assertEqual(len(writes), 4)
+        self.assertEqual(OrgProjects.query.filter_by(org_id=self.org_id).count(), 42)
+
+    def test_initiatives_are_synced(self):
+        initiatives = OrgInitiatives.query.filter_by(org_id=self.org_id).order_by(OrgInitiatives.id).all()
+        payload = [
+            {**initiatives[1].serialize(), "initiative_name": "Renamed",
+             "user_id": self.user_id, "org_id": self.org_id},
+        ]
+
+        response = self.client.post("/profile/edit_initiatives", json=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json()["changes"],
+            {"inserted": 0, "updated": [2], "deleted": [1], "unchanged": []},
+        )
+        self.assertEqual(
+            [i.initiative_name for i in OrgInitiatives.query.filter_by(org_id=self.org_id)],
+            ["Renamed"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+from datetime import datetime, timedelta
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import OrgProfile
+from app.utils.skill_resolver import resolve_skill_ids
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.org = make_org("Water Org", skills=[("Plumbing", "non-tech", "d")], focus_areas=["Health"])
+        self.user_id = self.org.user_id
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def revalidate(self, url, response, **params):
+        return self.client.get(
+            url, query_string=params, headers={"If-None-Match": response.headers["ETag"]}
+        )
+
+    def test_directory_not_modified_until_an_org_changes(self):
+        first = self.client.get("/main/orgs")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("public", first.headers["Cache-Control"])
+        self.assertIn("Last-Modified", first.headers)
+
+        with count_queries() as queries:
+            second = self.revalidate("/main/orgs", first)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+        # At most the version query; none when the response cache has it
+        self.assertLessEqual(queries.count, 1)
+
+        make_org("Code Org", skills=[("Python", "tech", "d")])
+        third = self.revalidate("/main/orgs", first)
+        self.assertEqual(third.status_code, 200)
+        self.assertEqual(len(third.get_json()), 2)
+
+    def test_skill_edit_changes_the_org_etag(self):
+        first = self.client.get("/profile/load_org", query_string={"user_id": self.user_id})
+        self.assertIn("private", first.headers["Cache-Control"])
+        self.assertIn("no-cache", first.headers["Cache-Control"])
+        self.assertEqual(
+            self.revalidate("/profile/load_org", first, user_id=self.user_id).status_code, 304
+        )
+        directory = self.client.get("/main/orgs")
+
+        self.client.post("/profile/edit_skills", json={
+            "0": {"skill": "Plumbing", "status": "non-tech", "description": "d", "action": "remains"},
+            "1": {"skill": "Python", "status": "tech", "description": "d", "action": "add"},
+            "user_id": self.user_id,
+        })
+
+        changed = self.revalidate("/profile/load_org", first, user_id=self.user_id)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(self.revalidate("/main/orgs", directory).status_code, 200)
+
+    def test_unchanged_save_keeps_the_org_etag(self):
+        first = self.client.get("/profile/load_org", query_string={"user_id": self.user_id})
+
+        self.client.post("/profile/edit_skills", json={
+            "0": {"skill": "Plumbing", "status": "non-tech", "description": "d", "action": "remains"},
+            "user_id": self.user_id,
+        })
+
+        self.assertEqual(
+            self.revalidate("/profile/load_org", first, user_id=self.user_id).status_code, 304
+        )
+
+    def test_skills_lists_follow_the_table_version(self):
+        for url in ("/all_skills", "/profile/volunteer/skills"):
+            first = self.client.get(url)
+            self.assertIn("max-age=300", first.headers["Cache-Control"])
+            self.assertEqual(self.revalidate(url, first).status_code, 304)
+
+            # Existing skills do not bump the version
+            resolve_skill_ids([("Plumbing", "non-tech")])
+            db.session.commit()
+            self.assertEqual(self.revalidate(url, first).status_code, 304)
+
+            resolve_skill_ids([(f"New skill for {url}", "tech")])
+            db.session.commit()
+            self.assertEqual(self.revalidate(url, first).status_code, 200)
+
+    def test_if_modified_since(self):
+        first = self.client.get("/profile/volunteer/skills")
+        resolve_skill_ids([("Python", "tech")])
+        db.session.commit()
+        first = self.client.get("/profile/volunteer/skills")
+
+        response = self.client.get(
+            "/profile/volunteer/skills",
+            headers={"If-Modified-Since": first.headers["Last-Modified"]},
+        )
+        self.assertEqual(response.status_code, 304)
+
+
+class TestOrgVersion(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.org = make_org("Water Org")
+        self.org_id = self.org.id
+        self.user_id = self.org.user_id
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def version(self):
+        db.session.expire_all()
+        return db.session.get(OrgProfile, self.org_id).version
+
+    def test_timestamps_are_set_by_the_database(self):
+        org = db.session.get(OrgProfile, self.org_id)
+        now = datetime.utcnow()
+        self.assertLess(abs(org.created_at - now), timedelta(minutes=1))
+        self.assertLess(abs(org.updated_at - now), timedelta(minutes=1))
+        self.assertEqual(org.version, 1)
+
+    def test_edits_bump_the_version(self):
+        self.client.post("/profile/edit_basic_info", json={"user_id": self.user_id, "org_name": "New"})
+        self.assertEqual(self.version(), 2)
+
+        # Saving the same values writes nothing
+        self.client.post("/profile/edit_basic_info", json={"user_id": self.user_id, "org_name": "New"})
+        self.assertEqual(self.version(), 2)
+
+        project = {"user_id": self.user_id, "project_name": "Wells",
+                   "project_description": "d", "project_status": "ongoing"}
+        self.client.post("/profile/edit_projects", json=[project])
+        self.assertEqual(self.version(), 3)
+
+        self.client.post("/profile/edit_skills", json={
+            "0": {"skill": "Python", "status": "tech", "description": "d", "action": "add"},
+            "user_id": self.user_id,
+        })
+        self.assertEqual(self.version(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from app.__tests__.helpers import make_test_app, make_org
+from app import db
+from app.utils.image_gc import collect_orphaned_images, referenced_image_names
+from app.utils.object_storage import GCSStorage, LocalStorage, StoredObject
+
+TWO_DAYS = 2 * 24 * 3600
+
+
+class TestImageGarbageCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.root = tempfile.mkdtemp()
+        self.storage = LocalStorage(self.root)
+        self.app.extensions["object_storage"] = self.storage
+
+        org = make_org("Image Org")
+        org.org_logo_filename = "logo/kept_200w.jpg"
+        org.org_image_variants = {"logo": {"base": "logo/kept", "widths": [96, 200]}}
+        org.org_cover_photo_filename = "cover_photo/legacy.jpg"
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+        shutil.rmtree(self.root)
+
+    def store(self, name, age=TWO_DAYS):
+        self.storage.upload(name, b"x", "image/jpeg")
+        written = time.time() - age
+        os.utime(self.storage.path(name), (written, written))
+
+    def stored_names(self):
+        return sorted(stored.name for stored in self.storage.list_objects())
+
+    def test_referenced_names_include_every_variant(self):
+        self.assertEqual(referenced_image_names(), {
+            "logo/kept_96w.webp", "logo/kept_96w.jpg",
+            "logo/kept_200w.webp", "logo/kept_200w.jpg",
+            "cover_photo/legacy.jpg",
+        })
+
+    def test_only_old_unreferenced_images_are_deleted(self):
+        kept = ["logo/kept_96w.webp", "logo/kept_200w.jpg", "cover_photo/legacy.jpg"]
+        for name in kept + ["logo/orphan_96w.jpg", "cover_photo/orphan.jpg", "test/other.txt"]:
+            self.store(name)
+        # Uploaded by a job that has not committed yet
+        self.store("logo/in_flight_96w.jpg", age=60)
+
+        dry_run = collect_orphaned_images(dry_run=True)
+        self.assertEqual(dry_run["orphaned"], 2)
+        self.assertEqual(dry_run["deleted"], 0)
+
+        summary = collect_orphaned_images(grace_period=timedelta(hours=24), batch_size=1)
+
+        self.assertEqual(summary["scanned"], 6)
+        self.assertEqual(summary["deleted"], 2)
+        self.assertEqual(self.stored_names(), sorted(kept + ["logo/in_flight_96w.jpg", "test/other.txt"]))
+
+    def test_images_reused_during_the_scan_are_kept(self):
+        self.store("logo/reused_96w.jpg")
+        self.store("logo/orphan_96w.jpg")
+        list_objects = self.storage.list_objects
+
+        def listing_then_reuse(prefix):
+            yield from list_objects(prefix)
+            # An upload of the same image finds it and refreshes it
+            self.storage.touch("logo/reused_96w.jpg")
+
+        with patch.object(self.storage, "list_objects", listing_then_reuse):
+            summary = collect_orphaned_images()
+
+        self.assertEqual(summary["orphaned"], 2)
+        self.assertEqual(summary["deleted"], 1)
+        self.assertEqual(self.stored_names(), ["logo/reused_96w.jpg"])
+
+
+    def test_images_reused_after_the_recheck_are_kept(self):
+        self.store("logo/reused_96w.jpg")
+        self.store("logo/orphan_96w.jpg")
+        stat = self.storage.stat
+
+        def stat_then_reuse(name):
+            stored = stat(name)
+            # The upload refreshes it just after the collector checked it
+            if name == "logo/reused_96w.jpg":
+                self.storage.touch(name)
+            return stored
+
+        with patch.object(self.storage, "stat", stat_then_reuse):
+            summary = collect_orphaned_images()
+
+        self.assertEqual(summary["deleted"], 1)
+        self.assertEqual(self.stored_names(), ["logo/reused_96w.jpg"])
+
+    def test_references_are_reread_for_each_batch(self):
+        self.store("logo/first_96w.jpg")
+        self.store("logo/second_96w.jpg")
+        delete_unchanged = self.storage.delete_unchanged
+
+        def delete_then_commit(objects):
+            deleted = delete_unchanged(objects)
+            # A job commits a reference to the second image after the first batch
+            org = make_org("Second Org")
+            org.org_logo_filename = "logo/second_96w.jpg"
+            db.session.commit()
+            return deleted
+
+        with patch.object(self.storage, "delete_unchanged", delete_then_commit):
+            summary = collect_orphaned_images(batch_size=1)
+
+        self.assertEqual(summary["deleted"], 1)
+        self.assertIn("logo/second_96w.jpg", self.stored_names())
+
+
+class TestGCSBatchDelete(unittest.TestCase):
+
+    def test_deletes_are_batched_and_conditional(self):
+        bucket = MagicMock()
+        client = MagicMock()
+        client.bucket.return_value = bucket
+        batch = bucket.client.batch.return_value
+        # One object changed since it was listed
+        batch._responses = [MagicMock(status_code=204)] * 99 + [MagicMock(status_code=412)]
+        storage = GCSStorage("bucket", client=client)
+        objects = [StoredObject(f"logo/{i}.jpg", 1, None, 1000 + i, 1) for i in range(250)]
+
+        self.assertEqual(storage.delete_unchanged(objects), 3 * 99)
+
+        self.assertEqual(bucket.client.batch.call_count, 3)
+        bucket.client.batch.assert_called_with(raise_exception=False)
+        self.assertEqual(bucket.delete_blob.call_count, 250)
+        bucket.delete_blob.assert_called_with(
+            "logo/249.jpg", if_generation_match=1249, if_metageneration_match=1, timeout=30
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
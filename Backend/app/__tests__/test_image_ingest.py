@@ -0,0 +1,68 @@
+import io
+import unittest
+
+from PIL import Image
+
+from app.utils.image_ingest import decoded_size, max_decoded_pixels, open_bounded
+
+LIMITS = {"max_pixels": 40_000_000, "memory_budget": 64 * 1024 * 1024}
+
+
+def encode(size, format, mode="RGB"):
+    output = io.BytesIO()
+    Image.new(mode, size, "white").save(output, format=format)
+    output.seek(0)
+    return output
+
+
+class TestOpenBounded(unittest.TestCase):
+
+    def test_jpeg_is_decoded_at_a_reduced_scale(self):
+        image = open_bounded(encode((4000, 3000), "JPEG"), (400, 400), (100, 100), **LIMITS)
+
+        # draft() picks the smallest 1/2, 1/4 or 1/8 scale still covering 400x400
+        self.assertEqual(image.size, (1000, 750))
+        image.load()
+        self.assertEqual(image.size, (1000, 750))
+
+    def test_oversize_image_is_rejected_from_the_header(self):
+        upload = encode((2000, 2000), "PNG", mode="L")
+        with self.assertRaisesRegex(ValueError, "Maximum is 3 megapixels"):
+            open_bounded(upload, (400, 400), (100, 100), max_pixels=3_000_000, memory_budget=LIMITS["memory_budget"])
+
+        # Only the header was read
+        self.assertLess(upload.tell(), 1024)
+
+    def test_memory_budget(self):
+        upload = encode((2000, 2000), "PNG")
+        # The bitmap plus thumbnail()'s reduced copy
+        self.assertEqual(decoded_size(Image.open(upload)), 2000 * 2000 * 5)
+        upload.seek(0)
+
+        with self.assertRaisesRegex(ValueError, "Maximum for PNG images is 1.7 megapixels"):
+            open_bounded(upload, (1920, 1080), (800, 400), max_pixels=LIMITS["max_pixels"], memory_budget=8 * 1024 * 1024)
+
+    def test_limits_for_the_default_budget(self):
+        budget = LIMITS["memory_budget"]
+        self.assertEqual(max_decoded_pixels("RGBA", budget), 13_421_772)
+        self.assertEqual(max_decoded_pixels("L", budget), 53_687_091)
+
+        # A JPEG decodes at a reduced scale, so only the pixel limit applies
+        open_bounded(encode((6000, 5000), "JPEG"), (1920, 1080), (800, 400), **LIMITS)
+        with self.assertRaisesRegex(ValueError, "Maximum for PNG images is 13.4 megapixels"):
+            open_bounded(encode((4000, 3500), "PNG", mode="RGBA"), (1920, 1080), (800, 400), **LIMITS)
+
+    def test_unsupported_content_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported or corrupt image"):
+            open_bounded(io.BytesIO(b"image bytes"), (400, 400), (100, 100), **LIMITS)
+
+        with self.assertRaisesRegex(ValueError, "Unsupported image format GIF"):
+            open_bounded(encode((200, 200), "GIF", mode="P"), (400, 400), (100, 100), **LIMITS)
+
+    def test_too_small(self):
+        with self.assertRaisesRegex(ValueError, "Image too small"):
+            open_bounded(encode((50, 50), "PNG"), (400, 400), (100, 100), **LIMITS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from app.__tests__.helpers import make_test_app, make_org
+from app import db
+from app.models import OrgProfile
+from app.utils.image_jobs import ImageJobQueue
+
+
+class FakeImageHandler:
+    """Stands in for ImageHandler so uploads never reach GCS"""
+
+    deleted = []
+    # Set to a threading.Barrier to make uploads wait for each other
+    barrier = None
+
+    def upload_variants(self, file, image_type):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        if file.filename.startswith("bad"):
+            raise ValueError("Invalid image file")
+        file.read()
+        return {"base": f"{image_type}/{file.filename.rsplit('.', 1)[0]}", "widths": [200, 400]}
+
+    def delete_if_idle(self, names, older_than):
+        self.deleted.append(names)
+        return True
+
+
+def variant_names(base, widths):
+    return [f"{base}_{width}w.{extension}" for width in widths for extension in ("webp", "jpg")]
+
+
+@patch("app.utils.image_jobs.ImageHandler", FakeImageHandler)
+class TestImageUploadJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        FakeImageHandler.deleted = []
+        FakeImageHandler.barrier = None
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def upload(self, user_id, **files):
+        data = {"user_id": str(user_id)}
+        for image_type, filename in files.items():
+            data[image_type] = (io.BytesIO(b"image bytes"), filename)
+        return self.client.post(
+            "/profile/upload-images", data=data, content_type="multipart/form-data"
+        )
+
+    def wait_for(self, job_id, user_id):
+        for _ in range(200):
+            response = self.client.get(f"/profile/upload-images/{job_id}?user_id={user_id}")
+            if response.get_json()["done"]:
+                return response.get_json()
+            time.sleep(0.01)
+        self.fail("Upload job did not finish")
+
+    def test_upload_returns_job_and_updates_profile(self):
+        org = make_org("Image Org")
+        org.org_logo_filename = "logo/old.jpg"
+        db.session.commit()
+
+        response = self.upload(org.user_id, logo="new.png", cover_photo="cover.png")
+
+        self.assertEqual(response.status_code, 202)
+        body = response.get_json()
+        self.assertIn(body["job_id"], body["status_url"])
+
+        job = self.wait_for(body["job_id"], org.user_id)
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["results"]["logo"]["filename"], "logo/new_400w.jpg")
+        self.assertEqual(job["results"]["cover_photo"]["filename"], "cover_photo/cover_400w.jpg")
+        self.assertEqual(FakeImageHandler.deleted, [["logo/old.jpg"]])
+
+        db.session.expire_all()
+        org = db.session.get(OrgProfile, org.id)
+        self.assertEqual(org.org_logo_filename, "logo/new_400w.jpg")
+        self.assertEqual(org.org_cover_photo_filename, "cover_photo/cover_400w.jpg")
+        self.assertEqual(org.org_image_variants["logo"], {"base": "logo/new", "widths": [200, 400]})
+
+        # A replaced image has all of its variants deleted
+        job_id = self.upload(org.user_id, logo="newer.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+        self.assertEqual(
+            FakeImageHandler.deleted, [["logo/old.jpg"], variant_names("logo/new", [200, 400])]
+        )
+
+    def test_profile_exposes_srcsets(self):
+        org = make_org("Srcset Org")
+        job_id = self.upload(org.user_id, logo="logo.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+        db.session.expire_all()
+
+        profile = self.client.get(f"/profile/load_org?user_id={org.user_id}").get_json()["orgProfile"]
+        logo = profile["org_images"]["logo"]
+        self.assertEqual(logo["widths"], [200, 400])
+        self.assertTrue(logo["src"].endswith("/logo/logo_400w.jpg"))
+        webp = [candidate.rsplit("/", 1)[1] for candidate in logo["webp"].split(", ")]
+        self.assertEqual(webp, ["logo_200w.webp 200w", "logo_400w.webp 400w"])
+        self.assertIn("/logo/logo_200w.jpg 200w", logo["jpeg"])
+        self.assertIsNone(profile["org_images"]["cover_photo"])
+
+        card = self.client.get("/main/orgs").get_json()[0]
+        self.assertEqual(card["org_images"]["logo"], logo)
+
+    def test_partial_failure_is_reported(self):
+        org = make_org("Partial Org")
+
+        response = self.upload(org.user_id, logo="good.png", cover_photo="bad.png")
+        job = self.wait_for(response.get_json()["job_id"], org.user_id)
+
+        self.assertEqual(job["status"], "partial")
+        self.assertTrue(job["results"]["logo"]["success"])
+        self.assertEqual(
+            job["results"]["cover_photo"], {"success": False, "error": "Invalid image file"}
+        )
+
+    def test_upload_without_files_is_rejected(self):
+        org = make_org("No Files Org")
+
+        response = self.upload(org.user_id)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_logo_and_cover_are_uploaded_concurrently(self):
+        org = make_org("Concurrent Org")
+        # Each upload waits for the other; done one after the other they
+        # would time out
+        FakeImageHandler.barrier = threading.Barrier(2)
+
+        response = self.upload(org.user_id, logo="logo.png", cover_photo="cover.png")
+        job = self.wait_for(response.get_json()["job_id"], org.user_id)
+
+        self.assertEqual(job["status"], "succeeded")
+
+    def test_shared_images_are_kept(self):
+        org = make_org("First Org")
+        other = make_org("Second Org")
+        for profile in (org, other):
+            profile.org_logo_filename = "logo/shared_400w.jpg"
+            profile.org_image_variants = {"logo": {"base": "logo/shared", "widths": [400]}}
+        db.session.commit()
+
+        job_id = self.upload(org.user_id, logo="new.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+        self.assertEqual(FakeImageHandler.deleted, [])
+
+        # Re-uploading the image a profile already has deletes nothing
+        job_id = self.upload(org.user_id, logo="new.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+        self.assertEqual(FakeImageHandler.deleted, [])
+
+        job_id = self.upload(other.user_id, logo="other.png").get_json()["job_id"]
+        self.wait_for(job_id, other.user_id)
+        self.assertEqual(FakeImageHandler.deleted, [variant_names("logo/shared", [400])])
+
+    def test_spooled_uploads_are_deleted_after_the_job(self):
+        org = make_org("Spool Org")
+        spool_dir = tempfile.mkdtemp()
+        self.app.config["IMAGE_SPOOL_DIR"] = spool_dir
+
+        response = self.upload(org.user_id, logo="good.png", cover_photo="bad.png")
+        self.wait_for(response.get_json()["job_id"], org.user_id)
+
+        self.assertEqual(os.listdir(spool_dir), [])
+        os.rmdir(spool_dir)
+
+    def test_oversize_upload_is_rejected(self):
+        org = make_org("Big Org")
+        self.app.config["MAX_CONTENT_LENGTH"] = 1024 * 1024
+
+        response = self.client.post("/profile/upload-images", data={
+            "user_id": str(org.user_id),
+            "logo": (io.BytesIO(b"\0" * (2 * 1024 * 1024)), "huge.png"),
+        }, content_type="multipart/form-data")
+
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("1 MB", response.get_json()["error"])
+
+    def test_status_is_shared_between_workers(self):
+        org = make_org("Shared Org")
+        job_id = self.upload(org.user_id, logo="new.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+
+        # Another worker's queue reads the same job from the database
+        other_worker = ImageJobQueue(max_workers=1)
+        self.addCleanup(other_worker.shutdown)
+        job = other_worker.get(job_id)
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["results"]["logo"]["filename"], "logo/new_400w.jpg")
+        self.assertIsNone(job["results"]["cover_photo"])
+
+    def test_status_is_hidden_from_other_users(self):
+        org = make_org("Owner Org")
+        other = make_org("Other Org")
+
+        job_id = self.upload(org.user_id, logo="new.png").get_json()["job_id"]
+        self.wait_for(job_id, org.user_id)
+
+        response = self.client.get(f"/profile/upload-images/{job_id}?user_id={other.user_id}")
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(f"/profile/upload-images/unknown?user_id={org.user_id}")
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from app.__tests__.helpers import make_test_app
+from app import db
+from app.utils import object_storage
+from app.utils.image_handler import ImageHandler
+from app.utils.object_storage import GCSStorage, LocalStorage
+
+
+def png_upload(size, filename="logo.png"):
+    output = io.BytesIO()
+    Image.new("RGB", size, "white").save(output, format="PNG")
+    output.seek(0)
+    return FileStorage(stream=output, filename=filename)
+
+
+class TestLocalStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.root = tempfile.mkdtemp()
+        self.storage = LocalStorage(self.root)
+        self.app.extensions["object_storage"] = self.storage
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+        shutil.rmtree(self.root)
+
+    def test_upload_list_delete(self):
+        self.storage.upload("logo/a_96w.jpg", b"a", "image/jpeg")
+        self.storage.upload("cover_photo/b_480w.jpg", b"bb", "image/jpeg")
+
+        self.assertTrue(self.storage.exists("logo/a_96w.jpg"))
+        listed = list(self.storage.list_objects("logo/"))
+        self.assertEqual([(stored.name, stored.size) for stored in listed], [("logo/a_96w.jpg", 1)])
+        self.assertIsNotNone(listed[0].updated.tzinfo)
+
+        self.storage.delete("logo/a_96w.jpg")
+        self.storage.delete("logo/a_96w.jpg")  # Already gone
+        self.assertFalse(self.storage.exists("logo/a_96w.jpg"))
+        self.assertEqual(self.storage.public_url("logo/a_96w.jpg"), "/media/logo/a_96w.jpg")
+
+        with self.assertRaises(ValueError):
+            self.storage.upload("../outside.jpg", b"x", "image/jpeg")
+
+    def test_media_route_sends_the_file(self):
+        self.storage.upload("logo/a_96w.jpg", b"jpeg bytes", "image/jpeg")
+
+        response = self.client.get("/media/logo/a_96w.jpg")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, b"jpeg bytes")
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        response.close()
+
+        self.assertEqual(self.client.get("/media/logo/missing.jpg").status_code, 404)
+
+    def test_media_route_hands_off_to_nginx(self):
+        self.storage.accel_prefix = "/_media"
+
+        response = self.client.get("/media/logo/a_96w.jpg")
+        self.assertEqual(response.headers["X-Accel-Redirect"], "/_media/logo/a_96w.jpg")
+        self.assertEqual(response.data, b"")
+        self.assertNotIn("Content-Type", response.headers)
+
+    def test_image_handler_uploads_offline(self):
+        handler = ImageHandler()
+        entry = handler.upload_variants(png_upload((300, 300)), "logo")
+
+        names = [stored.name for stored in self.storage.list_objects("logo/")]
+        self.assertEqual(len(names), 2 * len(entry["widths"]))
+        self.assertEqual(entry["widths"], [96, 200, 300])
+        self.assertEqual(handler.get_public_url(names[0]), f"/media/{names[0]}")
+
+        handler.delete_variants(entry)
+        self.assertEqual(list(self.storage.list_objects("logo/")), [])
+
+    def test_identical_uploads_are_stored_once(self):
+        handler = ImageHandler()
+        entry = handler.upload_variants(png_upload((300, 300)), "logo")
+        for stored in self.storage.list_objects("logo/"):
+            os.utime(self.storage.path(stored.name), (0, 0))
+
+        with patch.object(self.storage, "upload") as upload:
+            again = handler.upload_variants(png_upload((300, 300), filename="copy.png"), "logo")
+        self.assertEqual(again, entry)
+        upload.assert_not_called()
+        # Reused objects are refreshed so the GC grace period covers them
+        self.assertTrue(all(stored.updated.year > 1970 for stored in self.storage.list_objects("logo/")))
+
+        different = handler.upload_variants(png_upload((320, 300)), "logo")
+        self.assertNotEqual(different["base"], entry["base"])
+
+
+    def test_replaced_images_reused_recently_are_kept(self):
+        handler = ImageHandler()
+        entry = handler.upload_variants(png_upload((300, 300)), "logo")
+        names = [stored.name for stored in self.storage.list_objects("logo/")]
+        for name in names:
+            os.utime(self.storage.path(name), (0, 0))
+        cut_off = datetime.now(timezone.utc) - timedelta(hours=24)
+
+        # Another org's upload reuses the image and has not committed yet
+        handler.upload_variants(png_upload((300, 300), filename="copy.png"), "logo")
+        self.assertFalse(handler.delete_if_idle(names, cut_off))
+        self.assertEqual(len(list(self.storage.list_objects("logo/"))), 2 * len(entry["widths"]))
+
+        for name in names:
+            os.utime(self.storage.path(name), (0, 0))
+        self.assertTrue(handler.delete_if_idle(names, cut_off))
+        self.assertEqual(list(self.storage.list_objects("logo/")), [])
+
+
+class TestGCSStorage(unittest.TestCase):
+
+    def test_client_is_shared(self):
+        with patch.object(object_storage, "_gcs_client", None), \
+                patch("google.cloud.storage.Client") as client_class:
+            first = GCSStorage("bucket-a")
+            second = GCSStorage("bucket-b")
+            first.bucket, second.bucket, first.bucket
+
+        client_class.assert_called_once_with()
+        self.assertEqual(first.public_url("logo/a.jpg"), "https://storage.googleapis.com/bucket-a/logo/a.jpg")
+
+
+if __name__ == "__main__":
+    unittest.main()
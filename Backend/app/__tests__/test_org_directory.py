@@ -0,0 +1,100 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+
+
+class TestOrgDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def seed_orgs(self, count, start=0):
+        for i in range(start, start + count):
+            make_org(
+                f"Org {i}",
+                skills=[(f"Skill {i}", "tech", "desc"), ("Accounting", "non-tech", None)],
+                focus_areas=[f"Area {i % 3}"],
+            )
+
+    def test_get_all_orgs_payload(self):
+        self.seed_orgs(2)
+
+        response = self.client.get("/main/orgs")
+
+        self.assertEqual(response.status_code, 200)
+        orgs = response.get_json()
+        self.assertEqual([org["org_name"] for org in orgs], ["Org 0", "Org 1"])
+        self.assertEqual(
+            orgs[0]["focus_areas"], [{"id": 1, "name": "Area 0", "description": None}]
+        )
+        self.assertEqual(
+            sorted(skill["skill"] for skill in orgs[1]["skills_needed"]),
+            ["Accounting", "Skill 1"],
+        )
+        self.assertIsNone(orgs[0]["org_logo_filename"])
+
+    def test_get_all_orgs_query_count_is_constant(self):
+        self.seed_orgs(3)
+        db.session.remove()
+        with count_queries() as few:
+            self.client.get("/main/orgs")
+
+        self.seed_orgs(20, start=3)
+        db.session.remove()
+        with count_queries() as many:
+            response = self.client.get("/main/orgs")
+
+        self.assertEqual(len(response.get_json()), 23)
+        self.assertEqual(few.count, many.count)
+        # Directory version, org columns, focus areas and skills
+        self.assertLessEqual(many.count, 4)
+
+    def test_keyset_pagination_walks_every_org_once(self):
+        self.seed_orgs(5)
+
+        seen = []
+        cursor = None
+        while True:
+            query = {"limit": 2}
+            if cursor:
+                query["cursor"] = cursor
+            body = self.client.get("/main/orgs", query_string=query).get_json()
+            seen.extend(org["org_name"] for org in body["orgs"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(seen, [f"Org {i}" for i in range(5)])
+
+    def test_fields_projection(self):
+        self.seed_orgs(1)
+
+        response = self.client.get(
+            "/main/orgs", query_string={"fields": "org_name,focus_areas"}
+        )
+
+        self.assertEqual(
+            response.get_json(),
+            [{
+                "id": 1,
+                "org_name": "Org 0",
+                "focus_areas": [{"id": 1, "name": "Area 0", "description": None}],
+            }],
+        )
+
+    def test_invalid_parameters(self):
+        for query in ({"fields": "password"}, {"limit": "0"}, {"cursor": "not-a-cursor"}):
+            response = self.client.get("/main/orgs", query_string=query)
+            self.assertEqual(response.status_code, 400, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
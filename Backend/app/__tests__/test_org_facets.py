@@ -0,0 +1,77 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import OrgProfile
+from app.utils.org_search import get_org_search
+
+
+class TestOrgFacets(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        make_org("Water Org", skills=[("Plumbing", "non-tech", "d")], focus_areas=["Health"])
+        make_org("Code Org", skills=[("Python", "tech", "d")], focus_areas=["Education"])
+        make_org("School Org", skills=[("Python", "tech", "d"), ("Writing", "non-tech", "d")],
+                 focus_areas=["Education", "Health"])
+        get_org_search().rebuild()
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def facets(self, **params):
+        return self.client.get("/main/orgs/facets", query_string=params).get_json()
+
+    def test_counts_every_facet(self):
+        facets = self.facets()
+
+        self.assertEqual(facets["focus_areas"], [
+            {"name": "Education", "count": 2},
+            {"name": "Health", "count": 2},
+        ])
+        self.assertEqual(facets["skills"], {
+            "tech": [{"name": "Python", "count": 2}],
+            "non-tech": [{"name": "Plumbing", "count": 1}, {"name": "Writing", "count": 1}],
+        })
+
+    def test_filters_apply_to_other_facets_only(self):
+        facets = self.facets(focus_area="Health")
+
+        # Focus area counts ignore the focus area filter itself
+        self.assertEqual(len(facets["focus_areas"]), 2)
+        self.assertEqual(facets["skills"]["tech"], [{"name": "Python", "count": 1}])
+
+        facets = self.facets(q="school")
+        self.assertEqual(facets["focus_areas"], [
+            {"name": "Education", "count": 1},
+            {"name": "Health", "count": 1},
+        ])
+
+    def test_counts_are_one_query_and_cached(self):
+        with count_queries() as queries:
+            self.facets(skill="Python")
+            self.facets(skill="Python")
+
+        self.assertEqual(queries.count, 1)
+        self.assertEqual(self.app.extensions["facet_cache"].stats["hits"], 1)
+
+    def test_skill_edits_invalidate_counts(self):
+        self.assertEqual(self.facets()["skills"]["tech"], [{"name": "Python", "count": 2}])
+        org = OrgProfile.query.filter_by(org_name="Water Org").first()
+
+        self.client.post("/profile/edit_skills", json={
+            "0": {"skill": "Python", "status": "tech", "description": "d", "action": "add"},
+            "user_id": org.user_id,
+        })
+
+        self.assertEqual(self.facets()["skills"]["tech"], [{"name": "Python", "count": 3}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import OrgInitiatives, OrgProjects, org_skills_connection
+from app.utils.org_onboarding import store_onboarding_content
+
+
+def onboarding_payload(name, count):
+    return {
+        "ongoingProjects": [{"projectName": f"{name} project {i}", "description": "d"} for i in range(count)],
+        "previousProjects": [{"projectName": f"{name} old project", "description": "d"}],
+        "programInitiatives": [{"initiativeName": f"{name} initiative {i}", "description": "d"} for i in range(count)],
+        "supportNeeds": {
+            "techSkills": [{"value": f"Tech {i}", "description": "d"} for i in range(count)],
+            "nonTechSkills": [{"value": "Writing", "description": "first"}, {"value": "Writing", "description": "second"}],
+        },
+    }
+
+
+class TestOrgOnboarding(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def post(self, org, payload):
+        return self.client.post(
+            "/profile/org/projects_initiatives", json={"user_id": org.user_id, **payload}
+        )
+
+    def test_route_stores_all_content(self):
+        org = make_org("Onboard Org")
+
+        response = self.post(org, onboarding_payload("Onboard Org", 3))
+
+        self.assertEqual(response.status_code, 201)
+        projects = OrgProjects.query.filter_by(org_id=org.id).all()
+        self.assertEqual(sorted(p.project_status for p in projects), ["completed", "ongoing", "ongoing", "ongoing"])
+        self.assertEqual(OrgInitiatives.query.filter_by(org_id=org.id).count(), 3)
+        links = db.session.execute(
+            db.select(org_skills_connection).where(org_skills_connection.c.org_id == org.id)
+        ).all()
+        # Writing is listed twice but linked once, with its first description
+        self.assertEqual(len(links), 4)
+        self.assertIn("first", [link.description for link in links])
+
+    def test_route_statement_count_does_not_grow_with_rows(self):
+        few_org = make_org("Few Rows")
+        many_org = make_org("Many Rows")
+
+        with count_queries() as few:
+            self.post(few_org, onboarding_payload("Few Rows", 1))
+        with count_queries() as many:
+            self.post(many_org, onboarding_payload("Many Rows", 30))
+
+        self.assertEqual(few.count, many.count)
+
+    def test_batch_of_orgs_returns_new_ids(self):
+        orgs = [make_org(f"Batch Org {i}") for i in range(5)]
+
+        payloads = [(org.id, onboarding_payload(org.org_name, 2)) for org in orgs]
+
+        with count_queries() as queries:
+            result = store_onboarding_content(payloads)
+        db.session.commit()
+
+        self.assertLessEqual(queries.count, 6)
+        self.assertEqual(len(result["project_ids"]), 15)
+        self.assertEqual(len(result["initiative_ids"]), 10)
+        self.assertEqual(result["skill_links"], 15)
+        self.assertEqual(
+            OrgProjects.query.filter(OrgProjects.id.in_(result["project_ids"])).count(), 15
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import OrgProfile
+
+
+class TestOrgProfileSerialize(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def test_serialize_includes_skill_descriptions(self):
+        org = make_org(
+            "Serialize Org",
+            skills=[("Writing", "non-tech", "Grant writing"), ("Python", "tech", None)],
+        )
+
+        skills = org.serialize()["skills_needed"]
+
+        self.assertEqual(
+            skills,
+            [
+                {"id": 1, "skill": "Writing", "status": "non-tech", "description": "Grant writing"},
+                {"id": 2, "skill": "Python", "status": "tech", "description": None},
+            ],
+        )
+
+    def test_serialize_query_count_does_not_grow_with_skills(self):
+        few = make_org("Few Skills", skills=[("Skill 0", "tech", "d")])
+        many = make_org(
+            "Many Skills",
+            skills=[(f"Skill {i}", "tech", f"d{i}") for i in range(25)],
+        )
+        few_id, many_id = few.id, many.id
+
+        counts = []
+        for org_id in (few_id, many_id):
+            db.session.expire_all()
+            org = db.session.get(OrgProfile, org_id)
+            with count_queries() as counter:
+                org.serialize()
+            counts.append(counter.count)
+
+        self.assertEqual(counts[0], counts[1])
+        # One joined skills query plus the focus areas lazy load
+        self.assertLessEqual(counts[1], 2)
+
+    def test_load_org_response_shape(self):
+        org = make_org("Load Org", skills=[("Writing", "non-tech", "Grant writing")])
+
+        response = self.client.get("/profile/load_org", query_string={"user_id": org.user_id})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["orgProfile"]["skills_needed"][0]["description"], "Grant writing")
+        self.assertEqual(body["orgProjects"], [])
+        self.assertEqual(body["orgInitiatives"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org
+from app import db
+from app.models import OrgProfile
+from app.utils.org_search import get_org_search, search_terms
+
+
+class TestOrgSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        make_org("Clean Water Trust", skills=[("Plumbing", "non-tech", "d")], focus_areas=["Health"])
+        make_org("Girls Code Club", skills=[("Python", "tech", "d")], focus_areas=["Education"])
+        water_school = make_org("Hillside School", skills=[("Python", "tech", "d")], focus_areas=["Education"])
+        water_school.org_overview = "We bring clean water to schools"
+        water_school.org_county = "Kisumu"
+        db.session.commit()
+
+        get_org_search().rebuild()
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def search(self, **params):
+        return self.client.get("/main/orgs/search", query_string=params)
+
+    def test_terms_strip_query_syntax(self):
+        self.assertEqual(search_terms('water" OR *school-'), ["water", "or", "school"])
+
+    def test_ranks_name_matches_above_text_matches(self):
+        response = self.search(q="water")
+
+        self.assertEqual(response.status_code, 200)
+        orgs = response.get_json()["orgs"]
+        self.assertEqual([org["org_name"] for org in orgs], ["Clean Water Trust", "Hillside School"])
+        self.assertGreater(orgs[0]["score"], orgs[1]["score"])
+
+    def test_matches_focus_area_and_skill_names_by_prefix(self):
+        names = lambda response: sorted(org["org_name"] for org in response.get_json()["orgs"])
+
+        self.assertEqual(names(self.search(q="educ")), ["Girls Code Club", "Hillside School"])
+        self.assertEqual(names(self.search(q="plumb")), ["Clean Water Trust"])
+
+    def test_filters_narrow_results(self):
+        response = self.search(q="water", skill="Python", county="kisumu")
+        self.assertEqual([org["org_name"] for org in response.get_json()["orgs"]], ["Hillside School"])
+
+        response = self.search(focus_area="Education", fields="org_name")
+        orgs = response.get_json()["orgs"]
+        self.assertEqual(orgs, [
+            {"id": 2, "org_name": "Girls Code Club", "score": None},
+            {"id": 3, "org_name": "Hillside School", "score": None},
+        ])
+
+    def test_paging(self):
+        first = self.search(q="water", limit=1).get_json()
+        second = self.search(q="water", limit=1, offset=first["next_offset"]).get_json()
+
+        self.assertEqual(first["next_offset"], 1)
+        self.assertEqual(second["orgs"][0]["org_name"], "Hillside School")
+        self.assertIsNone(second["next_offset"])
+
+    def test_requires_query_or_filter(self):
+        self.assertEqual(self.search(q="  ").status_code, 400)
+
+    def test_edits_refresh_the_index(self):
+        org = OrgProfile.query.filter_by(org_name="Girls Code Club").first()
+
+        self.client.post(
+            "/profile/edit_basic_info",
+            json={"user_id": org.user_id, "org_overview": "Robotics clubs for girls"},
+        )
+
+        orgs = self.search(q="robotics").get_json()["orgs"]
+        self.assertEqual([o["org_name"] for o in orgs], ["Girls Code Club"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import org_skills_connection
+from app.utils.org_skill_sync import diff_org_skills
+
+
+class TestDiffOrgSkills(unittest.TestCase):
+
+    def test_groups_skills_by_change(self):
+        diff = diff_org_skills(
+            current={1: "same", 2: "old", 3: "gone"},
+            desired={1: "same", 2: "new", 4: "added"},
+        )
+
+        self.assertEqual(diff.added, [4])
+        self.assertEqual(diff.removed, [3])
+        self.assertEqual(diff.changed, [2])
+        self.assertEqual(diff.unchanged, [1])
+
+
+class TestEditOrgSkills(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.org = make_org(
+            "Skill Edit Org",
+            skills=[("Python", "tech", "Backend"), ("Writing", "non-tech", "Grants"), ("Design", "tech", "Logo")],
+        )
+        self.org_id = self.org.id
+        self.user_id = self.org.user_id
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def edit(self, items):
+        payload = {str(i): item for i, item in enumerate(items)}
+        payload["user_id"] = self.user_id
+        return self.client.post("/profile/edit_skills", json=payload)
+
+    def stored(self):
+        rows = db.session.execute(
+            db.select(org_skills_connection.c.skill_id, org_skills_connection.c.description)
+            .where(org_skills_connection.c.org_id == self.org_id)
+        ).all()
+        return dict(rows)
+
+    def test_reports_and_applies_changes(self):
+        response = self.edit([
+            {"skill": "Python", "status": "tech", "description": "Backend", "action": "remains"},
+            {"skill": "Writing", "status": "non-tech", "description": "Reports", "action": "remains"},
+            {"skill": "Design", "status": "tech", "description": "", "action": "remove"},
+            {"skill": "SQL", "status": "tech", "description": "Queries", "action": "add"},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        changes = response.get_json()["changes"]
+        self.assertEqual([s["skill"] for s in changes["added"]], ["SQL"])
+        self.assertEqual([s["skill"] for s in changes["removed"]], ["Design"])
+        self.assertEqual(changes["updated"], [{"id": 2, "skill": "Writing", "status": "non-tech", "description": "Reports"}])
+        self.assertEqual(changes["unchanged"], 1)
+        self.assertEqual(self.stored(), {1: "Backend", 2: "Reports", 4: "Queries"})
+
+    def test_skill_listed_twice_keeps_the_last_description(self):
+        response = self.edit([
+            {"skill": "Python", "status": "tech", "description": "First", "action": "remains"},
+            {"skill": "Python", "status": "tech", "description": "Last", "action": "remains"},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stored(), {1: "Last"})
+
+    def test_unchanged_save_writes_nothing(self):
+        items = [
+            {"skill": "Python", "status": "tech", "description": "Backend", "action": "remains"},
+            {"skill": "Writing", "status": "non-tech", "description": "Grants", "action": "remains"},
+            {"skill": "Design", "status": "tech", "description": "Logo", "action": "remains"},
+        ]
+
+        with count_queries() as queries:
+            response = self.edit(items)
+
+        writes = [s for s in queries.statements if not s.lstrip().upper().startswith("SELECT")]
+        self.assertEqual(writes, [])
+        self.assertEqual(response.get_json()["changes"]["unchanged"], 3)
+
+    def test_writes_are_batched(self):
+        items = [
+            {"skill": "Python", "status": "tech", "description": "Changed", "action": "remains"},
+            {"skill": "Writing", "status": "non-tech", "description": "Changed", "action": "remains"},
+        ] + [
+            {"skill": f"New {i}", "status": "tech", "description": "d", "action": "add"}
+            for i in range(10)
+        ]
+
+        with count_queries() as queries:
+            self.edit(items)
+
+        writes = [
+            s for s in queries.statements
+            if s.lstrip().upper().startswith(("INSERT INTO ORG_SKILLS", "UPDATE ORG_SKILLS", "DELETE FROM ORG_SKILLS"))
+        ]
+        self.assertEqual(len(writes), 3)
+        self.assertEqual(len(self.stored()), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
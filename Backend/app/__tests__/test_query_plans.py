@@ -0,0 +1,85 @@
+import re
+import unittest
+
+from sqlalchemy import select, text
+
+from app.__tests__.helpers import make_test_app, make_org
+from app import db
+from app.models import (
+    OrgProfile,
+    OrgProjects,
+    OrgInitiatives,
+    SkillsNeeded,
+    FocusArea,
+    org_skills_connection,
+    user_skills,
+)
+from app.utils.org_search import matching_org_ids
+
+# "SCAN org_profile" (or "SCAN TABLE org_profile" before SQLite 3.36)
+# means every row is read; indexed lookups show up as "SEARCH ..."
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+
+def hot_queries():
+    """The lookups the profile routes and directory filters run on every request"""
+    return {
+        "org by owner": select(OrgProfile.id).where(OrgProfile.user_id == 1),
+        "skills by name": select(SkillsNeeded.id).where(SkillsNeeded.skill.in_(["Python", "Writing"])),
+        "focus area by name": select(FocusArea.id).where(FocusArea.name == "Health"),
+        "org projects": select(OrgProjects.id).where(OrgProjects.org_id == 1),
+        "org initiatives": select(OrgInitiatives.id).where(OrgInitiatives.org_id == 1),
+        "orgs needing a skill": select(org_skills_connection.c.org_id).where(
+            org_skills_connection.c.skill_id == 1
+        ),
+        "volunteers with a skill": select(user_skills.c.user_id).where(user_skills.c.skill_id == 1),
+        "orgs by focus area filter": matching_org_ids(focus_area="Health"),
+        "orgs by skill filter": matching_org_ids(skill="Python"),
+    }
+
+
+def full_scans(statement):
+    """
+    Run EXPLAIN on a statement
+    Returns:
+        list: The tables the plan reads in full
+    """
+    sql = str(statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+
+    if db.engine.dialect.name == "postgresql":
+        # Tiny test tables would be scanned anyway; only fall back to a
+        # sequential scan when no index can answer the query
+        db.session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = db.session.execute(text(f"EXPLAIN {sql}")).scalars().all()
+        return [line.strip() for line in plan if "Seq Scan" in line]
+
+    plan = db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [
+        match.group(1)
+        for match in (SQLITE_FULL_SCAN.match(row[-1]) for row in plan)
+        if match
+    ]
+
+
+class TestQueryPlans(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        make_org("Water Org", skills=[("Python", "tech", "d")], focus_areas=["Health"])
+
+    def tearDown(self):
+        db.session.rollback()
+        db.session.remove()
+        self.ctx.pop()
+
+    def test_hot_queries_use_indexes(self):
+        for name, statement in hot_queries().items():
+            with self.subTest(query=name):
+                self.assertEqual(full_scans(statement), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import socketserver
+import threading
+import time
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.utils.response_cache import (
+    DEFAULT_GENERATION,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    get_response_cache,
+)
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """
+    A local server speaking the Redis protocol, enough of it for redis-py:
+    HELLO (RESP2 or RESP3), GET, SET with EX, PING and CLIENT. Keys expire
+    like Redis.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.data = {}
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self):
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def execute(self, command, *args):
+        command = command.upper()
+        with self.lock:
+            if command == b"PING":
+                return "+PONG"
+            if command == b"CLIENT":
+                return "+OK"
+            if command == b"GET":
+                value, expires_at = self.data.get(args[0], (None, None))
+                if expires_at is not None and expires_at <= time.monotonic():
+                    del self.data[args[0]]
+                    value = None
+                return value
+            if command == b"SET":
+                options = [arg.upper() for arg in args[2:]]
+                expires_at = None
+                if b"EX" in options:
+                    expires_at = time.monotonic() + int(options[options.index(b"EX") + 1])
+                self.data[args[0]] = (args[1], expires_at)
+                return "+OK"
+        return f"-ERR unknown command '{command.decode()}'"
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        protocol = 2
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            count = int(line[1:])
+            args = []
+            for _ in range(count):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            if args[0].upper() == b"HELLO":
+                protocol = int(args[1]) if len(args) > 1 else protocol
+                header = b"%1" if protocol == 3 else b"*2"
+                self.wfile.write(header + b"\r\n+proto\r\n:%d\r\n" % protocol)
+                continue
+            reply = self.server.execute(*args)
+            if reply is None:
+                self.wfile.write(b"_\r\n" if protocol == 3 else b"$-1\r\n")
+            elif isinstance(reply, bytes):
+                self.wfile.write(b"$%d\r\n%s\r\n" % (len(reply), reply))
+            else:
+                self.wfile.write(reply.encode() + b"\r\n")
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.org = make_org("Water Org", skills=[("Plumbing", "non-tech", "d")], focus_areas=["Health"])
+        self.user_id = self.org.user_id
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def test_directory_hit_skips_the_database(self):
+        first = self.client.get("/main/orgs")
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+
+        with count_queries() as queries:
+            second = self.client.get("/main/orgs")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(queries.count, 0)
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+
+        # Arguments are part of the key
+        self.assertEqual(self.client.get("/main/orgs?fields=org_name").headers["X-Cache"], "MISS")
+
+        not_modified = self.client.get("/main/orgs", headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+
+        stats = self.client.get("/main/cache/stats").get_json()
+        self.assertEqual(stats["backend"], "memory")
+        self.assertEqual(stats["endpoints"]["main.get_all_orgs"]["hits"], 2)
+        self.assertEqual(stats["endpoints"]["main.get_all_orgs"]["misses"], 2)
+        self.assertEqual(stats["endpoints"]["main.get_all_orgs"]["hit_rate"], 0.5)
+
+    def test_profile_writes_invalidate(self):
+        self.use_redis()
+        profile_url = f"/profile/load_org?user_id={self.user_id}"
+        self.client.get("/main/orgs")
+        self.client.get(profile_url)
+        self.assertEqual(self.client.get(profile_url).headers["X-Cache"], "HIT")
+
+        self.client.post("/profile/edit_basic_info", json={
+            "user_id": self.user_id, "org_name": "Clean Water Org",
+        })
+
+        directory = self.client.get("/main/orgs")
+        self.assertEqual(directory.headers["X-Cache"], "MISS")
+        self.assertEqual(directory.get_json()[0]["org_name"], "Clean Water Org")
+        profile = self.client.get(profile_url)
+        self.assertEqual(profile.headers["X-Cache"], "MISS")
+        self.assertEqual(profile.get_json()["orgProfile"]["org_name"], "Clean Water Org")
+
+        self.client.post("/profile/edit_projects", json=[{
+            "user_id": self.user_id, "project_name": "Wells",
+            "project_description": "d", "project_status": "ongoing",
+        }])
+        self.assertEqual(len(self.client.get(profile_url).get_json()["orgProjects"]), 1)
+
+    def test_memory_backend_does_not_cache_profiles(self):
+        # Another worker could not see the invalidation after an edit
+        profile = self.client.get(f"/profile/load_org?user_id={self.user_id}")
+        self.assertEqual(profile.status_code, 200)
+        self.assertNotIn("X-Cache", profile.headers)
+        self.assertEqual(self.client.get("/main/cache/stats").get_json()["ttl"], 10)
+
+    def test_lookups_do_not_store_generations(self):
+        self.use_redis()
+        self.client.get(f"/profile/load_org?user_id={self.user_id}")
+        for i in range(50):
+            response = self.client.get(f"/profile/load_org?user_id=x{i}")
+            self.assertEqual(response.status_code, 404)
+            self.assertNotIn("X-Cache", response.headers)
+            self.client.get(f"/profile/load_org?user_id={1000 + i}")
+
+        # Only the one cached profile; no generation was written
+        self.assertEqual(len(self.server.data), 1)
+
+    def test_redis_backend_shares_invalidations_between_workers(self):
+        self.use_redis()
+        worker_a = ResponseCache(RedisCacheBackend.from_url(self.server.url))
+        worker_b = ResponseCache(RedisCacheBackend.from_url(self.server.url))
+
+        self.assertEqual(worker_a.generation("org_directory"), DEFAULT_GENERATION)
+        worker_b.invalidate("org_directory")
+        generation = worker_a.generation("org_directory")
+        self.assertNotEqual(generation, DEFAULT_GENERATION)
+        self.assertEqual(worker_b.generation("org_directory"), generation)
+
+    def test_routes_use_the_redis_backend(self):
+        self.use_redis()
+
+        self.assertEqual(self.client.get("/main/orgs").headers["X-Cache"], "MISS")
+        self.assertEqual(self.client.get("/main/orgs").headers["X-Cache"], "HIT")
+        stats = self.client.get("/main/cache/stats").get_json()
+        self.assertEqual(stats["backend"], "redis")
+        self.assertEqual(stats["ttl"], 300)
+
+    def test_memory_backend_keeps_generations_bounded(self):
+        clock = [0]
+        cache = ResponseCache(MemoryCacheBackend(max_size=3, clock=lambda: clock[0]), local_ttl=10)
+        for i in range(10):
+            cache.invalidate(f"org_profile:{i}")
+        self.assertEqual(len(cache.backend), 3)
+        self.assertEqual(cache.generation("org_profile:0"), DEFAULT_GENERATION)
+        self.assertNotEqual(cache.generation("org_profile:9"), DEFAULT_GENERATION)
+
+        # Tokens outlive every entry cached under the previous generation
+        clock[0] = 19
+        self.assertNotEqual(cache.generation("org_profile:9"), DEFAULT_GENERATION)
+        clock[0] = 20
+        self.assertEqual(cache.generation("org_profile:9"), DEFAULT_GENERATION)
+
+    def use_redis(self):
+        self.server = FakeRedisServer()
+        self.addCleanup(self.server.stop)
+        get_response_cache().backend = RedisCacheBackend.from_url(self.server.url)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import unittest
+from unittest.mock import patch
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import User, SkillsNeeded
+from app.utils.skill_index import get_skill_index
+
+
+class TestSkillMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        make_org("Exact", skills=[("Python", "tech", "APIs"), ("Writing", "non-tech", None)])
+        make_org("Partial", skills=[("Python", "tech", None), ("Design", "tech", None),
+                                    ("Accounting", "non-tech", None)])
+        make_org("Unrelated", skills=[("Design", "tech", None)])
+
+        volunteer = User(
+            first_name="Vol",
+            last_name="Unteer",
+            email="volunteer@example.com",
+            password="test_password",
+            is_admin=False,
+        )
+        volunteer.skills = SkillsNeeded.query.filter(
+            SkillsNeeded.skill.in_(["Python", "Writing"])
+        ).all()
+        db.session.add(volunteer)
+        db.session.commit()
+        self.volunteer_id = volunteer.id
+
+        # The fixtures bypass the profile routes, so rebuild the index
+        self.skill_index = self.app.extensions["skill_index"]
+        self.skill_index.build()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def test_matches_are_ranked_by_jaccard_score(self):
+        response = self.client.get("/main/match-skills", query_string={"user_id": self.volunteer_id})
+
+        self.assertEqual(response.status_code, 200)
+        matches = response.get_json()["matches"]
+        self.assertEqual([m["org_name"] for m in matches], ["Exact", "Partial"])
+        self.assertEqual(matches[0]["matched_skills"], 2)
+        self.assertEqual(matches[0]["match_score"], 1.0)
+        # 1 shared skill out of {Python, Writing, Design, Accounting}
+        self.assertEqual(matches[1]["match_score"], 0.25)
+        self.assertEqual(
+            matches[0]["skills_needed"][0],
+            {"org_id": 1, "skill_id": 1, "description": "APIs",
+             "skill_name": "Python", "status": "tech"},
+        )
+
+    def test_top_k_limit(self):
+        response = self.client.get(
+            "/main/match-skills", query_string={"user_id": self.volunteer_id, "limit": 1}
+        )
+
+        self.assertEqual([m["org_name"] for m in response.get_json()["matches"]], ["Exact"])
+
+    def test_limit_skips_orgs_missing_from_the_database(self):
+        python, writing = (
+            SkillsNeeded.query.filter_by(skill=name).one().id for name in ("Python", "Writing")
+        )
+        # An org deleted since the index was built, ranked first
+        self.skill_index.set_org_skills(0, [python, writing])
+
+        response = self.client.get(
+            "/main/match-skills", query_string={"user_id": self.volunteer_id, "limit": 2}
+        )
+
+        self.assertEqual([m["org_name"] for m in response.get_json()["matches"]], ["Exact", "Partial"])
+
+    def test_bitsets_are_sized_by_skill_count(self):
+        self.skill_index.set_org_skills(1, [10 ** 9, 1])
+
+        self.assertLess(self.skill_index._org_skills[1].bit_length(), 10)
+        # Exact now shares 1 of 3 skills, Partial 1 of 4
+        self.assertEqual([m.org_id for m in self.skill_index.match(self.volunteer_id)], [1, 2])
+        self.assertEqual(
+            self.skill_index.check_consistency()["orgs"]["unexpected"], [(1, 10 ** 9)]
+        )
+
+    def test_query_count_is_constant(self):
+        for i in range(10):
+            make_org(f"Extra {i}", skills=[("Python", "tech", None)])
+        self.skill_index.build()
+        db.session.remove()
+
+        with count_queries() as counter:
+            response = self.client.get("/main/match-skills", query_string={"user_id": self.volunteer_id})
+
+        self.assertEqual(len(response.get_json()["matches"]), 12)
+        # Volunteer check, ranking query, focus areas and skill connections
+        self.assertLessEqual(counter.count, 4)
+
+    def test_sql_fallback_matches_index(self):
+        from_index = self.client.get(
+            "/main/match-skills", query_string={"user_id": self.volunteer_id}
+        ).get_json()["matches"]
+
+        del self.app.extensions["skill_index"]
+        from_sql = self.client.get(
+            "/main/match-skills", query_string={"user_id": self.volunteer_id}
+        ).get_json()["matches"]
+
+        self.assertEqual(from_index, from_sql)
+
+    def test_index_is_updated_by_profile_routes(self):
+        response = self.client.post("/profile/volunteer/edit", json={
+            "userId": self.volunteer_id,
+            "techSkills": ["Design"],
+            "nonTechSkills": ["Writing"],
+        })
+        self.assertEqual(response.status_code, 200)
+
+        org = make_org("Late Org", skills=[])
+        response = self.client.post("/profile/edit_skills", json={
+            "user_id": org.user_id,
+            "0": {"skill": "Design", "status": "tech", "action": "add", "description": ""},
+        })
+        self.assertEqual(response.status_code, 200)
+
+        consistency = self.skill_index.check_consistency()
+        self.assertEqual(consistency["orgs"], {"missing": [], "unexpected": [], "inverted_mismatch": []})
+        self.assertEqual(consistency["users"], {"missing": [], "unexpected": []})
+
+        matches = self.client.get(
+            "/main/match-skills", query_string={"user_id": self.volunteer_id}
+        ).get_json()["matches"]
+        self.assertIn("Late Org", [m["org_name"] for m in matches])
+
+    def test_refresh_during_a_build_is_not_lost(self):
+        execute = db.session.execute
+        calls = []
+
+        def execute_then_refresh(*args, **kwargs):
+            result = execute(*args, **kwargs)
+            if not calls:
+                # A profile edit lands after the build read the link tables
+                calls.append(True)
+                self.skill_index.set_user_skills(self.volunteer_id, [])
+            return result
+
+        with patch.object(db.session, "execute", execute_then_refresh):
+            self.skill_index.build()
+
+        self.assertEqual(self.skill_index.match(self.volunteer_id), [])
+
+    def test_stale_index_is_rebuilt_by_one_thread(self):
+        built_at = self.skill_index.built_at
+        self.skill_index.built_at -= self.app.config["SKILL_INDEX_MAX_AGE"] + 1
+
+        # Another thread is rebuilding: keep serving the current snapshot
+        with self.skill_index._build_lock:
+            self.assertIs(get_skill_index(), self.skill_index)
+            self.assertLess(self.skill_index.built_at, built_at)
+
+        get_skill_index()
+        self.assertFalse(self.skill_index.is_stale)
+
+    def test_unknown_volunteer(self):
+        response = self.client.get("/main/match-skills", query_string={"user_id": 999})
+
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+
+from app.__tests__.helpers import make_test_app, make_org, count_queries
+from app import db
+from app.models import SkillsNeeded, User, org_skills_connection, user_skills
+from app.utils.skill_resolver import resolve_skill_ids
+
+
+class TestSkillResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def make_volunteer(self):
+        volunteer = User(
+            first_name="Test",
+            last_name="Volunteer",
+            email="volunteer@example.com",
+            password="test_password",
+            is_admin=False,
+        )
+        db.session.add(volunteer)
+        db.session.commit()
+        return volunteer
+
+    def test_resolves_existing_and_creates_missing(self):
+        existing = SkillsNeeded(skill="Python", status="tech")
+        db.session.add(existing)
+        db.session.commit()
+
+        with count_queries() as queries:
+            skill_ids = resolve_skill_ids(
+                [("Python", "tech"), ("Writing", "non-tech"), ("Python", "non-tech"), ("Python", "tech")]
+            )
+        db.session.commit()
+
+        # SELECT, INSERT and the skills table version bump
+        self.assertEqual(queries.count, 3)
+        self.assertEqual(skill_ids[("Python", "tech")], existing.id)
+        self.assertEqual(len(set(skill_ids.values())), 3)
+        self.assertEqual(SkillsNeeded.query.count(), 3)
+
+    def test_all_existing_skills_take_one_query(self):
+        db.session.add_all([SkillsNeeded(skill="Python", status="tech"), SkillsNeeded(skill="Writing", status="non-tech")])
+        db.session.commit()
+
+        with count_queries() as queries:
+            skill_ids = resolve_skill_ids([("Python", "tech"), ("Writing", "non-tech")])
+
+        self.assertEqual(queries.count, 1)
+        self.assertEqual(len(skill_ids), 2)
+
+    def test_onboarding_statement_count_does_not_grow_with_needs(self):
+        def onboard(name, count):
+            org = make_org(name)
+            payload = {
+                "user_id": org.user_id,
+                "programInitiatives": [],
+                "ongoingProjects": [],
+                "previousProjects": [],
+                "supportNeeds": {
+                    "techSkills": [{"value": f"{name} tech {i}", "description": "d"} for i in range(count)],
+                    "nonTechSkills": [{"value": f"{name} other {i}", "description": "d"} for i in range(count)],
+                },
+            }
+            with count_queries() as queries:
+                response = self.client.post("/profile/org/projects_initiatives", json=payload)
+            self.assertEqual(response.status_code, 201)
+            return org, queries.count
+
+        _, few = onboard("Few Needs", 1)
+        org, many = onboard("Many Needs", 20)
+
+        self.assertEqual(few, many)
+        links = db.session.execute(
+            db.select(org_skills_connection).where(org_skills_connection.c.org_id == org.id)
+        ).all()
+        self.assertEqual(len(links), 40)
+
+    def test_volunteer_create_and_edit_share_skill_rows(self):
+        make_org("Skills Org", skills=[("Python", "tech", "d")])
+        volunteer = self.make_volunteer()
+
+        response = self.client.post(
+            "/profile/volunteer",
+            json={"userId": volunteer.id, "techSkills": ["Python", "SQL"], "nonTechSkills": ["Writing"]},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post(
+            "/profile/volunteer/edit",
+            json={"userId": volunteer.id, "techSkills": ["Python", "Go"], "nonTechSkills": ["Writing"]},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["changes"]["removed"]["tech"], ["SQL"])
+
+        skills = db.session.execute(
+            db.select(SkillsNeeded.skill)
+            .join(user_skills, user_skills.c.skill_id == SkillsNeeded.id)
+            .where(user_skills.c.user_id == volunteer.id)
+            .order_by(SkillsNeeded.skill)
+        ).scalars().all()
+        self.assertEqual(skills, ["Go", "Python", "Writing"])
+        self.assertEqual(SkillsNeeded.query.filter_by(skill="Python").count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from app.__tests__.helpers import make_test_app, count_queries
+from app import db
+from app.models import TranslationCache
+from app.utils.translation_cache import (
+    TranslationMemoryCache,
+    MISS,
+    get_translation_cache,
+    translation_cache_key,
+)
+
+
+class FakeTranslateClient:
+    """Stands in for the Google Translate client, recording each call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, values, target_language, source_language):
+        self.calls.append(list(values) if isinstance(values, list) else values)
+        if isinstance(values, list):
+            return [{"translatedText": f"[{target_language}] {value}"} for value in values]
+        return {"translatedText": f"[{target_language}] {values}"}
+
+
+class TestBatchTranslation(unittest.TestCase):
+
+    def setUp(self):
+        self.app = make_test_app()
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.translate_client = FakeTranslateClient()
+        patcher = mock.patch("app.main.routes.translate_client", self.translate_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+
+    def test_batch_translates_misses_in_one_call_and_caches_them(self):
+        db.session.add(TranslationCache(
+            key=translation_cache_key("Hello", "en", "sw"), source_text="Hello", translated_text="Habari",
+            source_language="en", target_language="sw",
+        ))
+        db.session.commit()
+
+        with count_queries() as counter:
+            response = self.client.post("/main/translate/batch", json={
+                "texts": ["Hello", "Health", "Education", "Health"],
+                "targetLanguage": "sw",
+            })
+
+        self.assertEqual(response.status_code, 200)
+        translations = response.get_json()["translations"]
+        self.assertEqual(
+            [t["translatedText"] for t in translations],
+            ["Habari", "[sw] Health", "[sw] Education", "[sw] Health"],
+        )
+        self.assertTrue(translations[0]["fromCache"])
+        self.assertEqual(self.translate_client.calls, [["Health", "Education"]])
+        # One cache lookup and one bulk insert
+        self.assertLessEqual(counter.count, 2)
+        self.assertEqual(TranslationCache.query.count(), 3)
+
+    def test_batch_uses_cache_on_repeat(self):
+        payload = {"texts": ["Health"], "targetLanguage": "sw"}
+        self.client.post("/main/translate/batch", json=payload)
+        response = self.client.post("/main/translate/batch", json=payload)
+
+        self.assertTrue(response.get_json()["translations"][0]["fromCache"])
+        self.assertEqual(len(self.translate_client.calls), 1)
+
+    def test_repeat_lookups_are_served_from_memory(self):
+        payload = {"texts": ["Health"], "targetLanguage": "sw"}
+        self.client.post("/main/translate/batch", json=payload)
+
+        with count_queries() as counter:
+            response = self.client.post("/main/translate/batch", json=payload)
+
+        self.assertTrue(response.get_json()["translations"][0]["fromCache"])
+        self.assertEqual(counter.count, 0)
+        stats = self.client.get("/main/translate/stats").get_json()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_expired_rows_are_retranslated(self):
+        db.session.add(TranslationCache(
+            key=translation_cache_key("Health", "en", "sw"), source_text="Health", translated_text="Old",
+            source_language="en", target_language="sw",
+            expires_at=datetime.utcnow() - timedelta(days=1),
+        ))
+        db.session.commit()
+
+        response = self.client.post("/main/translate/batch", json={
+            "texts": ["Health"], "targetLanguage": "sw",
+        })
+
+        self.assertEqual(response.get_json()["translations"][0]["translatedText"], "[sw] Health")
+        db.session.expire_all()
+        row = db.session.get(TranslationCache, translation_cache_key("Health", "en", "sw"))
+        self.assertEqual(row.translated_text, "[sw] Health")
+        self.assertGreater(row.expires_at, datetime.utcnow())
+        self.assertEqual(self.client.get("/main/translate/stats").get_json()["expired"], 1)
+
+    def test_failures_are_cached_negatively_and_not_persisted(self):
+        failing = mock.Mock()
+        failing.translate.side_effect = RuntimeError("quota exceeded")
+
+        with mock.patch("app.main.routes.translate_client", failing):
+            for _ in range(2):
+                response = self.client.post("/main/translate", json={
+                    "text": "Health", "targetLanguage": "sw",
+                })
+                self.assertEqual(
+                    response.get_json()["translatedText"],
+                    {"translatedText": "Health", "fromCache": False},
+                )
+
+        self.assertEqual(failing.translate.call_count, 1)
+        self.assertEqual(TranslationCache.query.count(), 0)
+        self.assertEqual(self.client.get("/main/translate/stats").get_json()["negative_hits"], 1)
+
+    def test_concurrently_cached_row_does_not_drop_the_batch(self):
+        cache = get_translation_cache()
+
+        def translator(texts, target_language, source_language):
+            # Another worker caches "Hello" while this batch is translated
+            db.session.execute(TranslationCache.__table__.insert(), [{
+                "key": translation_cache_key("Hello", "en", "sw"), "source_text": "Hello",
+                "translated_text": "Habari", "source_language": "en", "target_language": "sw",
+            }])
+            db.session.commit()
+            return [f"[sw] {text}" for text in texts]
+
+        cache.translate_many(["Hello", "Goodbye", "Thanks"], "sw", translator)
+
+        stored = dict(db.session.query(TranslationCache.source_text, TranslationCache.translated_text))
+        self.assertEqual(stored, {"Hello": "[sw] Hello", "Goodbye": "[sw] Goodbye", "Thanks": "[sw] Thanks"})
+        self.assertEqual(cache.snapshot()["store_errors"], 0)
+
+    def test_keys_are_fixed_width_digests_of_normalized_text(self):
+        long_text = "Our mission " * 200
+
+        response = self.client.post("/main/translate/batch", json={
+            "texts": [long_text, "  " + long_text.strip() + " "],
+            "targetLanguage": "sw",
+        })
+
+        self.assertEqual(response.status_code, 200)
+        # Both spellings normalize to the same text, so one row is stored
+        row = TranslationCache.query.one()
+        self.assertEqual(len(row.key), 64)
+        self.assertEqual(row.source_text, long_text.strip())
+        self.assertEqual(len(self.translate_client.calls), 1)
+        self.assertNotEqual(
+            translation_cache_key("Health", "en", "sw"),
+            translation_cache_key("Health", "sw", "en"),
+        )
+
+    def test_batch_validation(self):
+        for payload in (
+            {"texts": "Hello", "targetLanguage": "sw"},
+            {"texts": ["Hello"], "targetLanguage": "fr"},
+            {"targetLanguage": "sw"},
+        ):
+            response = self.client.post("/main/translate/batch", json=payload)
+            self.assertEqual(response.status_code, 400, payload)
+
+
+class TestTranslationMemoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.cache = TranslationMemoryCache(max_size=2, ttl=10, negative_ttl=1, clock=lambda: self.now)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("a", "A")
+        self.cache.set("b", "B")
+        self.cache.get("a")
+        self.cache.set("c", "C")
+
+        self.assertEqual(self.cache.get("b"), (MISS, False))
+        self.assertEqual(self.cache.get("a"), ("A", False))
+        self.assertEqual(self.cache.stats["evictions"], 1)
+
+    def test_entries_expire(self):
+        self.cache.set("a", "A")
+        self.cache.set_negative("b")
+
+        self.now = 2
+        self.assertEqual(self.cache.get("a"), ("A", False))
+        self.assertEqual(self.cache.get("b"), (MISS, False))
+
+        self.now = 11
+        self.assertEqual(self.cache.get("a"), (MISS, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,6 +87,71 @@ class AppConfig:
     GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     GCS_BUCKET_NAME = os.environ.get("GCS_BUCKET_NAME")
 
+    # Image storage: "gcs" keeps images in GCS_BUCKET_NAME, "local" keeps
+    # them under LOCAL_STORAGE_ROOT and serves them at LOCAL_STORAGE_URL.
+    # Behind nginx, LOCAL_STORAGE_ACCEL_PREFIX names the internal location
+    # aliasing the same directory, so nginx sends the files itself
+    IMAGE_STORAGE = os.getenv("IMAGE_STORAGE", "gcs")
+    LOCAL_STORAGE_ROOT = os.getenv("LOCAL_STORAGE_ROOT", "media")
+    LOCAL_STORAGE_URL = os.getenv("LOCAL_STORAGE_URL", "/media")
+    LOCAL_STORAGE_ACCEL_PREFIX = os.getenv("LOCAL_STORAGE_ACCEL_PREFIX")
+
+    # Seconds before a worker's in-memory skill index is rebuilt from the
+    # database, so writes handled by other workers are eventually picked up
+    SKILL_INDEX_MAX_AGE = int(os.getenv("SKILL_INDEX_MAX_AGE", 300))
+
+    # Translation cache: days a stored translation stays valid, plus the
+    # size and TTLs (seconds) of each worker's in-memory tier
+    TRANSLATION_CACHE_TTL_DAYS = int(os.getenv("TRANSLATION_CACHE_TTL_DAYS", 30))
+    TRANSLATION_MEMORY_CACHE_SIZE = int(os.getenv("TRANSLATION_MEMORY_CACHE_SIZE", 1000))
+    TRANSLATION_MEMORY_CACHE_TTL = int(os.getenv("TRANSLATION_MEMORY_CACHE_TTL", 3600))
+    TRANSLATION_NEGATIVE_CACHE_TTL = int(os.getenv("TRANSLATION_NEGATIVE_CACHE_TTL", 60))
+
+    # Facet counts: filter sets cached per worker, and seconds before a
+    # worker's cached counts expire (writes clear the local cache at once)
+    FACET_CACHE_SIZE = int(os.getenv("FACET_CACHE_SIZE", 500))
+    FACET_CACHE_TTL = int(os.getenv("FACET_CACHE_TTL", 60))
+
+    # HTTP caching: seconds browsers may reuse the directory and skills
+    # list before revalidating them with their ETag
+    ORG_DIRECTORY_MAX_AGE = int(os.getenv("ORG_DIRECTORY_MAX_AGE", 30))
+    SKILLS_LIST_MAX_AGE = int(os.getenv("SKILLS_LIST_MAX_AGE", 300))
+
+    # Response cache for the directory and org profiles: a Redis URL shares
+    # it (and its invalidations) between workers, and entries expire after
+    # RESPONSE_CACHE_TTL seconds. Without one each worker keeps
+    # RESPONSE_CACHE_SIZE directory responses in memory for only
+    # RESPONSE_CACHE_LOCAL_TTL seconds, since edits handled by another worker
+    # do not invalidate them, and org profiles are not cached
+    RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL")
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", 1000))
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+    RESPONSE_CACHE_LOCAL_TTL = int(os.getenv("RESPONSE_CACHE_LOCAL_TTL", 10))
+
+    # Background image uploads: pool size, and seconds a finished job's
+    # result stays available to the status endpoint. Jobs run in the worker
+    # that accepted the upload; their state is in the image_upload_jobs
+    # table, so any worker or instance can answer the status polls
+    IMAGE_PROCESSING_WORKERS = int(os.getenv("IMAGE_PROCESSING_WORKERS", 2))
+    IMAGE_JOB_RETENTION = int(os.getenv("IMAGE_JOB_RETENTION", 3600))
+
+    # Upload limits: largest request body in bytes (larger ones get a 413
+    # before they are read), largest image in pixels, and bytes decoding one
+    # image may take. JPEGs are decoded at a reduced scale, so the pixel
+    # limit applies to them; PNGs are decoded at full size and the decode
+    # budget wins (64 MB: 13.4 megapixels RGB/RGBA, 53.7 greyscale/palette).
+    # Uploads are spooled to IMAGE_SPOOL_DIR (system temp by default) until
+    # the image job has processed them
+    MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", 16 * 1024 * 1024))
+    IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", 40_000_000))
+    IMAGE_DECODE_BUDGET = int(os.getenv("IMAGE_DECODE_BUDGET", 64 * 1024 * 1024))
+    IMAGE_SPOOL_DIR = os.getenv("IMAGE_SPOOL_DIR")
+
+    # Hours an unreferenced image is kept after it was last written or
+    # reused, so uploads that have not committed yet never lose their files.
+    # Applies to replaced images and to collect_orphaned_images.py
+    IMAGE_ORPHAN_GRACE_HOURS = int(os.getenv("IMAGE_ORPHAN_GRACE_HOURS", 24))
+
     # Anthropic API key
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 
@@ -1,20 +1,27 @@
-from flask import Blueprint, json, jsonify, request
+from flask import Blueprint, current_app, json, jsonify, request
 from google.cloud import translate_v2 as translate
 import os
 from app import db
-from functools import lru_cache
 from datetime import datetime
 from google.oauth2 import service_account
 import logging
 from sqlalchemy.sql import text
-from app.models import (
-    User,
-    SkillsNeeded,
-    org_skills_connection,
-    OrgProfile,
-    TranslationCache,
-    serialize_org_skill_connection
+from app.models import User
+from app.utils.org_directory import (
+    load_org_cards,
+    load_org_cards_by_ids,
+    load_org_directory,
+    parse_fields,
+    parse_limit,
+    decode_cursor,
 )
+from app.utils.http_cache import conditional_response, org_directory_version
+from app.utils.object_storage import get_object_storage
+from app.utils.org_facets import get_facet_cache
+from app.utils.org_search import search_orgs
+from app.utils.response_cache import ORG_DIRECTORY_SCOPE, cached_response, get_response_cache
+from app.utils.skill_matcher import match_orgs_for_volunteer
+from app.utils.translation_cache import get_translation_cache
 
 main = Blueprint("main", __name__)
 
@@ -38,79 +45,151 @@ def health_check():
 
 # Get all organisations
 @main.route("/main/orgs", methods=["GET"])
+@cached_response(ORG_DIRECTORY_SCOPE)
 def get_all_orgs():
+    """
+    List organisation cards
+    Query params:
+    - fields: (optional) Comma separated card fields to return
+    - limit: (optional) Page size, enables keyset pagination
+    - cursor: (optional) next_cursor token from the previous page
+
+    Without limit or cursor the legacy response (a plain list of every
+    organisation) is returned so existing callers keep working. With either
+    one the response is {"orgs": [...], "next_cursor": token or null}.
+
+    Responses carry an ETag and Last-Modified from one aggregate query, so
+    a client revalidating an unchanged directory gets a 304 without the
+    cards being loaded.
+    """
+    try:
+        fields = parse_fields(request.args.get("fields"))
+
+        paginate = "limit" in request.args or "cursor" in request.args
+        limit = parse_limit(request.args.get("limit")) if paginate else None
+        cursor = request.args.get("cursor")
+        after_id = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    def build():
+        if not paginate:
+            # Focus areas and skills are batch-loaded, so this is a fixed
+            # number of queries however many organisations there are
+            return jsonify(load_org_directory(fields)), 200
+
+        orgs_data, next_cursor = load_org_cards(fields, after_id=after_id, limit=limit)
+        return jsonify({"orgs": orgs_data, "next_cursor": next_cursor}), 200
+
+    etag, last_modified = org_directory_version()
+    return conditional_response(
+        etag, last_modified, build,
+        max_age=current_app.config.get("ORG_DIRECTORY_MAX_AGE", 30),
+    )
+
+
+@main.route("/main/orgs/search", methods=["GET"])
+def search_all_orgs():
+    """
+    Full-text search over organisations
+    Query params:
+    - q: (optional) Search words, matched against org name, overview,
+      mission statement, focus area names and skill names
+    - focus_area, skill, county: (optional) Exact filters
+    - fields: (optional) Comma separated card fields to return
+    - limit, offset: (optional) Paging
 
-    orgs = OrgProfile.query.all()
+    Returns:
+        {"orgs": [card + "score"], "next_offset": int or null}. Results are
+        ranked by relevance; without q they are ordered by name and have a
+        null score.
+    """
+    query = request.args.get("q", "").strip()
+    focus_area = request.args.get("focus_area") or None
+    skill = request.args.get("skill") or None
+    county = request.args.get("county") or None
+
+    if not (query or focus_area or skill or county):
+        return jsonify({"message": "A search query or filter is required"}), 400
+
+    try:
+        fields = parse_fields(request.args.get("fields"))
+        limit = parse_limit(request.args.get("limit"))
+        offset = request.args.get("offset", 0, type=int)
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    # One extra result tells us whether another page exists
+    ranked = search_orgs(
+        query, focus_area=focus_area, skill=skill, county=county,
+        limit=limit + 1, offset=offset,
+    )
+    next_offset = offset + limit if len(ranked) > limit else None
+    ranked = ranked[:limit]
+
+    scores = dict(ranked)
+    cards = load_org_cards_by_ids([org_id for org_id, _ in ranked], fields)
+    for card in cards:
+        card["score"] = scores[card["id"]]
 
-    # Get the name and org overview of each organisation
-    orgs_data = []
-    for org in orgs:
-        org_data = {
-            "id": org.id,
-            "user_id": org.user_id,
-            "org_name": org.org_name,
-            "org_overview": org.org_overview,
-            "focus_areas": [focus_area.serialize() for focus_area in org.focus_areas],
-            "skills_needed": [skill.serialize() for skill in org.skills_needed],
-            "org_logo_filename": org.logo_url,
-            "org_mission_statement": org.org_mission_statement,
-            "org_year_established": org.org_year_established,
-            "org_district_town": org.org_district_town,
-            "org_county": org.org_county,
-        }
+    return jsonify({"orgs": cards, "next_offset": next_offset}), 200
 
-        orgs_data.append(org_data)
 
-    return jsonify(orgs_data), 200
+@main.route("/main/orgs/facets", methods=["GET"])
+def get_org_facets():
+    """
+    Count organisations per focus area and per skill for a filter set
+    Query params:
+    - q, focus_area, skill, county: (optional) The current search and filters,
+      as accepted by /main/orgs/search
+
+    Returns:
+        {"focus_areas": [{"name", "count"}], "skills": {"tech": [...],
+        "non-tech": [...]}}. A facet's own filter is not applied to its
+        counts, so every option shows how many orgs selecting it would give.
+    """
+    facets = get_facet_cache().get_or_load(
+        query=request.args.get("q", "").strip() or None,
+        focus_area=request.args.get("focus_area") or None,
+        skill=request.args.get("skill") or None,
+        county=request.args.get("county") or None,
+    )
+    return jsonify(facets), 200
 
 
 @main.route("/main/match-skills", methods=["GET"])
 def match_volunteer_skills():
-    
+    """
+    Rank organisations by how well their needed skills overlap the
+    volunteer's skills
+    Query params:
+    - user_id: The volunteer's user ID
+    - limit: (optional) Only return the top `limit` matches
+    """
     user_id = request.args.get("user_id")
     
     if not user_id:
         return jsonify({"message": "User ID is required"}), 400
+
+    limit = request.args.get("limit")
+    if limit is not None:
+        try:
+            limit = parse_limit(limit)
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
     
     try:
-        volunteer = User.query.get(user_id)
-        if not volunteer:
+        # Only check the volunteer exists; loading the User would also
+        # eager-load their skills, which the match query reads itself
+        volunteer_id = db.session.query(User.id).filter_by(id=user_id).scalar()
+        if not volunteer_id:
             return jsonify({"message": "Volunteer not found"}), 404
-        
-        # Get the volunteer's skills
-        volunteer_skills = set(skill.id for skill in volunteer.skills)
-        
-        # Query for organizations that need any of the volunteer's skills
-        matching_orgs = (
-            OrgProfile.query.join(org_skills_connection)
-            .join(SkillsNeeded)
-            .filter(SkillsNeeded.id.in_(volunteer_skills))
-            .distinct()
-            .all()
-        )
 
-        # Prepare the response data
-        org_matches = []
-        for org in matching_orgs:
-            # Get the skills connections for this organization
-            org_skills = (
-                db.session.query(org_skills_connection)
-                .join(SkillsNeeded)
-                .filter(org_skills_connection.c.org_id == org.id)
-                .all()
-            )
-            org_matches.append(
-                {
-                    "org_id": org.id,
-                    "org_name": org.org_name,
-                    "user_id": org.user_id,
-                    "focus_areas": [focus_area.serialize() for focus_area in org.focus_areas],
-                    "skills_needed": [
-                        serialize_org_skill_connection(skill_connection)
-                        for skill_connection in org_skills
-                    ],
-                }
-            )
+        # Matching is answered from the in-memory skill index, falling
+        # back to a single aggregate query when the index is unavailable
+        org_matches = match_orgs_for_volunteer(volunteer_id, limit=limit)
         
         return (
             jsonify(
@@ -176,60 +255,129 @@ SUPPORTED_LANGUAGES = {
     'sw': 'Kiswahili'
 }
 
-# Cache translations to reduce API calls
-@lru_cache(maxsize=1000)
-def get_cached_translation(text, target_language):
-    """Cache translation results to minimize API calls for repeated phrases."""
-    # Generate a unique cache key
-    cache_key = f"{text}_{target_language}"
-    
-    try:
-        # Check if translation exists in cache
-        cached_entry = (
-            db.session.query(TranslationCache)
-            .filter_by(key=cache_key)
-            .first()
-        )
-        
-        # Check if cache is still valid (less than 30 days old)
-        if cached_entry:
-            return {
-                'translatedText': cached_entry.translated_text,
-                'fromCache': True
-            }
-        
-        # If no valid cache, perform translation
-        result = translate_client.translate(
-            text,
+# Maximum number of strings sent to Google Translate in one call
+TRANSLATE_BATCH_CHUNK_SIZE = 100
+
+# Maximum number of strings accepted by /main/translate/batch
+MAX_BATCH_TRANSLATIONS = 500
+
+
+def google_translate(texts, target_language, source_language):
+    """
+    Translate strings with the Google client in chunked batch calls
+    Args:
+        texts (list): Strings to translate
+        target_language (str): Target language code
+        source_language (str): Source language code
+    Returns:
+        list: Translated strings, in the order of `texts`
+    Raises:
+        Exception: If the client is unavailable or a call fails
+    """
+    if translate_client is None:
+        raise RuntimeError("Google Translate client is not initialized")
+
+    translated = []
+    for start in range(0, len(texts), TRANSLATE_BATCH_CHUNK_SIZE):
+        chunk = texts[start:start + TRANSLATE_BATCH_CHUNK_SIZE]
+        results = translate_client.translate(
+            chunk,
             target_language=target_language,
-            source_language='en' if target_language == 'sw' else 'sw'
+            source_language=source_language
         )
-        
-        # Create new cache entry
-        new_cache_entry = TranslationCache(
-            key=cache_key,
-            translated_text=result['translatedText'],
-            source_language='en',
-            target_language=target_language
-        )
-        
-        # Add and commit to database
-        db.session.add(new_cache_entry)
-        db.session.commit()
-        
-        return {
-            'translatedText': result['translatedText'],
-            'fromCache': False
-        }
-    
+        translated.extend(result['translatedText'] for result in results)
+    return translated
+
+
+def translate_batch(texts, target_language):
+    """
+    Translate many strings through the tiered translation cache
+    Returns:
+        dict: text -> {'translatedText': ..., 'fromCache': bool}
+    """
+    return get_translation_cache().translate_many(texts, target_language, google_translate)
+
+
+def get_cached_translation(text, target_language):
+    """Translate one string through the tiered translation cache"""
+    return translate_batch([text], target_language)[text]
+
+
+@main.route("/main/translate/batch", methods=["POST"])
+def translate_text_batch():
+    """
+    Translate many strings in one request
+    Expected JSON body:
+    - texts: Array of strings to translate
+    - targetLanguage: 'en' or 'sw'
+
+    Returns:
+        {'translations': [{'text', 'translatedText', 'fromCache'}, ...],
+         'sourceLanguage', 'targetLanguage'} in the order of `texts`
+    """
+    try:
+        data = request.get_json()
+
+        if not data or 'texts' not in data or 'targetLanguage' not in data:
+            return jsonify({
+                'error': 'Missing required fields: texts and targetLanguage'
+            }), 400
+
+        texts = data['texts']
+        target_language = data['targetLanguage']
+
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return jsonify({'error': 'texts must be an array of strings'}), 400
+
+        if len(texts) > MAX_BATCH_TRANSLATIONS:
+            return jsonify({
+                'error': f'Too many texts. At most {MAX_BATCH_TRANSLATIONS} can be translated per request'
+            }), 400
+
+        # Validate target language
+        if target_language not in SUPPORTED_LANGUAGES:
+            return jsonify({
+                'error': 'Unsupported language. Only English (en) and Kiswahili (sw) are supported'
+            }), 400
+
+        # Skip translation if target language is English and text is in English
+        if target_language == 'en':
+            results = {text: {'translatedText': text, 'fromCache': False} for text in texts}
+        else:
+            results = translate_batch(texts, target_language)
+
+        return jsonify({
+            'translations': [{'text': text, **results[text]} for text in texts],
+            'sourceLanguage': 'en',
+            'targetLanguage': target_language
+        })
+
     except Exception as e:
-        # Fallback mechanism
         db.session.rollback()
-        print(f"Translation error: {str(e)}")
-        return {
-            'translatedText': text,
-            'fromCache': False
-        }
+        return jsonify({
+            'error': f'Server error: {str(e)}'
+        }), 500
+
+
+@main.route("/main/translate/stats", methods=["GET"])
+def translation_cache_stats():
+    """Hit/miss/expiry counters of this worker's translation cache"""
+    return jsonify(get_translation_cache().snapshot()), 200
+
+
+@main.route("/main/cache/stats", methods=["GET"])
+def response_cache_stats():
+    """Per-endpoint hit/miss counters of the response cache"""
+    return jsonify(get_response_cache().snapshot()), 200
+
+
+@main.route("/media/<path:name>", methods=["GET"])
+def media(name):
+    """Serve a stored image (X-Accel-Redirect or redirect, depending on the backend)"""
+    try:
+        return get_object_storage().serve(name)
+    except ValueError:
+        return jsonify({"error": "Not found"}), 404
 
 
 @main.route("/main/translate", methods=["POST"])
@@ -1,11 +1,54 @@
 from app import db
-from datetime import datetime, timezone
+from datetime import datetime
 from flask import current_app
 
+
+def public_image_url(filename):
+    """Build the public URL of a stored image object name"""
+    if not filename:
+        return None
+
+    return current_app.extensions["object_storage"].public_url(filename)
+
+
+def image_variant_filename(base, width, extension):
+    """Object name of one rendered variant of an uploaded image"""
+    return f"{base}_{width}w.{extension}"
+
+
+def image_srcsets(entry):
+    """
+    Build srcset values from an image's manifest entry
+    Args:
+        entry (dict or None): {"base", "widths"} from OrgProfile.org_image_variants
+    Returns:
+        dict or None: {"src": largest JPEG url, "webp": srcset, "jpeg": srcset,
+        "widths": [...]}
+    """
+    if not entry:
+        return None
+
+    base, widths = entry["base"], entry["widths"]
+
+    def srcset(extension):
+        return ", ".join(
+            f"{public_image_url(image_variant_filename(base, width, extension))} {width}w"
+            for width in widths
+        )
+
+    return {
+        "src": public_image_url(image_variant_filename(base, widths[-1], "jpg")),
+        "webp": srcset("webp"),
+        "jpeg": srcset("jpg"),
+        "widths": widths,
+    }
+
 # Association table for User (volunteer) skills
 user_skills = db.Table('user_skills',
     db.Column('user_id', db.Integer, db.ForeignKey('user.id'), primary_key=True),
-    db.Column('skill_id', db.Integer, db.ForeignKey('skills_needed.id'), primary_key=True)
+    db.Column('skill_id', db.Integer, db.ForeignKey('skills_needed.id'), primary_key=True),
+    # The primary key leads with user_id; this serves lookups by skill
+    db.Index('ix_user_skills_skill_id', 'skill_id'),
 )
 
 class User(db.Model):
@@ -15,7 +58,7 @@ class User(db.Model):
     email = db.Column(db.String(200), unique=True, nullable=False)
     password = db.Column(db.String(200), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
     last_login = db.Column(db.DateTime)
 
     # Relationship with OrgProfile
@@ -54,7 +97,9 @@ org_skills_connection = db.Table(
         "skill_id", db.Integer, db.ForeignKey("skills_needed.id"), primary_key=True
     ),
     # add a description column to the association table
-    db.Column("description", db.Text, nullable=True)
+    db.Column("description", db.Text, nullable=True),
+    # The primary key leads with org_id; this serves lookups by skill
+    db.Index("ix_org_skills_skill_id", "skill_id"),
 )
 
 
@@ -81,12 +126,14 @@ org_focus_areas = db.Table(
     db.Column(
         "focus_area_id", db.Integer, db.ForeignKey("focus_area.id"), primary_key=True
     ),
+    # The primary key leads with org_id; this serves lookups by focus area
+    db.Index("ix_org_focus_areas_focus_area_id", "focus_area_id"),
 )
 
 
 class OrgProfile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
     
     # Basic Organization Details
     org_name = db.Column(db.String(200), nullable=False)
@@ -98,6 +145,9 @@ class OrgProfile(db.Model):
     # Media
     org_logo_filename = db.Column(db.String(200), nullable=True)  # Store GCS object name
     org_cover_photo_filename = db.Column(db.String(200), nullable=True)  # Store GCS object name
+    # image type -> {"base": object name prefix, "widths": [...]} of the
+    # WebP / JPEG variants; the *_filename columns hold the largest JPEG
+    org_image_variants = db.Column(db.JSON, nullable=True)
 
     # Contact Information
     org_email = db.Column(db.String(200), nullable=False)
@@ -121,11 +171,23 @@ class OrgProfile(db.Model):
     
     # Meta Information
     org_verified = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    # Set by the database on insert / every UPDATE of the row
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(
         db.DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        server_default=db.func.now(),
+        onupdate=db.func.now(),
+    )
+
+    # Incremented on every UPDATE of the row; routes that only change the
+    # org's projects, initiatives or skills bump it with
+    # app.utils.http_cache.touch_org_profile
+    version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=db.literal_column("version + 1"),
     )
 
     # 1 to many relationship org_profile to org_initiatives
@@ -150,20 +212,21 @@ class OrgProfile(db.Model):
     @property
     def logo_url(self):
         """Generate signed URL for logo if filename exists"""
-        if not self.org_logo_filename:
-            return None
-        
-        bucket_name = current_app.config['GCS_BUCKET_NAME']
-        return f"https://storage.googleapis.com/{bucket_name}/{self.org_logo_filename}"
+        return public_image_url(self.org_logo_filename)
 
     @property
     def cover_photo_url(self):
         """Generate signed URL for cover photo if filename exists"""
-        if not self.org_cover_photo_filename:
-            return None
-            
-        bucket_name = current_app.config['GCS_BUCKET_NAME']
-        return f"https://storage.googleapis.com/{bucket_name}/{self.org_cover_photo_filename}"
+        return public_image_url(self.org_cover_photo_filename)
+
+    @property
+    def image_srcsets(self):
+        """srcset values of the logo and cover photo variants, by image type"""
+        variants = self.org_image_variants or {}
+        return {
+            image_type: image_srcsets(variants.get(image_type))
+            for image_type in ("logo", "cover_photo")
+        }
     
     def has_images(self):
         """Check if org has any images uploaded"""
@@ -173,26 +236,42 @@ class OrgProfile(db.Model):
         """Remove all image references"""
         self.org_logo_filename = None
         self.org_cover_photo_filename = None
+        self.org_image_variants = None
         db.session.commit()
 
+    def skills_with_descriptions(self):
+        """
+        Load this org's skills together with their association descriptions
+        in a single joined query
+        Returns:
+            list: (skill_id, skill, status, description) rows ordered by skill id
+        """
+        return db.session.execute(
+            db.select(
+                SkillsNeeded.id,
+                SkillsNeeded.skill,
+                SkillsNeeded.status,
+                org_skills_connection.c.description,
+            )
+            .join(org_skills_connection, org_skills_connection.c.skill_id == SkillsNeeded.id)
+            .where(org_skills_connection.c.org_id == self.id)
+            .order_by(SkillsNeeded.id)
+        ).all()
+
     def __repr__(self):
         return f"{self.org_name}"
 
     def serialize(self):
 
-        skills_data = []
-        for skill_assoc in self.skills_needed:
-            # Get the description from the association table
-            description = db.session.query(org_skills_connection.c.description).filter(
-                db.and_(
-                    org_skills_connection.c.org_id == self.id,
-                    org_skills_connection.c.skill_id == skill_assoc.id
-                )
-            ).scalar()
-            
-            skill_data = skill_assoc.serialize()
-            skill_data['description'] = description
-            skills_data.append(skill_data)
+        skills_data = [
+            {
+                "id": skill_id,
+                "skill": skill,
+                "status": status,
+                "description": description,
+            }
+            for skill_id, skill, status, description in self.skills_with_descriptions()
+        ]
 
         org_data = {
             "id": self.id,
@@ -204,6 +283,7 @@ class OrgProfile(db.Model):
             "org_year_established": self.org_year_established,
             "org_logo_filename": self.logo_url,
             "org_cover_photo_filename": self.cover_photo_url,
+            "org_images": self.image_srcsets,
             "org_email": self.org_email,
             "org_phone": self.org_phone,
             "org_district_town": self.org_district_town,
@@ -221,6 +301,7 @@ class OrgProfile(db.Model):
             "org_verified": self.org_verified,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "version": self.version,
             "skills_needed": skills_data,
             "focus_areas": [area.serialize() for area in self.focus_areas],
         }
@@ -229,7 +310,7 @@ class OrgProfile(db.Model):
 
 class OrgInitiatives(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    org_id = db.Column(db.Integer, db.ForeignKey("org_profile.id"), nullable=False)
+    org_id = db.Column(db.Integer, db.ForeignKey("org_profile.id"), nullable=False, index=True)
     initiative_name = db.Column(db.String(200), nullable=False)
     initiative_description = db.Column(db.String(200), nullable=False)
 
@@ -249,7 +330,7 @@ class OrgInitiatives(db.Model):
 
 class OrgProjects(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    org_id = db.Column(db.Integer, db.ForeignKey("org_profile.id"), nullable=False)
+    org_id = db.Column(db.Integer, db.ForeignKey("org_profile.id"), nullable=False, index=True)
     project_name = db.Column(db.String(200), nullable=False)
     project_description = db.Column(db.String(200), nullable=False)
 
@@ -273,6 +354,12 @@ class OrgProjects(db.Model):
 
 
 class SkillsNeeded(db.Model):
+    # One row per (skill, status); lets skill resolution use INSERT ... ON CONFLICT.
+    # Leading with skill, it also serves lookups by skill name alone
+    __table_args__ = (
+        db.Index("ix_skills_needed_skill_status", "skill", "status", unique=True),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     skill = db.Column(db.String(200), nullable=False)
 
@@ -302,7 +389,7 @@ class SkillsNeeded(db.Model):
 
 class FocusArea(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(200), nullable=False)
+    name = db.Column(db.String(200), nullable=False, index=True)
     description = db.Column(db.Text, nullable=True)
 
     org_profiles = db.relationship(
@@ -324,9 +411,13 @@ class FocusArea(db.Model):
 class TranslationCache(db.Model):
     __tablename__ = 'translation_cache'
     
-    # Unique identifier combining text and target language
-    key = db.Column(db.String(500), primary_key=True)
-    
+    # SHA-256 digest of the normalized text and language pair
+    # (see app.utils.translation_cache.translation_cache_key)
+    key = db.Column(db.String(64), primary_key=True)
+
+    # Normalized text that was translated
+    source_text = db.Column(db.Text, nullable=True)
+
     # Actual translated text
     translated_text = db.Column(db.Text, nullable=False)
     
@@ -338,3 +429,52 @@ class TranslationCache(db.Model):
     
     # When this translation was cached
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # When this translation stops being served from the cache
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)
+
+
+class TableVersion(db.Model):
+    __tablename__ = 'table_version'
+
+    # Name of the versioned table, e.g. "skills_needed"
+    name = db.Column(db.String(64), primary_key=True)
+
+    # Bumped in the same transaction as every write to that table
+    # (see app.utils.skill_resolver.bump_table_version)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    # When the table last changed; served as Last-Modified
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+
+class ImageUploadJob(db.Model):
+    __tablename__ = 'image_upload_jobs'
+
+    # Random hex id handed to the client as part of the status URL
+    id = db.Column(db.String(32), primary_key=True)
+
+    # The user who queued the upload; only they may read the status
+    user_id = db.Column(db.Integer, nullable=False)
+    org_id = db.Column(db.Integer, nullable=False)
+
+    # "queued", "processing", "succeeded", "partial" or "failed"
+    # (see app.utils.image_jobs)
+    status = db.Column(db.String(16), nullable=False)
+
+    # image_type -> upload result, filled in when the job finishes
+    results = db.Column(db.JSON, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def serialize(self):
+        return {
+            "job_id": self.id,
+            "user_id": self.user_id,
+            "org_id": self.org_id,
+            "status": self.status,
+            "results": self.results,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -1,13 +1,32 @@
 import logging
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request, url_for
 from flask_login import login_required, current_user
+from sqlalchemy import select
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 from datetime import datetime, timezone
 from app import db
-from app.utils.image_handler import ImageHandler
-from google.cloud import storage
+from app.utils.image_ingest import discard_spooled, spool_upload
+from app.utils.image_jobs import FINISHED_STATES, IMAGE_TYPES, get_image_jobs
+from app.utils.skill_index import refresh_org_skills, refresh_user_skills
+from app.utils.child_sync import sync_child_collection
+from app.utils.http_cache import (
+    SKILLS_TABLE,
+    conditional_response,
+    make_etag,
+    as_utc,
+    table_version,
+    touch_org_profile,
+)
+from app.utils.org_onboarding import store_onboarding_content
+from app.utils.org_facets import invalidate_org_facets
+from app.utils.org_search import refresh_org_search
+from app.utils.response_cache import cached_response, invalidate_org_responses, request_org_profile_scope
+from app.utils.object_storage import get_object_storage
+from app.utils.org_skill_sync import sync_org_skills
+from app.utils.skill_resolver import link_user_skills, resolve_skill_ids
+from werkzeug.exceptions import RequestEntityTooLarge
 import os
 
 from app.models import (
@@ -18,10 +37,15 @@ from app.models import (
     SkillsNeeded,
     FocusArea,
     org_skills_connection,
+    user_skills,
 )
 
 profile = Blueprint("profile", __name__)
 
+# Content columns written by the edit_projects / edit_initiatives routes
+PROJECT_FIELDS = ("project_name", "project_description", "project_status")
+INITIATIVE_FIELDS = ("initiative_name", "initiative_description")
+
 # Create a new organisation profile
 @profile.route("/profile/org", methods=["POST"])
 def create_org_profile():
@@ -76,6 +100,9 @@ def create_org_profile():
         new_org_profile.focus_areas.append(focus_area)
 
     db.session.commit()
+    refresh_org_search(new_org_profile.id)
+    invalidate_org_facets()
+    invalidate_org_responses(user_id)
 
     response_data["message"] = "Organisation profile created successfully"
     response_data["status"] = "success"
@@ -113,90 +140,21 @@ def store_org_projects_initiatives():
     if not org_id:
         return jsonify({"status": "failed", "message": "Organization ID is required"}), 400
 
-    org_initiatives = data.get("programInitiatives")
-    ongoing_projects = data.get("ongoingProjects")
-    previous_projects = data.get("previousProjects")
-    support_needs = data.get("supportNeeds")
-
-    for project in ongoing_projects:
-        new_project = OrgProjects(
-            org_id=org_id,
-            project_name=project["projectName"],
-            project_description=project["description"],
-            project_status="ongoing",
-        )
-
-        db.session.add(new_project)
-
-    for project in previous_projects:
-        new_project = OrgProjects(
-            org_id=org_id,
-            project_name=project["projectName"],
-            project_description=project["description"],
-            project_status="completed",
-        )
-
-        db.session.add(new_project)
-
-    for initiative in org_initiatives:
-        new_initiative = OrgInitiatives(
-            org_id=org_id,
-            initiative_name=initiative["initiativeName"],
-            initiative_description=initiative["description"],
-        )
-        db.session.add(new_initiative)
-
-    for need_data in support_needs["nonTechSkills"]:
-        # check if need is in the database
-        # if not add it
-        # if it is, get the id and add it to the skillsneeded table
-
-        need = need_data["value"]
-
-        skill_description = need_data["description"]
-        skill = SkillsNeeded.query.filter_by(skill=need).first()
-
-        if skill is None:
-            new_skill = SkillsNeeded(skill=need, status="non-tech")
-            db.session.add(new_skill)
-            db.session.commit()
-            skill = SkillsNeeded.query.filter_by(skill=need).first()
-
-        # append the skill to the org_skills_connection table
-        new_need = SkillsNeeded.query.filter_by(skill=need).first()
-
-        new_association = org_skills_connection.insert().values(
-                    org_id=org_id,
-                    skill_id=new_need.id,
-                    description=skill_description
-                )
-        db.session.execute(new_association)
-
-
-    for need_data in support_needs["techSkills"]:
-        # check if need is in the database
-        # if not add it
-        # if it is, get the id and add it to the skillsneeded table
-        need = need_data["value"]
-        skill_description = need_data["description"]
-        skill = SkillsNeeded.query.filter_by(skill=need).first()
-
-        if skill is None:
-            new_skill = SkillsNeeded(skill=need, status="tech")
-            db.session.add(new_skill)
-            db.session.commit()
-            skill = SkillsNeeded.query.filter_by(skill=need).first()
-
-        # append the skill to the org_skills_connection table
-        new_need = SkillsNeeded.query.filter_by(skill=need).first()
-        new_association = org_skills_connection.insert().values(
-                    org_id=org_id,
-                    skill_id=new_need.id,
-                    description=skill_description
-                )
-        db.session.execute(new_association)
+    # Projects, initiatives and skill links go in as one batched INSERT per
+    # table, committed together
+    try:
+        store_onboarding_content([(org_id, data)])
+        touch_org_profile(org_id)
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logging.error(f"Database error storing onboarding data for org {org_id}: {str(e)}")
+        return jsonify({"status": "failed", "message": "Failed to store organisation data"}), 500
 
-    db.session.commit()
+    refresh_org_skills(org_id)
+    refresh_org_search(org_id)
+    invalidate_org_facets()
+    invalidate_org_responses(user_id)
 
     response_data["message"] = (
         "Organisation projects and initiatives stored successfully"
@@ -208,6 +166,7 @@ def store_org_projects_initiatives():
 
 # Load an organisation's profile
 @profile.route("/profile/load_org", methods=["GET"])
+@cached_response(request_org_profile_scope, shared_only=True)
 def load_org_profile():
 
     user_id = request.args.get("user_id")
@@ -215,41 +174,62 @@ def load_org_profile():
     if not user_id:
         return jsonify({"message": "User ID is required"}), 400
 
-    org_profile = OrgProfile.query.filter_by(user_id=user_id).first()
+    # Only the version columns are read before deciding whether to serialize
+    version = db.session.execute(
+        select(OrgProfile.id, OrgProfile.version, OrgProfile.updated_at)
+        .where(OrgProfile.user_id == user_id)
+    ).first()
 
-    if org_profile is None:
+    if version is None:
         return jsonify({
             "message": "Organisation profile not found",
             "status": "failed"
         }), 404
 
-    # Get all data from the serialized org profile
-    serialized_data = org_profile.serialize()
-    
-    response_data = {
-        "orgProfile": serialized_data,  # This now includes skills with descriptions
-        "orgProjects": [project.serialize() for project in org_profile.projects],
-        "orgInitiatives": [initiative.serialize() for initiative in org_profile.initiatives],
-        "status": "success"
-    }
+    def build():
+        org_profile = db.session.get(OrgProfile, version.id)
+
+        # Get all data from the serialized org profile
+        serialized_data = org_profile.serialize()
 
-    return jsonify(response_data), 200
+        response_data = {
+            "orgProfile": serialized_data,  # This now includes skills with descriptions
+            "orgProjects": [project.serialize() for project in org_profile.projects],
+            "orgInitiatives": [initiative.serialize() for initiative in org_profile.initiatives],
+            "status": "success"
+        }
+        return jsonify(response_data), 200
+
+    # The owner edits this profile, so every use is revalidated
+    return conditional_response(
+        make_etag("org_profile", version.id, version.version),
+        as_utc(version.updated_at),
+        build,
+        private=True,
+    )
 
 
 # Load all skills
 @profile.route("/all_skills", methods=["GET"])
 def load_all_skills():
 
-    response_data = {}
+    def build():
+        response_data = {}
 
-    skills = SkillsNeeded.query.all()
+        skills = SkillsNeeded.query.all()
 
-    skills_data = [skill.serialize() for skill in skills]
+        skills_data = [skill.serialize() for skill in skills]
 
-    response_data["skills"] = skills_data
-    response_data["status"] = "success"
+        response_data["skills"] = skills_data
+        response_data["status"] = "success"
 
-    return jsonify(response_data), 200
+        return jsonify(response_data), 200
+
+    etag, last_modified = table_version(SKILLS_TABLE)
+    return conditional_response(
+        etag, last_modified, build,
+        max_age=current_app.config.get("SKILLS_LIST_MAX_AGE", 300),
+    )
 
 
 @profile.route("/profile/volunteer", methods=["POST"])
@@ -273,22 +253,15 @@ def create_volunteer_profile():
     non_tech_skills = data.get("nonTechSkills", [])
     tech_skills = data.get("techSkills", [])
 
-    for skill in non_tech_skills:
-        skill_obj = SkillsNeeded.query.filter_by(skill=skill).first()
-        if not skill_obj:
-            skill_obj = SkillsNeeded(skill=skill, status="non-tech")
-            db.session.add(skill_obj)
-        user.skills.append(skill_obj)
-
-    for skill in tech_skills:
-        skill_obj = SkillsNeeded.query.filter_by(skill=skill).first()
-        if not skill_obj:
-            skill_obj = SkillsNeeded(skill=skill, status="tech")
-            db.session.add(skill_obj)
-        user.skills.append(skill_obj)
+    skill_ids = resolve_skill_ids(
+        [(skill, "non-tech") for skill in non_tech_skills]
+        + [(skill, "tech") for skill in tech_skills]
+    )
+    link_user_skills(user.id, skill_ids.values())
 
     try:
         db.session.commit()
+        refresh_user_skills(user.id)
         return jsonify({
             "message": "Volunteer profile updated successfully",
             "user": user.serialize()
@@ -326,8 +299,15 @@ def get_volunteer_profile():
 
 @profile.route("/profile/volunteer/skills", methods=["GET"])
 def get_all_skills():
-    skills = SkillsNeeded.query.all()
-    return jsonify([skill.serialize() for skill in skills]), 200
+    def build():
+        skills = SkillsNeeded.query.all()
+        return jsonify([skill.serialize() for skill in skills]), 200
+
+    etag, last_modified = table_version(SKILLS_TABLE)
+    return conditional_response(
+        etag, last_modified, build,
+        max_age=current_app.config.get("SKILLS_LIST_MAX_AGE", 300),
+    )
 
 
 @profile.route("/profile/volunteer/edit", methods=["POST"])
@@ -373,31 +353,29 @@ def edit_volunteer_profile():
         non_tech_skills_to_remove = current_non_tech_skills - new_non_tech_skills
 
         # Remove skills that are no longer needed
-        for skill in user.skills[
-            :
-        ]:  # Create a copy of the list to avoid modification during iteration
-            if (skill.status == "tech" and skill.skill in tech_skills_to_remove) or (
-                skill.status == "non-tech" and skill.skill in non_tech_skills_to_remove
-            ):
-                user.skills.remove(skill)
-
-        # Add new tech skills
-        for skill_name in tech_skills_to_add:
-            skill_obj = SkillsNeeded.query.filter_by(skill=skill_name).first()
-            if not skill_obj:
-                skill_obj = SkillsNeeded(skill=skill_name, status="tech")
-                db.session.add(skill_obj)
-            user.skills.append(skill_obj)
-
-        # Add new non-tech skills
-        for skill_name in non_tech_skills_to_add:
-            skill_obj = SkillsNeeded.query.filter_by(skill=skill_name).first()
-            if not skill_obj:
-                skill_obj = SkillsNeeded(skill=skill_name, status="non-tech")
-                db.session.add(skill_obj)
-            user.skills.append(skill_obj)
+        removed_ids = [
+            skill.id
+            for skill in user.skills
+            if (skill.status == "tech" and skill.skill in tech_skills_to_remove)
+            or (skill.status == "non-tech" and skill.skill in non_tech_skills_to_remove)
+        ]
+        if removed_ids:
+            db.session.execute(
+                user_skills.delete().where(
+                    user_skills.c.user_id == user.id,
+                    user_skills.c.skill_id.in_(removed_ids),
+                )
+            )
+
+        # Add new skills
+        skill_ids = resolve_skill_ids(
+            [(skill, "tech") for skill in tech_skills_to_add]
+            + [(skill, "non-tech") for skill in non_tech_skills_to_add]
+        )
+        link_user_skills(user.id, skill_ids.values())
 
         db.session.commit()
+        refresh_user_skills(user.id)
 
         # Return summary of changes
         changes = {
@@ -458,8 +436,11 @@ def edit_org_profile():
             if field in data:
                 setattr(org_profile, field, data[field])
 
-        org_profile.updated_at = datetime.utcnow()
+        org_id = org_profile.id
         db.session.commit()
+        refresh_org_search(org_id)
+        invalidate_org_facets()
+        invalidate_org_responses(user_id)
 
         return jsonify({
             "status": "success",
@@ -490,46 +471,21 @@ def edit_org_projects():
         if not org_profile:
             return jsonify({"status": "error", "message": "Organization profile not found"}), 404
 
-        # Get existing projects
-        existing_projects = OrgProjects.query.filter_by(org_id=org_profile.id).all()
-        existing_projects_dict = {project.id: project for project in existing_projects}
-
-        # Track which projects were updated
-        updated_project_ids = set()
-
-        # Update or create projects
-        for project_data in data:
-            project_id = project_data.get('id')
-            
-            if project_id and project_id in existing_projects_dict:
-                # Update existing project
-                project = existing_projects_dict[project_id]
-                project.project_name = project_data['project_name']
-                project.project_description = project_data['project_description']
-                project.project_status = project_data['project_status']
-                updated_project_ids.add(project_id)
-            else:
-                # Create new project
-                new_project = OrgProjects(
-                    org_id=org_profile.id,
-                    project_name=project_data['project_name'],
-                    project_description=project_data['project_description'],
-                    project_status=project_data['project_status']
-                )
-                db.session.add(new_project)
-
-        # Delete projects that weren't in the update
-        projects_to_delete = [
-            project for project_id, project in existing_projects_dict.items()
-            if project_id not in updated_project_ids
-        ]
-        for project in projects_to_delete:
-            db.session.delete(project)
+        # Update, insert and delete only the projects that changed
+        result = sync_child_collection(
+            OrgProjects, org_profile.id, data, PROJECT_FIELDS
+        )
+        changed = result.inserted or result.updated or result.deleted
+        if changed:
+            touch_org_profile(org_profile.id)
 
         db.session.commit()
+        if changed:
+            invalidate_org_responses(user_id)
         return jsonify({
             "status": "success",
-            "message": "Projects updated successfully"
+            "message": "Projects updated successfully",
+            "changes": result._asdict(),
         }), 200
 
     except SQLAlchemyError as e:
@@ -579,44 +535,23 @@ def edit_org_initiatives():
             if not org_profile:
                 return jsonify({"status": "error", "message": "Organization profile not found"}), 404
 
-            existing_initiatives = OrgInitiatives.query.filter_by(org_id=org_id).all()
-            print(f"Found {len(existing_initiatives)} existing initiatives")  # Debug log
-            
-            existing_initiatives_dict = {init.id: init for init in existing_initiatives}
-            updated_initiative_ids = set()
-
-            # Start database transaction
-            for initiative_data in initiatives:
-                initiative_id = initiative_data.get('id')
-                print(f"Processing initiative ID: {initiative_id}")  # Debug log
-
-                if initiative_id and initiative_id in existing_initiatives_dict:
-                    # Update existing initiative
-                    initiative = existing_initiatives_dict[initiative_id]
-                    initiative.initiative_name = initiative_data['initiative_name']
-                    initiative.initiative_description = initiative_data['initiative_description']
-                    updated_initiative_ids.add(initiative_id)
-                else:
-                    # Create new initiative
-                    new_initiative = OrgInitiatives(
-                        org_id=org_id,
-                        initiative_name=initiative_data['initiative_name'],
-                        initiative_description=initiative_data['initiative_description']
-                    )
-                    db.session.add(new_initiative)
-
-            # Delete initiatives that weren't in the update
-            for init_id, init in existing_initiatives_dict.items():
-                if init_id not in updated_initiative_ids:
-                    print(f"Deleting initiative ID: {init_id}")  # Debug log
-                    db.session.delete(init)
+            # Update, insert and delete only the initiatives that changed
+            result = sync_child_collection(
+                OrgInitiatives, org_id, initiatives, INITIATIVE_FIELDS
+            )
+            changed = result.inserted or result.updated or result.deleted
+            if changed:
+                touch_org_profile(org_id)
 
             db.session.commit()
             print("Successfully committed changes")  # Debug log
-            
+            if changed:
+                invalidate_org_responses(user_id)
+
             return jsonify({
                 "status": "success",
-                "message": "Initiatives updated successfully"
+                "message": "Initiatives updated successfully",
+                "changes": result._asdict(),
             }), 200
 
         except SQLAlchemyError as db_err:
@@ -653,51 +588,38 @@ def edit_org_skills():
         if not org_profile:
             return jsonify({"status": "error", "message": "Organization profile not found"}), 404
 
-        # Simply empty the skills list without trying to delete from association table
-        org_profile.skills_needed = []
-        db.session.flush()
-
-        # Add new skills
-        for skill_item in skills_list:
-            if skill_item.get('action') in ['add', 'remains']:
-                # Get or create skill
-                skill = SkillsNeeded.query.filter_by(
-                    skill=skill_item['skill'],
-                    status=skill_item['status']
-                ).first()
-
-                if not skill:
-                    skill = SkillsNeeded(
-                        skill=skill_item['skill'],
-                        status=skill_item['status']
-                    )
-                    db.session.add(skill)
-                    db.session.flush()
-
-                # Add to relationship
-                org_profile.skills_needed.append(skill)
-                
-                # Let SQLAlchemy create the association, then update the description
-                db.session.flush()
-                
-                # Now update the description
-                db.session.execute(
-                    org_skills_connection.update().where(
-                        db.and_(
-                            org_skills_connection.c.org_id == org_profile.id,
-                            org_skills_connection.c.skill_id == skill.id
-                        )
-                    ).values(
-                        description=skill_item.get('description', '')
-                    )
-                )
+        kept_items = [
+            skill_item for skill_item in skills_list
+            if skill_item.get('action') in ['add', 'remains']
+        ]
 
+        # Only write the rows that actually change
+        org_id = org_profile.id
+        diff, skills = sync_org_skills(org_id, kept_items)
+        if diff.added or diff.removed or diff.changed:
+            touch_org_profile(org_id)
         db.session.commit()
-
+        if diff.added or diff.removed or diff.changed:
+            invalidate_org_responses(user_id)
+        if diff.added or diff.removed:
+            refresh_org_skills(org_id)
+            refresh_org_search(org_id)
+            invalidate_org_facets()
+
+        kept_ids = diff.added + diff.changed + diff.unchanged
         return jsonify({
             "status": "success",
             "message": "Skills updated successfully",
-            "skills": [skill.serialize() for skill in org_profile.skills_needed]
+            "skills": [
+                {key: skills[skill_id][key] for key in ("id", "skill", "status")}
+                for skill_id in sorted(kept_ids)
+            ],
+            "changes": {
+                "added": [skills[skill_id] for skill_id in diff.added],
+                "removed": [skills[skill_id] for skill_id in diff.removed],
+                "updated": [skills[skill_id] for skill_id in diff.changed],
+                "unchanged": len(diff.unchanged),
+            },
         }), 200
 
     except SQLAlchemyError as e:
@@ -713,24 +635,28 @@ def edit_org_skills():
 @profile.route("/profile/upload-images", methods=["POST"])
 def upload_org_images():
     """
-    Handle simultaneous upload of organization logo and cover photo
+    Queue the upload of an organization's logo and/or cover photo
     Expected form data:
     - user_id: The current user's ID
     - org_id: The organization profile ID
     - logo: (optional) The logo file
     - cover_photo: (optional) The cover photo file
 
+    Images are resized, encoded and uploaded by a background job so the
+    request thread is freed as soon as the files are read.
+
     Returns:
         tuple: (json_response, status_code)
         Response includes:
         - message: Status message
-        - results: Dictionary containing upload results for each image type
+        - job_id: The id of the queued upload job
+        - status_url: Where to poll for the job's result
         Status codes:
-        - 200: All uploads successful
-        - 207: Partial success (some uploads failed)
-        - 400: Bad request (missing data or all uploads failed)
+        - 202: Upload job queued
+        - 400: Bad request (missing data)
         - 403: Unauthorized access
         - 404: Organization not found
+        - 413: Upload larger than MAX_CONTENT_LENGTH
         - 500: Server error
     """
     try:
@@ -759,81 +685,40 @@ def upload_org_images():
             )
             return jsonify({"error": "Unauthorized access"}), 403
 
-        # Validate that at least one file was provided
-        if not any(request.files.get(type_) for type_ in ["logo", "cover_photo"]):
-            return jsonify({"error": "No image files provided"}), 400
-
-        # Initialize image handler
-        image_handler = ImageHandler()
-
-        # Track upload results for each image type
-        results = {"logo": None, "cover_photo": None}
-
-        # Handle both file uploads
-        for image_type in ["logo", "cover_photo"]:
-            if image_type in request.files:
-                file = request.files[image_type]
-                if file and file.filename:
-                    try:
-                        # Get the current filename for this image type
-                        old_filename = (
-                            org_profile.org_logo_filename
-                            if image_type == "logo"
-                            else org_profile.org_cover_photo_filename
-                        )
-
-                        # Delete old image if it exists
-                        if old_filename:
-                            logging.info(f"Deleting old {image_type}: {old_filename}")
-                            image_handler.delete_image(old_filename)
-
-                        # Upload new image
-                        logging.info(f"Uploading new {image_type}: {file.filename}")
-                        filename = image_handler.upload_image(file, image_type)
-
-                        # Update database field
-                        if image_type == "logo":
-                            org_profile.org_logo_filename = filename
-                        else:
-                            org_profile.org_cover_photo_filename = filename
-
-                        # Store result with public URL
-                        bucket_name = os.getenv("GCS_BUCKET_NAME")
-                        results[image_type] = {
-                            "success": True,
-                            "filename": filename,
-                            "url": f"https://storage.googleapis.com/{bucket_name}/{filename}",
-                        }
-                        logging.info(f"Successfully uploaded {image_type}")
-
-                    except ValueError as ve:
-                        logging.error(f"Error uploading {image_type}: {str(ve)}")
-                        results[image_type] = {"success": False, "error": str(ve)}
-
-        # Update organization profile timestamp
-        org_profile.updated_at = datetime.now(timezone.utc)
-
-        # Commit changes to database
+        # Copy the uploads to disk now; the request stream is gone once we
+        # return, and holding them as bytes would keep every upload in memory
+        spool_dir = current_app.config.get("IMAGE_SPOOL_DIR")
+        files = {}
         try:
-            db.session.commit()
-            logging.info(f"Successfully updated org profile {org_id} with new images")
-        except SQLAlchemyError as e:
-            logging.error(f"Database error updating org profile {org_id}: {str(e)}")
-            db.session.rollback()
-            return jsonify({"error": "Failed to update database"}), 500
+            for image_type in IMAGE_TYPES:
+                file = request.files.get(image_type)
+                if file and file.filename:
+                    files[image_type] = (file.filename, spool_upload(file, spool_dir))
 
-        # Prepare response with upload results
-        response = {"message": "Image upload completed", "results": results}
+            # Validate that at least one file was provided
+            if not files:
+                return jsonify({"error": "No image files provided"}), 400
 
-        # Determine appropriate status code based on results
-        if all(r and r.get("success") for r in results.values() if r):
-            status_code = 200  # All uploads successful
-        elif any(r and r.get("success") for r in results.values() if r):
-            status_code = 207  # Partial success
-        else:
-            status_code = 400  # All uploads failed
+            # The job deletes the spooled files once it has finished
+            job_id = get_image_jobs().submit(
+                current_app._get_current_object(), current_user_id, org_id, files
+            )
+        except Exception:
+            discard_spooled(path for _, path in files.values())
+            raise
+        logging.info(f"Queued image upload job {job_id} for org {org_id}")
 
-        return jsonify(response), status_code
+        return jsonify({
+            "message": "Image upload queued",
+            "job_id": job_id,
+            "status_url": url_for(
+                "profile.get_image_upload_status", job_id=job_id, user_id=current_user_id
+            ),
+        }), 202
+
+    except RequestEntityTooLarge:
+        limit = current_app.config["MAX_CONTENT_LENGTH"] // (1024 * 1024)
+        return jsonify({"error": f"Upload too large. Maximum is {limit} MB."}), 413
 
     except Exception as e:
         logging.error(f"Unexpected error in upload_org_images: {str(e)}")
@@ -849,50 +734,84 @@ def upload_org_images():
         )
 
 
+@profile.route("/profile/upload-images/<job_id>", methods=["GET"])
+def get_image_upload_status(job_id):
+    """
+    Report the progress of an image upload job
+    Query parameters:
+    - user_id: The user who queued the upload
+
+    Returns:
+        tuple: (json_response, status_code)
+        Response includes:
+        - job_id, status ("queued", "processing", "succeeded", "partial" or "failed")
+        - done: Whether the job has finished
+        - results: Upload result for each image type, as
+          {"success", "filename", "url"} or {"success", "error"}
+        Status codes:
+        - 200: Job found
+        - 400: Missing user_id
+        - 404: Unknown job, or a job queued by another user
+    """
+    user_id = request.args.get("user_id", type=int)
+    if user_id is None:
+        return jsonify({"error": "User ID is required"}), 400
+
+    job = get_image_jobs().get(job_id)
+    if job is None or job["user_id"] != user_id:
+        return jsonify({"error": "Upload job not found"}), 404
+
+    return jsonify({
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "done": job["status"] in FINISHED_STATES,
+        "results": job["results"],
+        "created_at": job["created_at"],
+        "finished_at": job["finished_at"],
+    }), 200
+
+
 @profile.route("/api/test/gcs", methods=["GET"])
 def test_gcs_connection():
-    """Test GCS connectivity and operations. Only available in development."""
+    """Test image storage connectivity and operations. Only available in development."""
     if os.getenv("ENV") != "development":
         return jsonify({"error": "Test endpoint only available in development"}), 403
 
     results = {
         "connection": False,
-        "bucket_access": False,
         "list_files": False,
         "test_upload": False,
         "details": {},
     }
 
     try:
-        # Test 1: Basic connection
-        storage_client = storage.Client()
+        # Test 1: Storage backend
+        object_storage = get_object_storage()
         results["connection"] = True
-        results["details"]["project"] = storage_client.project
-
-        # Test 2: Bucket access
-        bucket_name = os.getenv("GCS_BUCKET_NAME")
-        bucket = storage_client.bucket(bucket_name)
-        results["bucket_access"] = True
-        results["details"]["bucket_name"] = bucket_name
-
-        # Test 3: List files
-        blobs = list(bucket.list_blobs(max_results=5))
+        results["details"]["backend"] = object_storage.name
+
+        # Test 2: List files
+        objects = []
+        for stored in object_storage.list_objects():
+            objects.append(stored)
+            if len(objects) == 5:
+                break
         results["list_files"] = True
         results["details"]["files"] = [
-            {"name": blob.name, "size": blob.size, "updated": blob.updated.isoformat()}
-            for blob in blobs
+            {"name": stored.name, "size": stored.size, "updated": stored.updated.isoformat()}
+            for stored in objects
         ]
 
-        # Test 4: Test upload
+        # Test 3: Test upload
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        test_blob = bucket.blob(f"test/gcs_test_{timestamp}.txt")
-        test_blob.upload_from_string(
-            "GCS Test at " + datetime.now().isoformat(), content_type="text/plain"
+        test_name = f"test/gcs_test_{timestamp}.txt"
+        object_storage.upload(
+            test_name, ("Storage test at " + datetime.now().isoformat()).encode(), "text/plain"
         )
         results["test_upload"] = True
         results["details"]["test_file"] = {
-            "name": test_blob.name,
-            "url": f"https://storage.googleapis.com/{bucket_name}/{test_blob.name}",
+            "name": test_name,
+            "url": object_storage.public_url(test_name),
         }
 
         # Add credentials info
@@ -902,14 +821,14 @@ def test_gcs_connection():
         )
 
         return jsonify(
-            {"success": True, "message": "All GCS tests passed", "results": results}
+            {"success": True, "message": "All storage tests passed", "results": results}
         )
 
     except Exception as e:
         results["error"] = str(e)
         return (
             jsonify(
-                {"success": False, "message": "GCS test failed", "results": results}
+                {"success": False, "message": "Storage test failed", "results": results}
             ),
             500,
         )
@@ -0,0 +1,96 @@
+# Backend: app/utils/child_sync.py
+import hashlib
+import json
+from collections import namedtuple
+
+from sqlalchemy import bindparam, insert, select
+
+from app import db
+
+# Ids written by a sync; "inserted" is a count since new ids are not read back
+SyncResult = namedtuple("SyncResult", ["inserted", "updated", "deleted", "unchanged"])
+
+
+def content_hash(values):
+    """Hash a row's content fields so unchanged rows can be skipped"""
+    payload = json.dumps(list(values), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def sync_child_collection(model, org_id, items, fields):
+    """
+    Make an organisation's child rows (e.g. OrgProjects, OrgInitiatives)
+    match a submitted list
+    Args:
+        model: The child model; must have `id` and `org_id` columns
+        org_id (int): The owning organisation profile id
+        items (list): Submitted dicts. Items whose "id" belongs to the org
+            update that row, the rest are inserted, and stored rows not
+            submitted are deleted
+        fields (tuple): The content columns to write
+    Returns:
+        SyncResult
+
+    Loads the org's rows once, then writes with at most one executemany
+    UPDATE, one executemany INSERT and one DELETE ... WHERE id IN. Rows
+    whose content hash matches the submitted values are not written, so an
+    unchanged save is read-only. Nothing is committed.
+    """
+    columns = [getattr(model, field) for field in fields]
+    stored = {
+        row[0]: content_hash(row[1:])
+        for row in db.session.execute(
+            select(model.id, *columns).where(model.org_id == org_id)
+        )
+    }
+
+    submitted = {}
+    inserts = []
+    for item in items:
+        values = [item[field] for field in fields]
+        row_id = item.get("id")
+        if row_id in stored:
+            # A row submitted twice keeps its last values
+            submitted[row_id] = values
+        else:
+            inserts.append({"org_id": org_id, **dict(zip(fields, values))})
+
+    updates = {
+        row_id: values
+        for row_id, values in submitted.items()
+        if content_hash(values) != stored[row_id]
+    }
+    unchanged = sorted(submitted.keys() - updates.keys())
+    deleted = sorted(stored.keys() - submitted.keys())
+
+    if updates:
+        db.session.execute(
+            model.__table__.update()
+            .where(
+                model.__table__.c.id == bindparam("b_id"),
+                model.__table__.c.org_id == bindparam("b_org_id"),
+            )
+            .values({field: bindparam(f"b_{field}") for field in fields}),
+            [
+                {"b_id": row_id, "b_org_id": org_id, **{f"b_{f}": v for f, v in zip(fields, values)}}
+                for row_id, values in updates.items()
+            ],
+        )
+
+    if inserts:
+        db.session.execute(insert(model), inserts)
+
+    if deleted:
+        db.session.execute(
+            model.__table__.delete().where(
+                model.__table__.c.org_id == org_id,
+                model.__table__.c.id.in_(deleted),
+            )
+        )
+
+    return SyncResult(
+        inserted=len(inserts),
+        updated=sorted(updates),
+        deleted=deleted,
+        unchanged=unchanged,
+    )
@@ -0,0 +1,121 @@
+# Backend: app/utils/http_cache.py
+import hashlib
+import json
+from datetime import timezone
+
+from flask import Response, make_response, request
+from sqlalchemy import func, select, update
+
+from app import db
+from app.models import OrgProfile, TableVersion
+
+# TableVersion row bumped whenever skills_needed gains rows
+# (see app.utils.skill_resolver.bump_table_version)
+SKILLS_TABLE = "skills_needed"
+
+
+def make_etag(*parts):
+    """Hash the values identifying a representation into an ETag value"""
+    payload = json.dumps(parts, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def as_utc(value):
+    """Treat a naive timestamp from the database as UTC"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def org_directory_version():
+    """
+    Version the organisation directory with one aggregate query
+    Returns:
+        tuple: (etag, last modified datetime or None)
+
+    Org count and highest id catch creations and deletions; the sum of the
+    per-org version counters catches edits, including focus area and skill
+    changes since the profile routes call touch_org_profile() for those.
+    """
+    count, max_id, versions, last_modified = db.session.execute(
+        select(
+            func.count(OrgProfile.id),
+            func.max(OrgProfile.id),
+            func.sum(OrgProfile.version),
+            func.max(OrgProfile.updated_at),
+        )
+    ).one()
+    return make_etag("orgs", count, max_id, versions), as_utc(last_modified)
+
+
+def table_version(name):
+    """
+    Returns:
+        tuple: (etag, last modified datetime or None) of a versioned table
+    """
+    row = db.session.execute(
+        select(TableVersion.version, TableVersion.updated_at).where(TableVersion.name == name)
+    ).first()
+    version, updated_at = row if row is not None else (0, None)
+    return make_etag(name, version), as_utc(updated_at)
+
+
+def touch_org_profile(org_id):
+    """
+    Bump an organisation's version and updated_at in the caller's
+    transaction, for writes that only touch its child rows (projects,
+    initiatives, skill links); UPDATEs of the profile row bump them already
+    """
+    db.session.execute(
+        update(OrgProfile)
+        .where(OrgProfile.id == org_id)
+        .values(version=OrgProfile.version + 1, updated_at=func.now())
+    )
+
+
+def is_not_modified(etag, last_modified):
+    """Whether the request's validators match the current representation"""
+    if request.if_none_match:
+        # If-None-Match wins over If-Modified-Since, and uses weak comparison
+        # so validators rewritten by a compressing proxy still match
+        return request.if_none_match.contains_weak(etag)
+
+    if_modified_since = request.if_modified_since
+    if if_modified_since is not None and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= if_modified_since
+    return False
+
+
+def conditional_response(etag, last_modified, build, max_age=0, private=False):
+    """
+    Answer a GET from its version, building the body only when it changed
+    Args:
+        etag (str): Validator of the current representation
+        last_modified (datetime, optional): When the data last changed
+        build (callable): Returns the full response, e.g. (jsonify(...), 200)
+        max_age (int): Seconds a client may reuse the response unchecked;
+            0 makes it revalidate every time
+        private (bool): Keep the response out of shared caches
+    Returns:
+        Response: 304 with no body if the client's copy is current, else
+        the built response; both carry the validators and Cache-Control
+    """
+    if is_not_modified(etag, last_modified):
+        response = Response(status=304)
+    else:
+        response = make_response(build())
+        if response.status_code != 200:
+            return response
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    if private:
+        response.cache_control.private = True
+    else:
+        response.cache_control.public = True
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response
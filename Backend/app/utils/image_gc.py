@@ -0,0 +1,108 @@
+# Backend: app/utils/image_gc.py
+import logging
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import select
+
+from app import db
+from app.models import OrgProfile, image_variant_filename
+from app.utils.image_handler import VARIANT_FORMATS
+from app.utils.object_storage import get_object_storage
+
+# Storage prefixes holding uploaded org images; nothing else is collected
+IMAGE_PREFIXES = ("logo/", "cover_photo/")
+
+
+def orphan_grace_period():
+    """How long unreferenced images are kept after they were last written or reused"""
+    return timedelta(hours=current_app.config.get("IMAGE_ORPHAN_GRACE_HOURS", 24))
+
+
+def referenced_image_names():
+    """
+    Collect every object name a profile refers to
+    Returns:
+        set: The logo and cover photo filenames plus every variant listed in
+        the profiles' org_image_variants manifests
+    """
+    names = set()
+    rows = db.session.execute(
+        select(
+            OrgProfile.org_logo_filename,
+            OrgProfile.org_cover_photo_filename,
+            OrgProfile.org_image_variants,
+        )
+    )
+    for logo_filename, cover_photo_filename, variants in rows:
+        names.update(name for name in (logo_filename, cover_photo_filename) if name)
+        for entry in (variants or {}).values():
+            if not entry:
+                continue
+            for width in entry["widths"]:
+                for extension in VARIANT_FORMATS:
+                    names.add(image_variant_filename(entry["base"], width, extension))
+    return names
+
+
+def collect_orphaned_images(grace_period=None, batch_size=100, dry_run=False, storage=None):
+    """
+    Delete stored images no profile refers to
+
+    The grace period protects uploads whose job has not committed yet.
+    Uploads that reuse an existing image refresh its timestamp before they
+    commit, so right before each batch is deleted, objects that changed
+    since the listing are skipped and the references are read again. The
+    delete itself is conditional on the object being unchanged (on GCS, its
+    generation and metageneration), so a refresh that lands after those
+    checks still keeps the object.
+
+    Args:
+        grace_period (timedelta, optional): Minimum age of a deleted object
+            (default: IMAGE_ORPHAN_GRACE_HOURS)
+        batch_size (int): Objects deleted per storage call
+        dry_run (bool): Only count what would be deleted
+        storage (optional): Storage backend (default: the app's)
+    Returns:
+        dict: {"scanned", "orphaned", "deleted", "bytes"}
+    """
+    storage = storage or get_object_storage()
+    older_than = datetime.now(timezone.utc) - (grace_period or orphan_grace_period())
+    referenced = referenced_image_names()
+    summary = {"scanned": 0, "orphaned": 0, "deleted": 0, "bytes": 0}
+
+    # Listings are paged by the backend; only orphans are kept in memory
+    orphans = []
+    for prefix in IMAGE_PREFIXES:
+        for stored in storage.list_objects(prefix):
+            summary["scanned"] += 1
+            if stored.name not in referenced and stored.updated < older_than:
+                orphans.append(stored)
+
+    summary["orphaned"] = len(orphans)
+    summary["bytes"] = sum(stored.size or 0 for stored in orphans)
+    logging.info(
+        f"Found {len(orphans)} orphaned images ({summary['bytes']} bytes) "
+        f"among {summary['scanned']} stored"
+    )
+    if dry_run or not orphans:
+        return summary
+
+    for start in range(0, len(orphans), batch_size):
+        batch = orphans[start:start + batch_size]
+        try:
+            # Skip objects an upload touched (or rewrote) since they were listed
+            batch = [stored for stored in batch if storage.stat(stored.name) == stored]
+
+            # End the read transaction so commits since the listing are seen
+            db.session.rollback()
+            referenced = referenced_image_names()
+            batch = [stored for stored in batch if stored.name not in referenced]
+
+            summary["deleted"] += storage.delete_unchanged(batch)
+        except Exception as e:
+            # The next run retries whatever is left
+            logging.error(f"Failed to delete {len(batch)} orphaned images: {str(e)}")
+
+    logging.info(f"Deleted {summary['deleted']} orphaned images")
+    return summary
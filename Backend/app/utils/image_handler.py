@@ -1,12 +1,43 @@
 # Backend: app/utils/image_handler.py
-from google.cloud import storage
-import uuid
+import hashlib
 from PIL import Image
 from io import BytesIO
 from flask import current_app
 import logging
-import os
-from datetime import datetime
+
+from app.models import image_variant_filename
+from app.utils.image_ingest import REDUCING_GAP, open_bounded
+from app.utils.object_storage import IMMUTABLE_CACHE_CONTROL, get_object_storage
+
+# Widths (px) rendered for each image type, capped at the uploaded width
+VARIANT_WIDTHS = {
+    "logo": (96, 200, 400),
+    "cover_photo": (480, 960, 1920),
+}
+
+# extension -> (content type, PIL save options) of each variant format
+VARIANT_FORMATS = {
+    "webp": ("image/webp", {"format": "WEBP", "quality": 80, "method": 4}),
+    "jpg": ("image/jpeg", {"format": "JPEG", "quality": 85, "optimize": True, "progressive": True}),
+}
+
+
+def content_digest(stream, chunk_size=1024 * 1024):
+    """
+    Hash an upload together with the variant settings, so the same image
+    rendered with different settings gets a different name
+    Args:
+        stream: Binary file object; it is rewound afterwards
+        chunk_size (int): Bytes read at a time
+    Returns:
+        str: 32 hex digits
+    """
+    digest = hashlib.sha256(repr((VARIANT_WIDTHS, VARIANT_FORMATS)).encode())
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()[:32]
 
 
 class ImageHandler:
@@ -14,10 +45,13 @@ class ImageHandler:
 
     ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg"}
 
-    def __init__(self):
-        """Initialize GCS client and bucket"""
-        self.storage_client = storage.Client()
-        self.bucket = self.storage_client.bucket(os.getenv("GCS_BUCKET_NAME"))
+    def __init__(self, storage=None):
+        """
+        Args:
+            storage (optional): Storage backend (default: the app's, see
+                app/utils/object_storage.py)
+        """
+        self.storage = storage or get_object_storage()
 
     def allowed_file(self, filename):
         """
@@ -32,66 +66,130 @@ class ImageHandler:
             and filename.rsplit(".", 1)[1].lower() in self.ALLOWED_EXTENSIONS
         )
 
-    def process_image(self, file, image_type):
+    def open_image(self, file, image_type):
         """
-        Process and optimize image before upload
+        Read and validate an uploaded image within the configured limits
         Args:
             file: FileStorage object from request
             image_type (str): Either 'logo' or 'cover_photo'
         Returns:
-            tuple: (processed_image_bytes, new_filename)
+            PIL.Image: The image in RGB, scaled down to the type's maximum size
         Raises:
-            ValueError: If image dimensions are too small
+            ValueError: If the image is unsupported, too small or too large
         """
-        try:
-            # Read image and convert to PIL Image
-            image = Image.open(file)
-
-            # Define size limits based on image type
-            if image_type == "logo":
-                max_size = (400, 400)  # Max size for logos
-                min_size = (100, 100)  # Min size for logos
-            else:  # cover_photo
-                max_size = (1920, 1080)  # Max size for cover photos
-                min_size = (800, 400)  # Min size for cover photos
-
-            # Check minimum dimensions
-            if image.size[0] < min_size[0] or image.size[1] < min_size[1]:
-                raise ValueError(
-                    f"Image too small. Minimum size is {min_size[0]}x{min_size[1]} pixels. "
-                    f"Uploaded image is {image.size[0]}x{image.size[1]} pixels."
-                )
+        # Define size limits based on image type
+        if image_type == "logo":
+            max_size = (400, 400)  # Max size for logos
+            min_size = (100, 100)  # Min size for logos
+        else:  # cover_photo
+            max_size = (1920, 1080)  # Max size for cover photos
+            min_size = (800, 400)  # Min size for cover photos
 
-            # Resize if larger than maximum size while maintaining aspect ratio
-            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+        # Limits are checked from the header before any pixels are decoded
+        image = open_bounded(
+            file.stream,
+            max_size,
+            min_size,
+            max_pixels=current_app.config.get("IMAGE_MAX_PIXELS", 40_000_000),
+            memory_budget=current_app.config.get("IMAGE_DECODE_BUDGET", 64 * 1024 * 1024),
+        )
 
-            # Convert to RGB if necessary (handles RGBA PNG files)
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
+        # Resize if larger than maximum size while maintaining aspect ratio;
+        # reducing_gap lets Pillow reduce() by whole factors first
+        image.thumbnail(max_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
-            # Save to BytesIO with optimization
-            output = BytesIO()
-            image.save(output, format="JPEG", quality=85, optimize=True)
-            output.seek(0)
+        # Convert to RGB if necessary (handles RGBA PNG files)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return image
 
-            # Generate unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            new_filename = f"{image_type}/{timestamp}_{str(uuid.uuid4())[:8]}.jpg"
+    def plan_variants(self, file, image_type):
+        """
+        Open an image and name its variants after its content
+        Args:
+            file: FileStorage object from request
+            image_type (str): Either 'logo' or 'cover_photo'
+        Returns:
+            tuple: (PIL.Image scaled to the type's maximum size, manifest
+            entry {"base", "widths"})
+        Raises:
+            ValueError: If the image cannot be read or is too small
+        """
+        try:
+            # Identical uploads get identical names, so they are stored once
+            base = f"{image_type}/{content_digest(file.stream)}"
+
+            image = self.open_image(file, image_type)
 
-            return output.getvalue(), new_filename
+            # Never upscale: widths above the image's own are replaced by it
+            widths = sorted(
+                {width for width in VARIANT_WIDTHS[image_type] if width < image.width}
+                | {image.width}
+            )
+            return image, {"base": base, "widths": widths}
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(f"Error processing image: {str(e)}")
+            raise ValueError(f"Error processing image: {str(e)}")
+
+    def render_variants(self, image, entry):
+        """
+        Render an image at each variant width, as WebP and progressive JPEG
+        Args:
+            image (PIL.Image): As returned by plan_variants
+            entry (dict): The manifest entry {"base", "widths"}
+        Returns:
+            list: (object name, image bytes, content type), smallest first and
+            ending with the largest JPEG
+        Raises:
+            ValueError: If encoding fails
+        """
+        try:
+            variants = []
+            for width in entry["widths"]:
+                height = max(1, round(image.height * width / image.width))
+                resized = image if width == image.width else image.resize(
+                    (width, height), Image.Resampling.LANCZOS
+                )
+                for extension, (content_type, save_options) in VARIANT_FORMATS.items():
+                    output = BytesIO()
+                    resized.save(output, **save_options)
+                    variants.append(
+                        (image_variant_filename(entry["base"], width, extension), output.getvalue(), content_type)
+                    )
+            return variants
 
         except Exception as e:
             logging.error(f"Error processing image: {str(e)}")
             raise ValueError(f"Error processing image: {str(e)}")
 
-    def upload_image(self, file, image_type):
+    def process_variants(self, file, image_type):
+        """
+        Render an image's variants
+        Args:
+            file: FileStorage object from request
+            image_type (str): Either 'logo' or 'cover_photo'
+        Returns:
+            tuple: (manifest entry {"base", "widths"}, list of
+            (object name, image bytes, content type))
+        Raises:
+            ValueError: If the image cannot be read or is too small
+        """
+        image, entry = self.plan_variants(file, image_type)
+        return entry, self.render_variants(image, entry)
+
+    def upload_variants(self, file, image_type):
         """
-        Upload image to Google Cloud Storage
+        Upload every variant of an image to the storage backend, unless the
+        same image was uploaded before
         Args:
             file: FileStorage object from request
             image_type (str): Either 'logo' or 'cover_photo'
         Returns:
-            str: The filename of the uploaded image
+            dict: The manifest entry {"base", "widths"}; the largest JPEG
+            (image_variant_filename(base, widths[-1], "jpg")) is the fallback
         Raises:
             ValueError: If file validation or upload fails
         """
@@ -103,29 +201,42 @@ class ImageHandler:
                 f"File type not allowed. Supported types: {', '.join(self.ALLOWED_EXTENSIONS)}"
             )
 
+        image, entry = self.plan_variants(file, image_type)
+
+        # The fallback is uploaded last, so if it exists every variant does
+        fallback = image_variant_filename(entry["base"], entry["widths"][-1], "jpg")
         try:
-            # Process the image
-            image_bytes, filename = self.process_image(file, image_type)
-
-            # Create new blob and upload the file
-            blob = self.bucket.blob(filename)
-            blob.upload_from_string(
-                image_bytes,
-                content_type="image/jpeg",
-                timeout=30,  # Add timeout for upload
-            )
+            if self.storage.exists(fallback):
+                logging.info(f"Image {entry['base']} is already stored, skipping upload")
+                # It may be an orphan past the GC grace period; refreshing
+                # the timestamps keeps the collector off it until we commit
+                for width in entry["widths"]:
+                    for extension in VARIANT_FORMATS:
+                        self.storage.touch(image_variant_filename(entry["base"], width, extension))
+                return entry
+        except Exception as e:
+            logging.error(f"Error checking for stored image: {str(e)}")
+            raise ValueError(f"Error uploading image: {str(e)}")
 
-            return filename
+        variants = self.render_variants(image, entry)
 
-        except ValueError as e:
-            raise  # Re-raise ValueError for handling in route
+        try:
+            for filename, image_bytes, content_type in variants:
+                # Object names are content hashes, so browsers may keep them
+                self.storage.upload(
+                    filename, image_bytes, content_type, cache_control=IMMUTABLE_CACHE_CONTROL
+                )
         except Exception as e:
             logging.error(f"Error uploading image: {str(e)}")
+            # Don't leave a partial set of variants behind
+            self.delete_variants(entry)
             raise ValueError(f"Error uploading image: {str(e)}")
 
+        return entry
+
     def delete_image(self, filename):
         """
-        Delete image from Google Cloud Storage
+        Delete image from the storage backend
         Args:
             filename (str): Name of file to delete
         """
@@ -133,12 +244,46 @@ class ImageHandler:
             return
 
         try:
-            blob = self.bucket.blob(filename)
-            blob.delete(timeout=30)
+            self.storage.delete(filename)
         except Exception as e:
             logging.error(f"Error deleting image: {str(e)}")
             # Don't raise - deletion errors shouldn't block new uploads
 
+    def delete_variants(self, entry):
+        """
+        Delete every variant listed in a manifest entry
+        Args:
+            entry (dict): {"base", "widths"} as returned by upload_variants
+        """
+        if not entry:
+            return
+
+        for width in entry["widths"]:
+            for extension in VARIANT_FORMATS:
+                self.delete_image(image_variant_filename(entry["base"], width, extension))
+
+    def delete_if_idle(self, names, older_than):
+        """
+        Delete an image's objects unless any of them was written or reused
+        since a cut-off: an upload that reuses an image touches its objects
+        before it commits a reference to them
+        Args:
+            names (list): Object names of the image (every variant)
+            older_than (datetime): Timezone aware cut-off
+        Returns:
+            bool: Whether the image was deleted
+        """
+        try:
+            objects = [stored for stored in map(self.storage.stat, names) if stored]
+            if any(stored.updated >= older_than for stored in objects):
+                return False
+            # Objects touched after the check fail the delete and are kept
+            self.storage.delete_unchanged(objects)
+            return True
+        except Exception as e:
+            logging.error(f"Error deleting image: {str(e)}")
+            return False
+
     def get_public_url(self, filename):
         """
         Get the public URL for an uploaded file
@@ -149,4 +294,4 @@ class ImageHandler:
         """
         if not filename:
             return None
-        return f"https://storage.googleapis.com/{self.bucket.name}/{filename}"
+        return self.storage.public_url(filename)
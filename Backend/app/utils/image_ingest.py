@@ -0,0 +1,128 @@
+# Backend: app/utils/image_ingest.py
+import os
+import tempfile
+
+from PIL import Image
+
+# Formats accepted, as identified from the file header (not the extension)
+IMAGE_FORMATS = {"JPEG", "PNG"}
+
+# Modes Pillow stores with one byte per pixel; every other mode uses four
+ONE_BYTE_MODES = {"1", "L", "P"}
+
+# Decode at least this many times the target size before the final resize,
+# so the reduce() shortcut does not cost visible quality
+REDUCING_GAP = 2.0
+
+
+def bytes_per_pixel(mode):
+    return 1 if mode in ONE_BYTE_MODES else 4
+
+
+def decoded_size(image):
+    """
+    Estimate the memory Pillow needs to decode an image and scale it down
+    Args:
+        image (PIL.Image): An opened, not yet loaded image
+    Returns:
+        int: Bytes; the bitmap plus the copy thumbnail() reduces it to (at
+        most a quarter of it, as reducing_gap is at least 2). The conversion
+        to RGB runs on the scaled down image, so it is not counted
+    """
+    bitmap = image.size[0] * image.size[1] * bytes_per_pixel(image.mode)
+    return bitmap + bitmap // 4
+
+
+def max_decoded_pixels(mode, memory_budget):
+    """Largest image of a mode, in pixels, that decodes within a budget"""
+    return memory_budget * 4 // (bytes_per_pixel(mode) * 5)
+
+
+def open_bounded(file, max_size, min_size, max_pixels, memory_budget):
+    """
+    Open an uploaded image without decoding more than it needs
+    Args:
+        file: Path or binary file object of the upload
+        max_size (tuple): (width, height) the image will be scaled down to
+        min_size (tuple): Smallest accepted (width, height)
+        max_pixels (int): Largest accepted width * height, checked from the
+            header before anything is decoded
+        memory_budget (int): Bytes decoding may use, see decoded_size()
+    Returns:
+        PIL.Image: The opened image, for JPEGs already set to decode at a
+        reduced scale; pixels are decoded on first use
+    Raises:
+        ValueError: If the file is not a supported image or breaks a limit
+
+    JPEGs are decoded at up to 1/8 scale, so for them (at any usual aspect
+    ratio) max_pixels is the limit that applies. PNGs are decoded at full size and the budget wins
+    when it is the lower of the two: see max_decoded_pixels().
+    """
+    try:
+        # Only the header is read here
+        image = Image.open(file)
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Unsupported or corrupt image: {str(e)}")
+
+    if image.format not in IMAGE_FORMATS:
+        raise ValueError(
+            f"Unsupported image format {image.format}. "
+            f"Supported formats: {', '.join(sorted(IMAGE_FORMATS))}"
+        )
+
+    width, height = image.size
+    if width * height > max_pixels:
+        raise ValueError(
+            f"Image too large. Maximum is {max_pixels // 1_000_000} megapixels. "
+            f"Uploaded image is {width}x{height} pixels."
+        )
+
+    if width < min_size[0] or height < min_size[1]:
+        raise ValueError(
+            f"Image too small. Minimum size is {min_size[0]}x{min_size[1]} pixels. "
+            f"Uploaded image is {width}x{height} pixels."
+        )
+
+    if image.format == "JPEG":
+        # The JPEG decoder can scale by 1/2, 1/4 or 1/8 while decoding, so
+        # a phone photo never exists in memory at full resolution. Its
+        # scaled decoding averages like a resize, so it only needs to cover
+        # max_size (thumbnail() keeps this scale)
+        image.draft("RGB", max_size)
+
+    if decoded_size(image) > memory_budget:
+        limit = min(max_pixels, max_decoded_pixels(image.mode, memory_budget))
+        raise ValueError(
+            f"Image too large. Maximum for {image.format} images is "
+            f"{limit / 1_000_000:.1f} megapixels. Uploaded image is {width}x{height} pixels."
+        )
+
+    return image
+
+
+def spool_upload(file, spool_dir=None):
+    """
+    Copy an uploaded file to a temporary file in chunks
+    Args:
+        file: FileStorage object from request
+        spool_dir (str, optional): Directory for the file (default: system temp)
+    Returns:
+        str: Path of the copy; the caller deletes it with discard_spooled()
+    """
+    handle, path = tempfile.mkstemp(prefix="upload-", dir=spool_dir)
+    try:
+        with os.fdopen(handle, "wb") as spooled:
+            file.save(spooled)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def discard_spooled(paths):
+    """Delete spooled uploads, ignoring ones that are already gone"""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
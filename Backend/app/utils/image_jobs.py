@@ -0,0 +1,280 @@
+# Backend: app/utils/image_jobs.py
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import FileStorage
+
+from app import db
+from app.models import ImageUploadJob, OrgProfile, image_srcsets, image_variant_filename, public_image_url
+from app.utils.image_gc import orphan_grace_period
+from app.utils.image_handler import VARIANT_FORMATS, ImageHandler
+from app.utils.image_ingest import discard_spooled
+from app.utils.response_cache import invalidate_org_responses
+
+# Job states reported by the status endpoint
+JOB_QUEUED = "queued"
+JOB_PROCESSING = "processing"
+JOB_SUCCEEDED = "succeeded"
+JOB_PARTIAL = "partial"
+JOB_FAILED = "failed"
+FINISHED_STATES = {JOB_SUCCEEDED, JOB_PARTIAL, JOB_FAILED}
+
+IMAGE_TYPES = ("logo", "cover_photo")
+
+
+class ImageJobQueue:
+    """
+    Runs image uploads off the request thread
+
+    Jobs execute on a bounded thread pool (Pillow releases the GIL while
+    decoding, resizing and encoding, and the GCS calls are network bound),
+    so a slow upload no longer holds one of gunicorn's request threads.
+
+    A job runs in the process that accepted the upload (its spooled files
+    are on that machine), but its state is kept in the image_upload_jobs
+    table, so a status poll can be answered by any worker or instance.
+    Finished jobs are kept for `retention` seconds. A job whose process
+    exits before it finishes stays "queued" or "processing".
+    """
+
+    def __init__(self, max_workers=2, retention=3600):
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="image-jobs"
+        )
+
+    def submit(self, app, user_id, org_id, files):
+        """
+        Queue an upload job
+        Args:
+            app: The Flask app, used to push an app context in the worker
+            user_id (int): The user who started the upload
+            org_id (int): The organisation whose images are replaced
+            files (dict): image_type -> (original filename, spooled file path);
+                the job deletes the spooled files when it finishes
+        Returns:
+            str: The job id
+        """
+        job_id = uuid.uuid4().hex
+        self._prune()
+        db.session.add(ImageUploadJob(
+            id=job_id,
+            user_id=int(user_id),
+            org_id=org_id,
+            status=JOB_QUEUED,
+            results={image_type: None for image_type in IMAGE_TYPES},
+        ))
+        db.session.commit()
+
+        self._executor.submit(self._run, app, job_id, org_id, files)
+        return job_id
+
+    def get(self, job_id):
+        """Return a job's public state, or None if unknown"""
+        job = db.session.execute(
+            select(ImageUploadJob)
+            .where(ImageUploadJob.id == job_id)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        return job.serialize() if job else None
+
+    def _update(self, job_id, **fields):
+        db.session.execute(
+            update(ImageUploadJob).where(ImageUploadJob.id == job_id).values(**fields)
+        )
+        db.session.commit()
+
+    def _prune(self):
+        """Drop finished jobs older than the retention period"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        db.session.execute(
+            delete(ImageUploadJob).where(ImageUploadJob.finished_at < cutoff)
+        )
+
+    def _run(self, app, job_id, org_id, files):
+        with app.app_context():
+            try:
+                self._update(job_id, status=JOB_PROCESSING)
+                results = process_org_images(org_id, files)
+                status = job_status(results)
+            except Exception as e:
+                logging.error(f"Image job {job_id} failed: {str(e)}")
+                db.session.rollback()
+                results = {
+                    image_type: {"success": False, "error": "Internal server error"}
+                    for image_type in files
+                }
+                status = JOB_FAILED
+            finally:
+                discard_spooled(path for _, path in files.values())
+
+            try:
+                self._update(
+                    job_id,
+                    status=status,
+                    results={**{image_type: None for image_type in IMAGE_TYPES}, **results},
+                    finished_at=datetime.utcnow(),
+                )
+            except SQLAlchemyError as e:
+                logging.error(f"Failed to record the result of image job {job_id}: {str(e)}")
+                db.session.rollback()
+            finally:
+                db.session.remove()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+def job_status(results):
+    """Map per-image results to the job's final status"""
+    outcomes = [result.get("success") for result in results.values() if result]
+    if outcomes and all(outcomes):
+        return JOB_SUCCEEDED
+    if any(outcomes):
+        return JOB_PARTIAL
+    return JOB_FAILED
+
+
+def process_org_images(org_id, files):
+    """
+    Process, upload and record an organisation's new images
+
+    The images are rendered and uploaded concurrently, so a job with a logo
+    and a cover photo takes as long as the slower of the two. Replaced
+    images are deleted once the new ones are committed, unless another
+    profile still uses them (identical uploads share their objects).
+
+    Args:
+        org_id (int): The organisation profile id
+        files (dict): image_type -> (original filename, spooled file path)
+    Returns:
+        dict: image_type -> {"success", "filename", "url", "srcsets"} or
+        {"success", "error"}
+    """
+    org_profile = db.session.get(OrgProfile, org_id)
+    if org_profile is None:
+        raise ValueError(f"Organization profile {org_id} not found")
+
+    image_handler = ImageHandler()
+    app = current_app._get_current_object()
+
+    def upload(image_type, original_filename, path):
+        with app.app_context(), open(path, "rb") as stream:
+            logging.info(f"Uploading new {image_type}: {original_filename}")
+            file = FileStorage(stream=stream, filename=original_filename)
+            return image_handler.upload_variants(file, image_type)
+
+    with ThreadPoolExecutor(max_workers=len(files), thread_name_prefix="image-upload") as pool:
+        uploads = {
+            image_type: pool.submit(upload, image_type, original_filename, path)
+            for image_type, (original_filename, path) in files.items()
+        }
+
+    results = {}
+    replaced = []
+    variants = dict(org_profile.org_image_variants or {})
+
+    for image_type, future in uploads.items():
+        try:
+            entry = future.result()
+        except ValueError as ve:
+            logging.error(f"Error uploading {image_type}: {str(ve)}")
+            results[image_type] = {"success": False, "error": str(ve)}
+            continue
+
+        # The largest JPEG stays the single-file fallback
+        filename = image_variant_filename(entry["base"], entry["widths"][-1], "jpg")
+        if image_type == "logo":
+            old_filename, org_profile.org_logo_filename = org_profile.org_logo_filename, filename
+        else:
+            old_filename, org_profile.org_cover_photo_filename = org_profile.org_cover_photo_filename, filename
+
+        # Keep the old image (all its variants, if it has any) for deletion
+        if old_filename and old_filename != filename:
+            replaced.append((old_filename, variants.get(image_type)))
+        variants[image_type] = entry
+
+        results[image_type] = {
+            "success": True,
+            "filename": filename,
+            "url": public_image_url(filename),
+            "srcsets": image_srcsets(entry),
+        }
+        logging.info(f"Successfully uploaded {image_type}")
+
+    if any(result["success"] for result in results.values()):
+        # A new dict, so the JSON column is seen as changed
+        org_profile.org_image_variants = variants
+
+    # The filename changes bump updated_at and version on commit
+    user_id = org_profile.user_id
+
+    try:
+        db.session.commit()
+        logging.info(f"Successfully updated org profile {org_id} with new images")
+        invalidate_org_responses(user_id)
+    except SQLAlchemyError as e:
+        logging.error(f"Database error updating org profile {org_id}: {str(e)}")
+        db.session.rollback()
+        return {
+            image_type: {"success": False, "error": "Failed to update database"}
+            for image_type in files
+        }
+
+    delete_unused_images(image_handler, replaced)
+    return results
+
+
+def delete_unused_images(image_handler, replaced):
+    """
+    Delete replaced images that no profile refers to any more. Images
+    written or reused within the orphan grace period are kept, as another
+    org's upload may be reusing them and not have committed yet; those and
+    failed deletes are left to collect_orphaned_images.py
+    Args:
+        image_handler (ImageHandler): Handler whose storage holds the images
+        replaced (list): (old filename, old manifest entry or None) pairs
+    """
+    older_than = datetime.now(timezone.utc) - orphan_grace_period()
+    for old_filename, entry in replaced:
+        in_use = db.session.execute(
+            select(OrgProfile.id).where(or_(
+                OrgProfile.org_logo_filename == old_filename,
+                OrgProfile.org_cover_photo_filename == old_filename,
+            )).limit(1)
+        ).first()
+        if in_use:
+            logging.info(f"Keeping {old_filename}, still used by org {in_use.id}")
+            continue
+
+        names = [old_filename]
+        if entry:
+            names = [
+                image_variant_filename(entry["base"], width, extension)
+                for width in entry["widths"]
+                for extension in VARIANT_FORMATS
+            ]
+        if image_handler.delete_if_idle(names, older_than):
+            logging.info(f"Deleted old image: {old_filename}")
+        else:
+            logging.info(f"Keeping {old_filename} for the orphan collector, it was used recently")
+
+
+def init_image_jobs(app):
+    """Create the image job queue for an app and register it in app.extensions"""
+    queue = ImageJobQueue(
+        max_workers=app.config.get("IMAGE_PROCESSING_WORKERS", 2),
+        retention=app.config.get("IMAGE_JOB_RETENTION", 3600),
+    )
+    app.extensions["image_jobs"] = queue
+    return queue
+
+
+def get_image_jobs():
+    """Return the current app's image job queue"""
+    return current_app.extensions["image_jobs"]
@@ -0,0 +1,268 @@
+# Backend: app/utils/object_storage.py
+import logging
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from flask import current_app, redirect, send_from_directory
+
+# An object as returned by list_objects(); updated is timezone aware (UTC).
+# GCS also reports the object's generation and metageneration, which change
+# when it is rewritten or its metadata is patched (touch())
+StoredObject = namedtuple(
+    "StoredObject", ["name", "size", "updated", "generation", "metageneration"], defaults=(None, None)
+)
+
+# Uploaded images are never overwritten, so clients may cache them for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Calls GCS accepts in one batch request
+GCS_BATCH_SIZE = 100
+
+_gcs_client = None
+_gcs_client_lock = threading.Lock()
+
+
+def shared_gcs_client():
+    """
+    Return the process-wide GCS client, creating it on first use
+
+    The client keeps an authorised HTTP session, so sharing it reuses
+    credentials and pooled connections across requests and image jobs.
+    """
+    global _gcs_client
+    if _gcs_client is None:
+        with _gcs_client_lock:
+            if _gcs_client is None:
+                # Only needed when images are stored in GCS
+                from google.cloud import storage
+
+                _gcs_client = storage.Client()
+    return _gcs_client
+
+
+class GCSStorage:
+    """Objects in a Google Cloud Storage bucket, served by GCS itself"""
+
+    name = "gcs"
+
+    def __init__(self, bucket_name, client=None):
+        self.bucket_name = bucket_name
+        self._client = client
+        self._bucket = None
+
+    @property
+    def bucket(self):
+        if self._bucket is None:
+            self._bucket = (self._client or shared_gcs_client()).bucket(self.bucket_name)
+        return self._bucket
+
+    def upload(self, name, data, content_type, cache_control=None):
+        blob = self.bucket.blob(name)
+        if cache_control:
+            blob.cache_control = cache_control
+        blob.upload_from_string(data, content_type=content_type, timeout=30)
+
+    def delete(self, name):
+        """Delete an object; a missing object is not an error"""
+        from google.api_core.exceptions import NotFound
+
+        try:
+            self.bucket.blob(name).delete(timeout=30)
+        except NotFound:
+            pass
+
+    def delete_unchanged(self, objects):
+        """
+        Delete listed objects in batched requests of up to 100, each only if
+        its generation and metageneration still match the listing
+        Args:
+            objects (list): StoredObjects from list_objects() or stat()
+        Returns:
+            int: Objects deleted; changed and missing ones are skipped
+        """
+        deleted = 0
+        for start in range(0, len(objects), GCS_BATCH_SIZE):
+            batch = self.bucket.client.batch(raise_exception=False)
+            with batch:
+                for stored in objects[start:start + GCS_BATCH_SIZE]:
+                    self.bucket.delete_blob(
+                        stored.name,
+                        if_generation_match=stored.generation,
+                        if_metageneration_match=stored.metageneration,
+                        timeout=30,
+                    )
+            # Failed preconditions (412) and missing objects (404) are kept
+            # as responses instead of being raised
+            deleted += sum(200 <= response.status_code < 300 for response in batch._responses)
+        return deleted
+
+    def exists(self, name):
+        return self.bucket.blob(name).exists(timeout=30)
+
+    def stat(self, name):
+        """Return the StoredObject for a name, or None if it does not exist"""
+        blob = self.bucket.get_blob(name, timeout=30)
+        return self._stored_object(blob) if blob else None
+
+    def touch(self, name):
+        """Bump an object's updated time (a metadata patch) without rewriting it"""
+        blob = self.bucket.blob(name)
+        blob.metadata = {"last-used": datetime.now(timezone.utc).isoformat()}
+        blob.patch(timeout=30)
+
+    def list_objects(self, prefix="", page_size=1000):
+        """Yield StoredObjects under a prefix, fetching one page at a time"""
+        for blob in self.bucket.list_blobs(prefix=prefix, page_size=page_size, timeout=30):
+            yield self._stored_object(blob)
+
+    @staticmethod
+    def _stored_object(blob):
+        return StoredObject(blob.name, blob.size, blob.updated, blob.generation, blob.metageneration)
+
+    def public_url(self, name):
+        return f"https://storage.googleapis.com/{self.bucket_name}/{name}"
+
+    def serve(self, name):
+        """Response for GET /media/<name>: objects are public on GCS"""
+        return redirect(self.public_url(name), code=301)
+
+
+class LocalStorage:
+    """
+    Objects as files under a local directory
+
+    Files are served at `base_url` by the /media route. With `accel_prefix`
+    set, the route only answers with an X-Accel-Redirect header and nginx
+    sends the file from its internal location at that prefix (with
+    sendfile), so no worker is tied up streaming images.
+    """
+
+    name = "local"
+
+    def __init__(self, root, base_url="/media", accel_prefix=None):
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip("/")
+        self.accel_prefix = accel_prefix.rstrip("/") if accel_prefix else None
+
+    def path(self, name):
+        """Filesystem path of an object; names may not leave the root"""
+        path = os.path.abspath(os.path.join(self.root, name))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid object name: {name}")
+        return path
+
+    def upload(self, name, data, content_type=None, cache_control=None):
+        """Write an object; readers never see a partly written file"""
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".upload-")
+        try:
+            with os.fdopen(handle, "wb") as output:
+                output.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    def delete(self, name):
+        """Delete an object; a missing object is not an error"""
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            pass
+
+    def delete_unchanged(self, objects):
+        """
+        Delete listed objects, each only if its size and modification time
+        still match the listing (checked just before removing it)
+        Args:
+            objects (list): StoredObjects from list_objects() or stat()
+        Returns:
+            int: Objects deleted; changed and missing ones are skipped
+        """
+        deleted = 0
+        for stored in objects:
+            if self.stat(stored.name) == stored:
+                self.delete(stored.name)
+                deleted += 1
+        return deleted
+
+    def exists(self, name):
+        return os.path.isfile(self.path(name))
+
+    def stat(self, name):
+        """Return the StoredObject for a name, or None if it does not exist"""
+        try:
+            stat = os.stat(self.path(name))
+        except FileNotFoundError:
+            return None
+        return StoredObject(name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc))
+
+    def touch(self, name):
+        """Bump an object's modification time without rewriting it"""
+        os.utime(self.path(name))
+
+    def list_objects(self, prefix="", page_size=1000):
+        """Yield StoredObjects under a prefix, in name order"""
+        top = os.path.join(self.root, os.path.dirname(prefix))
+        for directory, subdirectories, filenames in os.walk(top):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                if filename.startswith(".upload-"):
+                    continue
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, "/")
+                if not name.startswith(prefix):
+                    continue
+                stat = os.stat(path)
+                yield StoredObject(
+                    name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+                )
+
+    def public_url(self, name):
+        return f"{self.base_url}/{name}"
+
+    def serve(self, name):
+        """Response for GET /media/<name>"""
+        if self.accel_prefix:
+            self.path(name)  # Reject names outside the root
+            response = current_app.response_class(status=200)
+            response.headers["X-Accel-Redirect"] = f"{self.accel_prefix}/{name}"
+            # Kept by nginx on the file it sends
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            # Let nginx pick the content type from the file extension
+            del response.headers["Content-Type"]
+            return response
+
+        response = send_from_directory(self.root, name, max_age=31536000)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+def init_object_storage(app):
+    """
+    Create the image storage backend for an app and register it in
+    app.extensions; IMAGE_STORAGE selects "gcs" (the default) or "local"
+    """
+    backend_name = app.config.get("IMAGE_STORAGE", "gcs")
+    if backend_name == "local":
+        backend = LocalStorage(
+            app.config.get("LOCAL_STORAGE_ROOT", "media"),
+            base_url=app.config.get("LOCAL_STORAGE_URL", "/media"),
+            accel_prefix=app.config.get("LOCAL_STORAGE_ACCEL_PREFIX"),
+        )
+    else:
+        if backend_name != "gcs":
+            logging.error(f"Unknown IMAGE_STORAGE {backend_name!r}, using GCS")
+        backend = GCSStorage(app.config.get("GCS_BUCKET_NAME"))
+
+    app.extensions["object_storage"] = backend
+    return backend
+
+
+def get_object_storage():
+    """Return the current app's image storage backend"""
+    return current_app.extensions["object_storage"]
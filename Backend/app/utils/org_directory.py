@@ -0,0 +1,278 @@
+# Backend: app/utils/org_directory.py
+import base64
+import binascii
+import json
+from collections import defaultdict
+
+from sqlalchemy import select
+
+from app import db
+from app.models import (
+    OrgProfile,
+    SkillsNeeded,
+    FocusArea,
+    org_skills_connection,
+    org_focus_areas,
+    image_srcsets,
+    public_image_url,
+)
+
+# Scalar columns that can be requested for each organisation card
+ORG_CARD_COLUMNS = {
+    "id": OrgProfile.id,
+    "user_id": OrgProfile.user_id,
+    "org_name": OrgProfile.org_name,
+    "org_overview": OrgProfile.org_overview,
+    "org_logo_filename": OrgProfile.org_logo_filename,
+    "org_images": OrgProfile.org_image_variants.label("org_images"),
+    "org_mission_statement": OrgProfile.org_mission_statement,
+    "org_year_established": OrgProfile.org_year_established,
+    "org_district_town": OrgProfile.org_district_town,
+    "org_county": OrgProfile.org_county,
+}
+
+# Field order of the full organisation card; focus_areas and skills_needed
+# come from the association tables rather than OrgProfile columns
+ORG_CARD_FIELDS = (
+    "id",
+    "user_id",
+    "org_name",
+    "org_overview",
+    "focus_areas",
+    "skills_needed",
+    "org_logo_filename",
+    "org_images",
+    "org_mission_statement",
+    "org_year_established",
+    "org_district_town",
+    "org_county",
+)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def load_focus_areas_by_org(org_ids=None):
+    """
+    Load the focus areas of many organisations in a single query
+    Args:
+        org_ids (list, optional): Restrict the lookup to these organisations
+    Returns:
+        dict: org_id -> list of serialized focus areas
+    """
+    query = (
+        select(
+            org_focus_areas.c.org_id,
+            FocusArea.id,
+            FocusArea.name,
+            FocusArea.description,
+        )
+        .join(FocusArea, FocusArea.id == org_focus_areas.c.focus_area_id)
+        .order_by(org_focus_areas.c.org_id, FocusArea.id)
+    )
+    if org_ids is not None:
+        query = query.where(org_focus_areas.c.org_id.in_(org_ids))
+
+    focus_areas = defaultdict(list)
+    for org_id, area_id, name, description in db.session.execute(query):
+        focus_areas[org_id].append(
+            {"id": area_id, "name": name, "description": description}
+        )
+    return focus_areas
+
+
+def load_skills_by_org(org_ids=None):
+    """
+    Load the skills needed by many organisations in a single query
+    Args:
+        org_ids (list, optional): Restrict the lookup to these organisations
+    Returns:
+        dict: org_id -> list of serialized skills
+    """
+    query = (
+        select(
+            org_skills_connection.c.org_id,
+            SkillsNeeded.id,
+            SkillsNeeded.skill,
+            SkillsNeeded.status,
+        )
+        .join(SkillsNeeded, SkillsNeeded.id == org_skills_connection.c.skill_id)
+        .order_by(org_skills_connection.c.org_id, SkillsNeeded.id)
+    )
+    if org_ids is not None:
+        query = query.where(org_skills_connection.c.org_id.in_(org_ids))
+
+    skills = defaultdict(list)
+    for org_id, skill_id, skill, status in db.session.execute(query):
+        skills[org_id].append({"id": skill_id, "skill": skill, "status": status})
+    return skills
+
+
+def parse_fields(fields_param):
+    """
+    Parse a comma separated ?fields= value into card field names
+    Args:
+        fields_param (str or None): Raw query string value
+    Returns:
+        tuple: Requested field names (always including "id"), in card order
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not fields_param:
+        return ORG_CARD_FIELDS
+
+    requested = {field.strip() for field in fields_param.split(",") if field.strip()}
+    unknown = requested - set(ORG_CARD_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Supported fields: {', '.join(ORG_CARD_FIELDS)}"
+        )
+
+    requested.add("id")
+    return tuple(field for field in ORG_CARD_FIELDS if field in requested)
+
+
+def encode_cursor(last_id):
+    """Encode the id of the last org on a page as an opaque cursor token"""
+    payload = json.dumps({"id": last_id}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor token produced by encode_cursor
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(last_id, int):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+
+def parse_limit(limit_param):
+    """
+    Parse a ?limit= value, clamping it to MAX_PAGE_SIZE
+    Raises:
+        ValueError: If the limit is not a positive integer
+    """
+    if limit_param is None or limit_param == "":
+        return DEFAULT_PAGE_SIZE
+
+    try:
+        limit = int(limit_param)
+    except ValueError:
+        raise ValueError("limit must be a positive integer")
+
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def serialize_org_card(row, fields, focus_areas, skills):
+    """
+    Build the directory payload for one organisation from a projected row
+    Args:
+        row: Row selected with the ORG_CARD_COLUMNS for the requested fields
+        fields (tuple): Card fields to include
+        focus_areas (dict): org_id -> serialized focus areas
+        skills (dict): org_id -> serialized skills
+    Returns:
+        dict: The organisation card data
+    """
+    org_data = {}
+    for field in fields:
+        if field == "focus_areas":
+            org_data[field] = focus_areas.get(row.id, [])
+        elif field == "skills_needed":
+            org_data[field] = skills.get(row.id, [])
+        elif field == "org_logo_filename":
+            org_data[field] = public_image_url(row.org_logo_filename)
+        elif field == "org_images":
+            # Cards only show the logo
+            org_data[field] = {"logo": image_srcsets((row.org_images or {}).get("logo"))}
+        else:
+            org_data[field] = getattr(row, field)
+    return org_data
+
+
+def load_org_cards(fields=ORG_CARD_FIELDS, after_id=None, limit=None):
+    """
+    Load organisation cards using a fixed number of queries (one for the
+    org columns, plus one each for focus areas and skills when requested),
+    regardless of how many organisations exist.
+    Args:
+        fields (tuple): Card fields to include
+        after_id (int, optional): Keyset cursor, only orgs with a larger id
+        limit (int, optional): Maximum number of orgs to return
+    Returns:
+        tuple: (list of serialized cards ordered by id, next cursor or None)
+    """
+    columns = [ORG_CARD_COLUMNS[field] for field in fields if field in ORG_CARD_COLUMNS]
+    query = select(*columns).order_by(OrgProfile.id)
+    if after_id is not None:
+        query = query.where(OrgProfile.id > after_id)
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists
+        query = query.limit(limit + 1)
+
+    rows = db.session.execute(query).all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+
+    if not rows:
+        return [], None
+
+    # A paginated page only needs the links of its own orgs
+    org_ids = [row.id for row in rows] if limit is not None else None
+    focus_areas = load_focus_areas_by_org(org_ids) if "focus_areas" in fields else {}
+    skills = load_skills_by_org(org_ids) if "skills_needed" in fields else {}
+
+    cards = [serialize_org_card(row, fields, focus_areas, skills) for row in rows]
+    return cards, next_cursor
+
+
+def load_org_directory(fields=ORG_CARD_FIELDS):
+    """
+    Load every organisation card (the unpaginated directory)
+    Returns:
+        list: Serialized organisation cards ordered by id
+    """
+    cards, _ = load_org_cards(fields)
+    return cards
+
+
+def load_org_cards_by_ids(org_ids, fields=ORG_CARD_FIELDS):
+    """
+    Load the cards of specific organisations, keeping the given order
+    Args:
+        org_ids (list): Organisation ids, e.g. ranked search results
+        fields (tuple): Card fields to include
+    Returns:
+        list: Serialized organisation cards in `org_ids` order
+    """
+    if not org_ids:
+        return []
+
+    columns = [ORG_CARD_COLUMNS[field] for field in fields if field in ORG_CARD_COLUMNS]
+    rows = {
+        row.id: row
+        for row in db.session.execute(select(*columns).where(OrgProfile.id.in_(org_ids)))
+    }
+    focus_areas = load_focus_areas_by_org(org_ids) if "focus_areas" in fields else {}
+    skills = load_skills_by_org(org_ids) if "skills_needed" in fields else {}
+
+    return [
+        serialize_org_card(rows[org_id], fields, focus_areas, skills)
+        for org_id in org_ids
+        if org_id in rows
+    ]
@@ -0,0 +1,143 @@
+# Backend: app/utils/org_facets.py
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from flask import current_app
+from sqlalchemy import String, func, literal, select, union_all
+
+from app import db
+from app.models import FocusArea, SkillsNeeded, org_focus_areas, org_skills_connection
+from app.utils.org_search import matching_org_ids, search_terms
+
+
+def build_facet_query(query=None, focus_area=None, skill=None, county=None):
+    """
+    Build one grouped query counting organisations per focus area and per skill
+    Returns:
+        Select: Rows of (facet, value, status, count); facet is "focus_area"
+        or "skill" and status is the skill's tech/non-tech status
+
+    Each facet group is counted with every filter except its own applied, so
+    picking a focus area still shows how many orgs the other areas would give.
+    """
+    focus_area_counts = (
+        select(
+            literal("focus_area").label("facet"),
+            FocusArea.name.label("value"),
+            literal(None, String).label("status"),
+            func.count(func.distinct(org_focus_areas.c.org_id)).label("count"),
+        )
+        .join(FocusArea, FocusArea.id == org_focus_areas.c.focus_area_id)
+        .where(org_focus_areas.c.org_id.in_(matching_org_ids(query, None, skill, county)))
+        .group_by(FocusArea.name)
+    )
+    skill_counts = (
+        select(
+            literal("skill").label("facet"),
+            SkillsNeeded.skill.label("value"),
+            SkillsNeeded.status.label("status"),
+            func.count(func.distinct(org_skills_connection.c.org_id)).label("count"),
+        )
+        .join(SkillsNeeded, SkillsNeeded.id == org_skills_connection.c.skill_id)
+        .where(org_skills_connection.c.org_id.in_(matching_org_ids(query, focus_area, None, county)))
+        .group_by(SkillsNeeded.skill, SkillsNeeded.status)
+    )
+    return union_all(focus_area_counts, skill_counts)
+
+
+def load_facet_counts(query=None, focus_area=None, skill=None, county=None):
+    """
+    Count organisations per facet for a filter set
+    Returns:
+        dict: {"focus_areas": [{"name", "count"}], "skills": {"tech": [...],
+        "non-tech": [...]}} with each list ordered by count, then name
+    """
+    facets = {"focus_areas": [], "skills": {"tech": [], "non-tech": []}}
+    rows = db.session.execute(build_facet_query(query, focus_area, skill, county))
+    for facet, value, status, count in rows:
+        if facet == "focus_area":
+            facets["focus_areas"].append({"name": value, "count": count})
+        else:
+            facets["skills"].setdefault(status, []).append({"name": value, "count": count})
+
+    def by_count(items):
+        return sorted(items, key=lambda item: (-item["count"], item["name"]))
+
+    facets["focus_areas"] = by_count(facets["focus_areas"])
+    facets["skills"] = {status: by_count(items) for status, items in facets["skills"].items()}
+    return facets
+
+
+class FacetCache:
+    """
+    Per-worker cache of facet counts keyed by filter set
+
+    The profile routes clear it when an org's focus areas, skills or
+    searchable fields change. Other workers' copies expire after `ttl`
+    seconds.
+    """
+
+    def __init__(self, max_size=500, ttl=60, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = Counter()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query=None, focus_area=None, skill=None, county=None):
+        return (tuple(search_terms(query)), focus_area, skill, county.lower() if county else None)
+
+    def get_or_load(self, query=None, focus_area=None, skill=None, county=None):
+        """Return cached counts for a filter set, loading them on a miss"""
+        key = self.key(query, focus_area, skill, county)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+            generation = self._generation
+
+        facets = load_facet_counts(query, focus_area, skill, county)
+        with self._lock:
+            # Counts loaded across an invalidation may already be stale
+            if generation != self._generation:
+                return facets
+            self._entries[key] = (self.clock() + self.ttl, facets)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return facets
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.stats["invalidations"] += 1
+
+
+def init_facet_cache(app):
+    """Create the facet count cache for an app and register it in app.extensions"""
+    cache = FacetCache(
+        max_size=app.config.get("FACET_CACHE_SIZE", 500),
+        ttl=app.config.get("FACET_CACHE_TTL", 60),
+    )
+    app.extensions["facet_cache"] = cache
+    return cache
+
+
+def get_facet_cache():
+    """Return the current app's facet count cache"""
+    return current_app.extensions["facet_cache"]
+
+
+def invalidate_org_facets():
+    """Drop cached facet counts after an org's focus areas, skills or county changed"""
+    cache = current_app.extensions.get("facet_cache")
+    if cache is not None:
+        cache.invalidate()
@@ -0,0 +1,105 @@
+# Backend: app/utils/org_onboarding.py
+from sqlalchemy import insert
+
+from app import db
+from app.models import OrgInitiatives, OrgProjects, org_skills_connection
+from app.utils.skill_resolver import resolve_skill_ids, support_need_pairs
+
+
+def onboarding_rows(org_id, data):
+    """
+    Turn one onboarding payload into plain row dicts
+    Args:
+        org_id (int): The organisation profile id
+        data (dict): The /profile/org/projects_initiatives request body
+    Returns:
+        tuple: (project rows, initiative rows, support needs as
+        (skill, status, description) tuples)
+    """
+    projects = [
+        {
+            "org_id": org_id,
+            "project_name": project["projectName"],
+            "project_description": project["description"],
+            "project_status": status,
+        }
+        for key, status in (("ongoingProjects", "ongoing"), ("previousProjects", "completed"))
+        for project in data.get(key) or []
+    ]
+    initiatives = [
+        {
+            "org_id": org_id,
+            "initiative_name": initiative["initiativeName"],
+            "initiative_description": initiative["description"],
+        }
+        for initiative in data.get("programInitiatives") or []
+    ]
+    return projects, initiatives, support_need_pairs(data.get("supportNeeds"))
+
+
+def _insert_rows(model, rows):
+    """
+    Insert many rows of a model in one statement
+    Returns:
+        list: The new ids (not necessarily in row order; asking for that
+        makes SQLite fall back to one INSERT per row), or None when the
+        backend cannot return them from a batched insert
+    """
+    if not rows:
+        return []
+
+    if db.engine.dialect.insert_executemany_returning:
+        # Batched into multi-row INSERT ... VALUES ... RETURNING id
+        statement = insert(model).returning(model.id)
+        return list(db.session.execute(statement, rows).scalars())
+
+    db.session.execute(insert(model), rows)
+    return None
+
+
+def store_onboarding_content(payloads):
+    """
+    Store the projects, initiatives and skill needs of many organisations
+    Args:
+        payloads (iterable): (org_id, onboarding request body) pairs
+    Returns:
+        dict: "project_ids" and "initiative_ids" (None when the backend
+        cannot return ids) and the number of "skill_links" created
+
+    Runs a fixed number of statements however many organisations and rows
+    are passed: one skill resolution, then one batched INSERT per table.
+    Nothing is committed; the caller owns the transaction.
+    """
+    projects, initiatives, links = [], [], {}
+    needs_by_org = []
+
+    for org_id, data in payloads:
+        org_projects, org_initiatives, needs = onboarding_rows(org_id, data)
+        projects.extend(org_projects)
+        initiatives.extend(org_initiatives)
+        needs_by_org.append((org_id, needs))
+
+    skill_ids = resolve_skill_ids(
+        (skill, status) for _, needs in needs_by_org for skill, status, _ in needs
+    )
+    for org_id, needs in needs_by_org:
+        for skill, status, description in needs:
+            # A skill listed twice keeps its first description
+            links.setdefault((org_id, skill_ids[(skill, status)]), description)
+
+    project_ids = _insert_rows(OrgProjects, projects)
+    initiative_ids = _insert_rows(OrgInitiatives, initiatives)
+    if links:
+        db.session.execute(
+            org_skills_connection.insert(),
+            [
+                {"org_id": org_id, "skill_id": skill_id, "description": description}
+                for (org_id, skill_id), description in links.items()
+            ],
+        )
+
+    return {
+        "project_ids": project_ids,
+        "initiative_ids": initiative_ids,
+        "skill_links": len(links),
+    }
@@ -0,0 +1,331 @@
+# Backend: app/utils/org_search.py
+import logging
+import re
+
+from flask import current_app
+from sqlalchemy import Float, Integer, bindparam, func, literal, select, text
+
+from app import db
+from app.models import (
+    FocusArea,
+    OrgProfile,
+    SkillsNeeded,
+    org_focus_areas,
+    org_skills_connection,
+)
+
+# Words are letters/digits; everything else in a query is ignored, which
+# also keeps user input out of the FTS5 / tsquery syntax
+SEARCH_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+MAX_SEARCH_TERMS = 10
+
+
+def search_terms(query):
+    """Split a search box query into lower-cased words"""
+    return SEARCH_TERM_PATTERN.findall((query or "").lower())[:MAX_SEARCH_TERMS]
+
+
+class OrgSearchBackend:
+    """
+    Full-text index over each organisation's name, overview, mission
+    statement and the names of its focus areas and skills
+
+    Documents are stored in the database, so every worker sees the same
+    index; routes call refresh_org_search() after committing a change.
+    Subclasses provide the dialect specific storage and ranking.
+    """
+
+    name = None
+
+    def ensure_schema(self):
+        """Create the index storage if it does not exist"""
+        raise NotImplementedError
+
+    def index_orgs(self, org_ids):
+        """(Re)build the documents of the given organisations"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove every document"""
+        raise NotImplementedError
+
+    def document_count(self):
+        raise NotImplementedError
+
+    def match_query(self, terms):
+        """
+        Returns:
+            Subquery: (org_id, score) for the documents matching every term,
+            higher scores being more relevant
+        """
+        raise NotImplementedError
+
+    def rebuild(self, batch_size=1000):
+        """Re-index every organisation, `batch_size` orgs per statement"""
+        self.clear()
+        org_ids = db.session.execute(select(OrgProfile.id)).scalars().all()
+        for start in range(0, len(org_ids), batch_size):
+            self.index_orgs(org_ids[start:start + batch_size])
+
+    def is_complete(self):
+        """Whether every organisation has a document"""
+        org_count = db.session.execute(select(func.count(OrgProfile.id))).scalar()
+        return self.document_count() == org_count
+
+
+class PostgresOrgSearch(OrgSearchBackend):
+    """tsvector documents in org_search_documents behind a GIN index"""
+
+    name = "postgresql"
+
+    def ensure_schema(self):
+        db.session.execute(text(
+            "CREATE TABLE IF NOT EXISTS org_search_documents ("
+            " org_id INTEGER PRIMARY KEY REFERENCES org_profile (id) ON DELETE CASCADE,"
+            " document TSVECTOR NOT NULL)"
+        ))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_org_search_documents_document"
+            " ON org_search_documents USING gin (document)"
+        ))
+
+    def index_orgs(self, org_ids):
+        # Name outranks focus areas and skills, which outrank free text
+        statement = text("""
+            INSERT INTO org_search_documents (org_id, document)
+            SELECT o.id,
+                setweight(to_tsvector('english', coalesce(o.org_name, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(fa.names, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(sk.names, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(o.org_overview, '')), 'C')
+                || setweight(to_tsvector('english', coalesce(o.org_mission_statement, '')), 'C')
+            FROM org_profile o
+            LEFT JOIN (
+                SELECT ofa.org_id, string_agg(f.name, ' ') AS names
+                FROM org_focus_areas ofa JOIN focus_area f ON f.id = ofa.focus_area_id
+                WHERE ofa.org_id IN :org_ids
+                GROUP BY ofa.org_id
+            ) fa ON fa.org_id = o.id
+            LEFT JOIN (
+                SELECT os.org_id, string_agg(s.skill, ' ') AS names
+                FROM org_skills os JOIN skills_needed s ON s.id = os.skill_id
+                WHERE os.org_id IN :org_ids
+                GROUP BY os.org_id
+            ) sk ON sk.org_id = o.id
+            WHERE o.id IN :org_ids
+            ON CONFLICT (org_id) DO UPDATE SET document = EXCLUDED.document
+        """).bindparams(bindparam("org_ids", expanding=True))
+        db.session.execute(statement, {"org_ids": list(org_ids)})
+
+    def clear(self):
+        db.session.execute(text("DELETE FROM org_search_documents"))
+
+    def document_count(self):
+        return db.session.execute(text("SELECT count(*) FROM org_search_documents")).scalar()
+
+    def match_query(self, terms):
+        # Prefix match every term so results appear while the user types
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return (
+            text("""
+                SELECT org_id, ts_rank_cd(document, to_tsquery('english', :tsquery)) AS score
+                FROM org_search_documents
+                WHERE document @@ to_tsquery('english', :tsquery)
+            """)
+            .bindparams(tsquery=tsquery)
+            .columns(org_id=Integer, score=Float)
+            .subquery("matches")
+        )
+
+
+class SqliteOrgSearch(OrgSearchBackend):
+    """FTS5 virtual table keyed by org id, for local development"""
+
+    name = "sqlite"
+
+    # bm25 column weights, in org_search_fts column order
+    COLUMN_WEIGHTS = (10.0, 4.0, 4.0, 1.0, 1.0)
+
+    def ensure_schema(self):
+        db.session.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS org_search_fts USING fts5("
+            " org_name, focus_areas, skills, org_overview, org_mission_statement,"
+            " tokenize = 'porter unicode61')"
+        ))
+
+    def index_orgs(self, org_ids):
+        org_ids = list(org_ids)
+        delete = text("DELETE FROM org_search_fts WHERE rowid IN :org_ids").bindparams(
+            bindparam("org_ids", expanding=True)
+        )
+        insert = text("""
+            INSERT INTO org_search_fts
+                (rowid, org_name, focus_areas, skills, org_overview, org_mission_statement)
+            SELECT o.id, o.org_name,
+                (SELECT group_concat(f.name, ' ')
+                 FROM org_focus_areas ofa JOIN focus_area f ON f.id = ofa.focus_area_id
+                 WHERE ofa.org_id = o.id),
+                (SELECT group_concat(s.skill, ' ')
+                 FROM org_skills os JOIN skills_needed s ON s.id = os.skill_id
+                 WHERE os.org_id = o.id),
+                o.org_overview, o.org_mission_statement
+            FROM org_profile o
+            WHERE o.id IN :org_ids
+        """).bindparams(bindparam("org_ids", expanding=True))
+        db.session.execute(delete, {"org_ids": org_ids})
+        db.session.execute(insert, {"org_ids": org_ids})
+
+    def clear(self):
+        db.session.execute(text("DELETE FROM org_search_fts"))
+
+    def document_count(self):
+        return db.session.execute(text("SELECT count(*) FROM org_search_fts")).scalar()
+
+    def match_query(self, terms):
+        fts_query = " ".join(f'"{term}"*' for term in terms)
+        weights = ", ".join(str(weight) for weight in self.COLUMN_WEIGHTS)
+        # bm25() is lower for better matches; negate it so higher is better
+        return (
+            text(f"""
+                SELECT rowid AS org_id, -bm25(org_search_fts, {weights}) AS score
+                FROM org_search_fts
+                WHERE org_search_fts MATCH :fts_query
+            """)
+            .bindparams(fts_query=fts_query)
+            .columns(org_id=Integer, score=Float)
+            .subquery("matches")
+        )
+
+
+SEARCH_BACKENDS = {
+    backend.name: backend for backend in (PostgresOrgSearch, SqliteOrgSearch)
+}
+
+
+def org_filter_conditions(focus_area=None, skill=None, county=None):
+    """
+    Build the WHERE conditions shared by search and facet counts
+    Args:
+        focus_area (str, optional): Only orgs with this focus area name
+        skill (str, optional): Only orgs needing this skill
+        county (str, optional): Only orgs in this county (case-insensitive)
+    Returns:
+        list: Conditions on OrgProfile.id / OrgProfile.org_county
+    """
+    conditions = []
+    if focus_area:
+        conditions.append(
+            OrgProfile.id.in_(
+                select(org_focus_areas.c.org_id)
+                .join(FocusArea, FocusArea.id == org_focus_areas.c.focus_area_id)
+                .where(FocusArea.name == focus_area)
+            )
+        )
+    if skill:
+        conditions.append(
+            OrgProfile.id.in_(
+                select(org_skills_connection.c.org_id)
+                .join(SkillsNeeded, SkillsNeeded.id == org_skills_connection.c.skill_id)
+                .where(SkillsNeeded.skill == skill)
+            )
+        )
+    if county:
+        conditions.append(func.lower(OrgProfile.org_county) == county.lower())
+    return conditions
+
+
+def matching_org_ids(query=None, focus_area=None, skill=None, county=None):
+    """
+    Returns:
+        Select: The ids of every organisation matching the search words and
+        filters, unranked
+    """
+    statement = select(OrgProfile.id)
+    terms = search_terms(query)
+    if terms:
+        matches = get_org_search().match_query(terms)
+        statement = statement.join(matches, matches.c.org_id == OrgProfile.id)
+    return statement.where(*org_filter_conditions(focus_area, skill, county))
+
+
+def search_orgs(query=None, focus_area=None, skill=None, county=None, limit=20, offset=0):
+    """
+    Rank organisations for a search box query and optional filters
+    Args:
+        query (str, optional): Free text; every word must match (by prefix)
+        focus_area (str, optional): Only orgs with this focus area name
+        skill (str, optional): Only orgs needing this skill
+        county (str, optional): Only orgs in this county (case-insensitive)
+        limit (int): Page size
+        offset (int): Results to skip
+    Returns:
+        list: (org_id, score) pairs, best first. Without search words every
+        org passing the filters is returned by name with a score of None.
+    """
+    terms = search_terms(query)
+
+    if terms:
+        matches = get_org_search().match_query(terms)
+        statement = (
+            select(OrgProfile.id, matches.c.score)
+            .join(matches, matches.c.org_id == OrgProfile.id)
+            .order_by(matches.c.score.desc(), OrgProfile.id)
+        )
+    else:
+        statement = select(OrgProfile.id, literal(None).label("score")).order_by(
+            OrgProfile.org_name, OrgProfile.id
+        )
+
+    statement = statement.where(*org_filter_conditions(focus_area, skill, county))
+
+    rows = db.session.execute(statement.limit(limit).offset(offset)).all()
+    return [(org_id, None if score is None else float(score)) for org_id, score in rows]
+
+
+def init_org_search(app):
+    """
+    Pick the search backend for the app's database, create its storage and
+    index any organisations without a document
+    """
+    with app.app_context():
+        backend_class = SEARCH_BACKENDS.get(db.engine.dialect.name)
+        if backend_class is None:
+            app.logger.warning(f"Org search is not supported on {db.engine.dialect.name}")
+            return None
+
+        backend = backend_class()
+        app.extensions["org_search"] = backend
+        try:
+            backend.ensure_schema()
+            if not backend.is_complete():
+                backend.rebuild()
+            db.session.commit()
+            app.logger.info("Org search index ready")
+        except Exception as e:
+            # Documents are rebuilt on the next successful startup
+            db.session.rollback()
+            app.logger.error(f"Failed to prepare org search index: {str(e)}")
+
+    return backend
+
+
+def get_org_search():
+    """Return the current app's search backend"""
+    backend = current_app.extensions.get("org_search")
+    if backend is None:
+        raise RuntimeError("Org search is not available for this database")
+    return backend
+
+
+def refresh_org_search(org_id):
+    """Re-index one organisation after its profile, focus areas or skills were committed"""
+    backend = current_app.extensions.get("org_search")
+    if backend is None:
+        return
+
+    try:
+        backend.index_orgs([org_id])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Failed to refresh search document for org {org_id}: {str(e)}")
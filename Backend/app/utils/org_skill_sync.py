@@ -0,0 +1,110 @@
+# Backend: app/utils/org_skill_sync.py
+from collections import namedtuple
+
+from sqlalchemy import bindparam, select
+
+from app import db
+from app.models import SkillsNeeded, org_skills_connection
+from app.utils.skill_resolver import resolve_skill_ids
+
+# Skill ids grouped by what a save does to them
+SkillDiff = namedtuple("SkillDiff", ["added", "removed", "changed", "unchanged"])
+
+
+def diff_org_skills(current, desired):
+    """
+    Compare an organisation's stored skills with the ones it should have
+    Args:
+        current (dict): skill_id -> description of the stored org_skills rows
+        desired (dict): skill_id -> description after the save
+    Returns:
+        SkillDiff: Sorted skill id lists; "changed" holds kept skills whose
+        description differs
+    """
+    kept = current.keys() & desired.keys()
+    return SkillDiff(
+        added=sorted(desired.keys() - current.keys()),
+        removed=sorted(current.keys() - desired.keys()),
+        changed=sorted(skill_id for skill_id in kept if current[skill_id] != desired[skill_id]),
+        unchanged=sorted(skill_id for skill_id in kept if current[skill_id] == desired[skill_id]),
+    )
+
+
+def apply_org_skill_diff(org_id, diff, desired):
+    """
+    Write a SkillDiff with at most three statements: one DELETE ... IN, one
+    executemany INSERT and one executemany UPDATE. Nothing is committed.
+    """
+    if diff.removed:
+        db.session.execute(
+            org_skills_connection.delete().where(
+                org_skills_connection.c.org_id == org_id,
+                org_skills_connection.c.skill_id.in_(diff.removed),
+            )
+        )
+
+    if diff.added:
+        db.session.execute(
+            org_skills_connection.insert(),
+            [
+                {"org_id": org_id, "skill_id": skill_id, "description": desired[skill_id]}
+                for skill_id in diff.added
+            ],
+        )
+
+    if diff.changed:
+        db.session.execute(
+            org_skills_connection.update()
+            .where(
+                org_skills_connection.c.org_id == bindparam("b_org_id"),
+                org_skills_connection.c.skill_id == bindparam("b_skill_id"),
+            )
+            .values(description=bindparam("b_description")),
+            [
+                {"b_org_id": org_id, "b_skill_id": skill_id, "b_description": desired[skill_id]}
+                for skill_id in diff.changed
+            ],
+        )
+
+
+def sync_org_skills(org_id, skill_items):
+    """
+    Make an organisation's org_skills rows match the skills it keeps
+    Args:
+        org_id (int): The organisation profile id
+        skill_items (list): {"skill", "status", "description"} dicts for the
+            skills the org should have afterwards; any other stored skill
+            is removed
+    Returns:
+        tuple: (SkillDiff, dict of skill_id -> {"id", "skill", "status",
+        "description"} covering both the old and the new skills)
+    """
+    rows = db.session.execute(
+        select(
+            SkillsNeeded.id,
+            SkillsNeeded.skill,
+            SkillsNeeded.status,
+            org_skills_connection.c.description,
+        )
+        .join(org_skills_connection, org_skills_connection.c.skill_id == SkillsNeeded.id)
+        .where(org_skills_connection.c.org_id == org_id)
+    ).all()
+    skills = {row.id: row._asdict() for row in rows}
+    current = {row.id: row.description for row in rows}
+
+    skill_ids = resolve_skill_ids((item["skill"], item["status"]) for item in skill_items)
+    desired = {}
+    for item in skill_items:
+        skill_id = skill_ids[(item["skill"], item["status"])]
+        # A skill listed twice keeps its last description, as saves always have
+        desired[skill_id] = item.get("description", "")
+        skills[skill_id] = {
+            "id": skill_id,
+            "skill": item["skill"],
+            "status": item["status"],
+            "description": desired[skill_id],
+        }
+
+    diff = diff_org_skills(current, desired)
+    apply_org_skill_diff(org_id, diff, desired)
+    return diff, skills
@@ -0,0 +1,299 @@
+# Backend: app/utils/response_cache.py
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, defaultdict
+from functools import wraps
+
+from flask import Response, current_app, request
+
+from app.utils.http_cache import is_not_modified
+
+# Response headers kept with a cached body
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+# Scope of the /main/orgs responses; each org's /profile/load_org
+# responses use org_profile_scope(user_id)
+ORG_DIRECTORY_SCOPE = "org_directory"
+
+
+# Generation of a scope that was never invalidated (or whose token expired)
+DEFAULT_GENERATION = "0"
+
+
+def org_profile_scope(user_id):
+    return f"org_profile:{user_id}"
+
+
+def request_org_profile_scope():
+    """
+    Scope of a /profile/load_org request, or None (not cached) when its
+    user_id is not a valid id, so arbitrary values cannot fill the cache
+    """
+    user_id = request.args.get("user_id", type=int)
+    return org_profile_scope(user_id) if user_id is not None else None
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU store, the default backend
+
+    Entries expire after their TTL and are evicted least recently used first
+    once there are more than `max_size`. Each worker has its own copy, so
+    invalidations only reach the worker that handled the write.
+    """
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, max_size=1000, clock=time.monotonic):
+        self.max_size = max_size
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Store shared by every worker, on a Redis server or anything speaking
+    its GET / SET EX commands
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client, prefix="gohub:response:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url):
+        # Only needed when RESPONSE_CACHE_URL is set
+        import redis
+
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+
+class ResponseCache:
+    """
+    Cache of whole GET responses, keyed by endpoint and arguments
+
+    Every key includes the current generation of the route's scope, so
+    invalidating a scope means storing a new generation token: old entries
+    are never read again and expire on their own. Only invalidations store
+    a token (scopes that were never invalidated use DEFAULT_GENERATION), and
+    tokens expire after two entry TTLs, when every entry cached under the
+    previous token is gone. With the Redis backend generations are shared,
+    so a write in one worker invalidates all of them; the per-worker memory
+    backend keeps entries for `local_ttl` seconds instead of `ttl`, so other
+    workers serve a stale response for at most that long.
+    """
+
+    def __init__(self, backend, ttl=300, local_ttl=10):
+        self.backend = backend
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.stats = defaultdict(Counter)
+        self._stats_lock = threading.Lock()
+
+    @property
+    def entry_ttl(self):
+        """Seconds a cached response is kept on this cache's backend"""
+        return self.ttl if self.backend.shared else self.local_ttl
+
+    def record(self, endpoint, name):
+        with self._stats_lock:
+            self.stats[endpoint][name] += 1
+
+    def generation(self, scope):
+        """Return a scope's current generation token"""
+        return self.backend.get(f"generation:{scope}") or DEFAULT_GENERATION
+
+    def invalidate(self, *scopes):
+        for scope in scopes:
+            try:
+                self.backend.set(f"generation:{scope}", uuid.uuid4().hex, ttl=2 * self.entry_ttl)
+                self.record("_all", "invalidations")
+            except Exception as e:
+                logging.error(f"Failed to invalidate cached responses for {scope}: {str(e)}")
+
+    def key(self, endpoint, scope):
+        args = sorted(request.args.items(multi=True))
+        return f"{endpoint}:{self.generation(scope)}:{json.dumps(args)}"
+
+    def load(self, key):
+        payload = self.backend.get(key)
+        if payload is None:
+            return None
+        payload = json.loads(payload)
+        return Response(payload["body"], status=payload["status"], headers=payload["headers"])
+
+    def store(self, key, response):
+        payload = {
+            "status": response.status_code,
+            "body": response.get_data(as_text=True),
+            "headers": [
+                (name, response.headers[name]) for name in CACHED_HEADERS if name in response.headers
+            ],
+        }
+        self.backend.set(key, json.dumps(payload), ttl=self.entry_ttl)
+
+    def snapshot(self):
+        """Return the hit/miss counters and hit rate of each cached endpoint"""
+        with self._stats_lock:
+            stats = {endpoint: dict(counts) for endpoint, counts in self.stats.items()}
+
+        endpoints = {}
+        for endpoint, counts in stats.items():
+            if endpoint == "_all":
+                continue
+            lookups = counts.get("hits", 0) + counts.get("misses", 0)
+            endpoints[endpoint] = {
+                "hits": counts.get("hits", 0),
+                "misses": counts.get("misses", 0),
+                "errors": counts.get("errors", 0),
+                "hit_rate": round(counts.get("hits", 0) / lookups, 4) if lookups else None,
+            }
+
+        return {
+            "backend": self.backend.name,
+            "ttl": self.entry_ttl,
+            "invalidations": stats.get("_all", {}).get("invalidations", 0),
+            "endpoints": endpoints,
+        }
+
+
+def not_modified(response):
+    """A 304 carrying a cached response's validators"""
+    return Response(status=304, headers=[
+        (name, response.headers[name])
+        for name in ("ETag", "Last-Modified", "Cache-Control")
+        if name in response.headers
+    ])
+
+
+def cached_response(scope, shared_only=False):
+    """
+    Cache a GET route's 200 responses in the app's response cache
+    Args:
+        scope (str or callable): Invalidation scope of the route, or a
+            function of the request returning it (e.g. per organisation);
+            a function returning None leaves that request uncached
+        shared_only (bool): Only cache with a backend shared by every
+            worker, for responses that must reflect a write at once
+
+    Conditional requests are answered from the cached ETag, so a hit never
+    touches the database. The X-Cache header says whether it was a hit.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions.get("response_cache")
+            if cache is None or (shared_only and not cache.backend.shared):
+                return view(*args, **kwargs)
+
+            route_scope = scope() if callable(scope) else scope
+            if route_scope is None:
+                return view(*args, **kwargs)
+
+            endpoint = request.endpoint
+            try:
+                key = cache.key(endpoint, route_scope)
+                response = cache.load(key)
+            except Exception as e:
+                # A broken cache must not break the route
+                logging.error(f"Response cache lookup failed for {endpoint}: {str(e)}")
+                cache.record(endpoint, "errors")
+                return view(*args, **kwargs)
+
+            if response is not None:
+                cache.record(endpoint, "hits")
+                etag, _ = response.get_etag()
+                if etag and is_not_modified(etag, response.last_modified):
+                    response = not_modified(response)
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+            cache.record(endpoint, "misses")
+            response = current_app.make_response(view(*args, **kwargs))
+            # 304s have no body to cache; the next full GET fills the entry
+            if response.status_code == 200:
+                try:
+                    cache.store(key, response)
+                except Exception as e:
+                    logging.error(f"Failed to cache response for {endpoint}: {str(e)}")
+                    cache.record(endpoint, "errors")
+            response.headers["X-Cache"] = "MISS"
+            return response
+
+        return wrapper
+    return decorator
+
+
+def init_response_cache(app):
+    """
+    Create the response cache for an app and register it in app.extensions;
+    RESPONSE_CACHE_URL selects a Redis server, otherwise responses are kept
+    in each worker's memory for RESPONSE_CACHE_LOCAL_TTL seconds
+    """
+    backend = None
+    url = app.config.get("RESPONSE_CACHE_URL")
+    if url:
+        try:
+            backend = RedisCacheBackend.from_url(url)
+        except Exception as e:
+            app.logger.error(f"Failed to connect the response cache to Redis: {str(e)}")
+
+    if backend is None:
+        backend = MemoryCacheBackend(max_size=app.config.get("RESPONSE_CACHE_SIZE", 1000))
+
+    cache = ResponseCache(
+        backend,
+        ttl=app.config.get("RESPONSE_CACHE_TTL", 300),
+        local_ttl=app.config.get("RESPONSE_CACHE_LOCAL_TTL", 10),
+    )
+    app.extensions["response_cache"] = cache
+    return cache
+
+
+def get_response_cache():
+    """Return the current app's response cache"""
+    return current_app.extensions["response_cache"]
+
+
+def invalidate_org_responses(user_id):
+    """Drop the cached directory and an org's cached profile after it changed"""
+    cache = current_app.extensions.get("response_cache")
+    if cache is not None:
+        cache.invalidate(ORG_DIRECTORY_SCOPE, org_profile_scope(user_id))
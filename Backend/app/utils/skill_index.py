@@ -0,0 +1,384 @@
+# Backend: app/utils/skill_index.py
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict, namedtuple
+
+from flask import current_app
+from sqlalchemy import select
+
+from app import db
+from app.models import org_skills_connection, user_skills
+
+# A ranked match answered from the index
+IndexMatch = namedtuple("IndexMatch", ["org_id", "matched_skills", "org_skill_count", "score"])
+
+
+def _to_bitset(positions):
+    """Pack bit positions into an int with each of those bits set"""
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    return bits
+
+
+def _from_bitset(bits):
+    """Unpack an int bitset back into a sorted list of bit positions"""
+    positions = []
+    while bits:
+        low_bit = bits & -bits
+        positions.append(low_bit.bit_length() - 1)
+        bits ^= low_bit
+    return positions
+
+
+class SkillIndex:
+    """
+    In-process inverted index over the org_skills and user_skills tables
+
+    - skill_id -> sorted array of the org ids needing that skill
+    - org_id -> bitset of the skills the org needs
+    - user_id -> bitset of a volunteer's skills
+
+    Bitsets are indexed by a dense position per skill (assigned at build
+    time, new skills get the next one), so their size follows the number of
+    skills in use rather than the largest skill id.
+
+    The index is built once at startup and kept current by the profile
+    routes calling refresh_org / refresh_user after they commit. Each
+    gunicorn worker holds its own copy, so writes made through another
+    worker are picked up when the index is older than `max_age` seconds.
+
+    Only one thread rebuilds at a time. Refreshes that land while a build
+    is reading the database bump `generation` and are re-applied to the
+    new snapshot, so the swap never brings back older skills.
+    """
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        self.built_at = None
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        # (kind, id) -> skill ids set while a build is running, else None
+        self._changes_during_build = None
+        self._orgs_by_skill = {}
+        self._org_skills = {}
+        self._user_skills = {}
+        # skill_id -> bit position, and position -> skill_id
+        self._positions = {}
+        self._skill_ids = []
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    @property
+    def is_stale(self):
+        return (
+            self.max_age is not None
+            and self.built_at is not None
+            and time.monotonic() - self.built_at > self.max_age
+        )
+
+    def build(self, blocking=True, force=True):
+        """
+        (Re)build the whole index from the database
+        Args:
+            blocking (bool): Wait for a build running in another thread;
+                otherwise return at once and keep serving the current index
+            force (bool): Rebuild even if another thread just made the index
+                ready and fresh while this one waited
+        Returns:
+            bool: False if another thread was building and blocking is False
+        """
+        if not self._build_lock.acquire(blocking=blocking):
+            return False
+        try:
+            if not force and self.is_ready and not self.is_stale:
+                return True
+
+            with self._lock:
+                start_generation = self.generation
+                self._changes_during_build = {}
+
+            org_links = db.session.execute(
+                select(org_skills_connection.c.org_id, org_skills_connection.c.skill_id)
+            ).all()
+            user_links = db.session.execute(
+                select(user_skills.c.user_id, user_skills.c.skill_id)
+            ).all()
+
+            orgs_by_skill = defaultdict(list)
+            org_skills = defaultdict(set)
+            for org_id, skill_id in org_links:
+                orgs_by_skill[skill_id].append(org_id)
+                org_skills[org_id].add(skill_id)
+
+            user_skill_sets = defaultdict(set)
+            for user_id, skill_id in user_links:
+                user_skill_sets[user_id].add(skill_id)
+
+            skill_ids = sorted(set(orgs_by_skill).union(*user_skill_sets.values()))
+            positions = {skill_id: position for position, skill_id in enumerate(skill_ids)}
+
+            with self._lock:
+                changes, self._changes_during_build = self._changes_during_build, None
+                self._positions = positions
+                self._skill_ids = skill_ids
+                self._orgs_by_skill = {
+                    skill_id: array("l", sorted(org_ids))
+                    for skill_id, org_ids in orgs_by_skill.items()
+                }
+                self._org_skills = {
+                    org_id: self._to_bits(org_skill_ids) for org_id, org_skill_ids in org_skills.items()
+                }
+                self._user_skills = {
+                    user_id: self._to_bits(user_skill_ids)
+                    for user_id, user_skill_ids in user_skill_sets.items()
+                }
+
+                # Refreshes read the database after their commit, so they are
+                # at least as new as what this build read
+                if self.generation != start_generation:
+                    for (kind, item_id), skill_ids in changes.items():
+                        if kind == "org":
+                            self._apply_org_skills(item_id, skill_ids)
+                        else:
+                            self._apply_user_skills(item_id, skill_ids)
+
+                self.built_at = time.monotonic()
+            return True
+        except Exception:
+            with self._lock:
+                self._changes_during_build = None
+            raise
+        finally:
+            self._build_lock.release()
+
+    def _to_bits(self, skill_ids):
+        """Pack skill ids into a bitset, giving unseen skills the next position"""
+        positions = []
+        for skill_id in skill_ids:
+            position = self._positions.get(skill_id)
+            if position is None:
+                position = self._positions[skill_id] = len(self._skill_ids)
+                self._skill_ids.append(skill_id)
+            positions.append(position)
+        return _to_bitset(positions)
+
+    def _from_bits(self, bits):
+        """Unpack a bitset into the skill ids it holds"""
+        return [self._skill_ids[position] for position in _from_bitset(bits)]
+
+    def _record_change(self, kind, item_id, skill_ids):
+        """Bump the generation and remember the change for a running build"""
+        self.generation += 1
+        if self._changes_during_build is not None:
+            self._changes_during_build[(kind, item_id)] = list(skill_ids)
+
+    def set_org_skills(self, org_id, skill_ids):
+        """Replace the indexed skills of one organisation"""
+        with self._lock:
+            self._record_change("org", org_id, skill_ids)
+            self._apply_org_skills(org_id, skill_ids)
+
+    def _apply_org_skills(self, org_id, skill_ids):
+        with self._lock:
+            new_bits = self._to_bits(skill_ids)
+            old_bits = self._org_skills.get(org_id, 0)
+
+            for skill_id in self._from_bits(old_bits & ~new_bits):
+                org_ids = self._orgs_by_skill.get(skill_id)
+                if org_ids is None:
+                    continue
+                position = bisect_left(org_ids, org_id)
+                if position < len(org_ids) and org_ids[position] == org_id:
+                    del org_ids[position]
+                if not org_ids:
+                    del self._orgs_by_skill[skill_id]
+
+            for skill_id in self._from_bits(new_bits & ~old_bits):
+                insort(self._orgs_by_skill.setdefault(skill_id, array("l")), org_id)
+
+            if new_bits:
+                self._org_skills[org_id] = new_bits
+            else:
+                self._org_skills.pop(org_id, None)
+
+    def set_user_skills(self, user_id, skill_ids):
+        """Replace the indexed skills of one volunteer"""
+        with self._lock:
+            self._record_change("user", user_id, skill_ids)
+            self._apply_user_skills(user_id, skill_ids)
+
+    def _apply_user_skills(self, user_id, skill_ids):
+        with self._lock:
+            bits = self._to_bits(skill_ids)
+            if bits:
+                self._user_skills[user_id] = bits
+            else:
+                self._user_skills.pop(user_id, None)
+
+    def refresh_org(self, org_id):
+        """Re-read one organisation's skills from the database"""
+        skill_ids = db.session.execute(
+            select(org_skills_connection.c.skill_id).where(
+                org_skills_connection.c.org_id == org_id
+            )
+        ).scalars().all()
+        self.set_org_skills(org_id, skill_ids)
+
+    def refresh_user(self, user_id):
+        """Re-read one volunteer's skills from the database"""
+        skill_ids = db.session.execute(
+            select(user_skills.c.skill_id).where(user_skills.c.user_id == user_id)
+        ).scalars().all()
+        self.set_user_skills(user_id, skill_ids)
+
+    def match(self, user_id, limit=None):
+        """
+        Rank organisations against a volunteer's indexed skills
+        Args:
+            user_id (int): The volunteer's user id
+            limit (int, optional): Only return the top `limit` organisations
+        Returns:
+            list: IndexMatch tuples ordered like the SQL matching engine
+            (Jaccard score, then matched skill count, then org id)
+        """
+        with self._lock:
+            volunteer_bits = self._user_skills.get(user_id, 0)
+            if not volunteer_bits:
+                return []
+
+            candidate_ids = set()
+            for skill_id in self._from_bits(volunteer_bits):
+                candidate_ids.update(self._orgs_by_skill.get(skill_id, ()))
+
+            volunteer_count = volunteer_bits.bit_count()
+            matches = []
+            for org_id in candidate_ids:
+                org_bits = self._org_skills[org_id]
+                matched = (org_bits & volunteer_bits).bit_count()
+                org_count = org_bits.bit_count()
+                score = matched / (volunteer_count + org_count - matched)
+                matches.append(IndexMatch(org_id, matched, org_count, score))
+
+        matches.sort(key=lambda m: (-m.score, -m.matched_skills, m.org_id))
+        return matches[:limit] if limit is not None else matches
+
+    def check_consistency(self):
+        """
+        Compare the index against the database
+        Returns:
+            dict: (id, skill_id) pairs that are in the database but not the
+            index ("missing") or in the index but not the database
+            ("unexpected"), for both orgs and users. All lists are empty
+            when the index is consistent.
+        """
+        db_org_pairs = set(
+            db.session.execute(
+                select(org_skills_connection.c.org_id, org_skills_connection.c.skill_id)
+            ).tuples()
+        )
+        db_user_pairs = set(
+            db.session.execute(select(user_skills.c.user_id, user_skills.c.skill_id)).tuples()
+        )
+
+        with self._lock:
+            index_org_pairs = {
+                (org_id, skill_id)
+                for org_id, bits in self._org_skills.items()
+                for skill_id in self._from_bits(bits)
+            }
+            inverted_pairs = {
+                (org_id, skill_id)
+                for skill_id, org_ids in self._orgs_by_skill.items()
+                for org_id in org_ids
+            }
+            index_user_pairs = {
+                (user_id, skill_id)
+                for user_id, bits in self._user_skills.items()
+                for skill_id in self._from_bits(bits)
+            }
+
+        return {
+            "orgs": {
+                "missing": sorted(db_org_pairs - index_org_pairs),
+                "unexpected": sorted(index_org_pairs - db_org_pairs),
+                "inverted_mismatch": sorted(index_org_pairs ^ inverted_pairs),
+            },
+            "users": {
+                "missing": sorted(db_user_pairs - index_user_pairs),
+                "unexpected": sorted(index_user_pairs - db_user_pairs),
+            },
+        }
+
+
+def init_skill_index(app):
+    """Build the skill index for an app and register it in app.extensions"""
+    index = SkillIndex(max_age=app.config.get("SKILL_INDEX_MAX_AGE"))
+    app.extensions["skill_index"] = index
+
+    with app.app_context():
+        try:
+            index.build()
+            app.logger.info("Skill index built")
+        except Exception as e:
+            # Matching falls back to SQL until the index can be built
+            db.session.rollback()
+            app.logger.error(f"Failed to build skill index: {str(e)}")
+
+    return index
+
+
+def get_skill_index():
+    """
+    Return the current app's skill index, rebuilding it first if it is stale
+    or was never built. Returns None if the index is unavailable.
+
+    A stale index is rebuilt by one request at a time; the others keep
+    answering from the current snapshot instead of waiting.
+    """
+    index = current_app.extensions.get("skill_index")
+    if index is None:
+        return None
+
+    if not index.is_ready or index.is_stale:
+        try:
+            index.build(blocking=not index.is_ready, force=False)
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Failed to rebuild skill index: {str(e)}")
+            return None
+
+    return index
+
+
+def refresh_org_skills(org_id):
+    """Update the skill index after an org's skills were committed"""
+    index = current_app.extensions.get("skill_index")
+    if index is None or not index.is_ready:
+        return
+
+    try:
+        index.refresh_org(org_id)
+    except Exception as e:
+        logging.error(f"Failed to refresh skill index for org {org_id}: {str(e)}")
+        # Force a full rebuild on the next read rather than serve stale matches
+        index.built_at = None
+
+
+def refresh_user_skills(user_id):
+    """Update the skill index after a volunteer's skills were committed"""
+    index = current_app.extensions.get("skill_index")
+    if index is None or not index.is_ready:
+        return
+
+    try:
+        index.refresh_user(user_id)
+    except Exception as e:
+        logging.error(f"Failed to refresh skill index for user {user_id}: {str(e)}")
+        index.built_at = None
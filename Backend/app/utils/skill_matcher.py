@@ -0,0 +1,175 @@
+# Backend: app/utils/skill_matcher.py
+from collections import defaultdict
+
+from sqlalchemy import Float, case, cast, func, select
+
+from app import db
+from app.models import (
+    OrgProfile,
+    SkillsNeeded,
+    org_skills_connection,
+    user_skills,
+)
+from app.utils.org_directory import load_focus_areas_by_org
+from app.utils.skill_index import get_skill_index
+
+
+def build_match_query(user_id, limit=None):
+    """
+    Build the aggregate query ranking organisations against a volunteer's skills
+    Args:
+        user_id (int): The volunteer's user id
+        limit (int, optional): Only return the top `limit` organisations
+    Returns:
+        Select: Rows of (org_id, org_name, user_id, matched_skills, org_skill_count, score)
+
+    The score is the Jaccard index between the volunteer's skill set and the
+    org's needed skills: matched / (volunteer skills + org skills - matched).
+    Orgs with no overlapping skill are excluded.
+    """
+    volunteer_skill_ids = select(user_skills.c.skill_id).where(
+        user_skills.c.user_id == user_id
+    )
+    volunteer_skill_count = (
+        select(func.count())
+        .select_from(user_skills)
+        .where(user_skills.c.user_id == user_id)
+        .scalar_subquery()
+    )
+
+    # Only aggregate orgs sharing at least one skill with the volunteer
+    candidate_links = org_skills_connection.alias("candidate_links")
+    candidate_org_ids = select(candidate_links.c.org_id).where(
+        candidate_links.c.skill_id.in_(volunteer_skill_ids)
+    )
+
+    matched = func.sum(
+        case((org_skills_connection.c.skill_id.in_(volunteer_skill_ids), 1), else_=0)
+    )
+    org_skill_count = func.count(org_skills_connection.c.skill_id)
+    score = cast(matched, Float) / (volunteer_skill_count + org_skill_count - matched)
+
+    query = (
+        select(
+            org_skills_connection.c.org_id,
+            OrgProfile.org_name,
+            OrgProfile.user_id,
+            matched.label("matched_skills"),
+            org_skill_count.label("org_skill_count"),
+            score.label("score"),
+        )
+        .join(OrgProfile, OrgProfile.id == org_skills_connection.c.org_id)
+        .where(org_skills_connection.c.org_id.in_(candidate_org_ids))
+        .group_by(org_skills_connection.c.org_id, OrgProfile.org_name, OrgProfile.user_id)
+        .having(matched > 0)
+        .order_by(score.desc(), matched.desc(), org_skills_connection.c.org_id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def load_skill_connections_by_org(org_ids):
+    """
+    Load the org_skills rows of many organisations with their skill details
+    in a single query
+    Args:
+        org_ids (list): Organisations to load
+    Returns:
+        dict: org_id -> list of serialized skill connections
+    """
+    query = (
+        select(
+            org_skills_connection.c.org_id,
+            org_skills_connection.c.skill_id,
+            org_skills_connection.c.description,
+            SkillsNeeded.skill,
+            SkillsNeeded.status,
+        )
+        .join(SkillsNeeded, SkillsNeeded.id == org_skills_connection.c.skill_id)
+        .where(org_skills_connection.c.org_id.in_(org_ids))
+        .order_by(org_skills_connection.c.org_id, org_skills_connection.c.skill_id)
+    )
+
+    connections = defaultdict(list)
+    for org_id, skill_id, description, skill, status in db.session.execute(query):
+        connections[org_id].append(
+            {
+                "org_id": org_id,
+                "skill_id": skill_id,
+                "description": description,
+                "skill_name": skill,
+                "status": status,
+            }
+        )
+    return connections
+
+
+def match_orgs_for_volunteer(user_id, limit=None):
+    """
+    Rank the organisations that need any of a volunteer's skills
+    Args:
+        user_id (int): The volunteer's user id
+        limit (int, optional): Only return the top `limit` organisations
+    Returns:
+        list: Ranked matches, best first, each with the org's focus areas,
+        skill connections, matched skill count and Jaccard score
+
+    Ranking is answered from the in-memory skill index when it is available
+    and falls back to the aggregate SQL query otherwise.
+    """
+    index = get_skill_index()
+    if index is not None:
+        ranked = index.match(user_id)
+        # The index can still list orgs deleted since it was built; those are
+        # dropped before the limit is applied, reading the ranking in chunks
+        # until there are enough rows
+        chunk_size = max(limit or len(ranked), 1)
+        rows = []
+        for start in range(0, len(ranked), chunk_size):
+            chunk = ranked[start:start + chunk_size]
+            org_rows = db.session.execute(
+                select(OrgProfile.id, OrgProfile.org_name, OrgProfile.user_id).where(
+                    OrgProfile.id.in_([match.org_id for match in chunk])
+                )
+            ).all()
+            orgs = {row.id: row for row in org_rows}
+            rows.extend(
+                {
+                    "org_id": match.org_id,
+                    "org_name": orgs[match.org_id].org_name,
+                    "user_id": orgs[match.org_id].user_id,
+                    "matched_skills": match.matched_skills,
+                    "score": match.score,
+                }
+                for match in chunk
+                if match.org_id in orgs
+            )
+            if limit is not None and len(rows) >= limit:
+                break
+        rows = rows[:limit] if limit is not None else rows
+    else:
+        rows = [
+            row._asdict()
+            for row in db.session.execute(build_match_query(user_id, limit))
+        ]
+
+    if not rows:
+        return []
+
+    org_ids = [row["org_id"] for row in rows]
+    focus_areas = load_focus_areas_by_org(org_ids)
+    skill_connections = load_skill_connections_by_org(org_ids)
+
+    return [
+        {
+            "org_id": row["org_id"],
+            "org_name": row["org_name"],
+            "user_id": row["user_id"],
+            "focus_areas": focus_areas.get(row["org_id"], []),
+            "skills_needed": skill_connections.get(row["org_id"], []),
+            "matched_skills": int(row["matched_skills"]),
+            "match_score": round(float(row["score"]), 4),
+        }
+        for row in rows
+    ]
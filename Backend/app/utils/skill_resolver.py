@@ -0,0 +1,155 @@
+# Backend: app/utils/skill_resolver.py
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+from app.models import SkillsNeeded, TableVersion, user_skills
+from app.utils.http_cache import SKILLS_TABLE
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING / DO UPDATE
+ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _select_skill_ids(pairs):
+    """Look up the ids of existing (skill, status) pairs with one IN query"""
+    names = {skill for skill, _ in pairs}
+    rows = db.session.execute(
+        select(SkillsNeeded.id, SkillsNeeded.skill, SkillsNeeded.status).where(
+            SkillsNeeded.skill.in_(names)
+        )
+    )
+    return {
+        (skill, status): skill_id
+        for skill_id, skill, status in rows
+        if (skill, status) in pairs
+    }
+
+
+def _insert_skills(rows):
+    """
+    Insert new skills in a single round trip
+    Returns:
+        dict: (skill, status) -> id of the rows this statement inserted
+    """
+    dialect = db.engine.dialect
+    dialect_insert = ON_CONFLICT_INSERTS.get(dialect.name)
+
+    if dialect_insert is not None and dialect.insert_returning:
+        # Multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING; a row lost
+        # to a concurrent writer is skipped instead of failing the request
+        statement = (
+            dialect_insert(SkillsNeeded)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["skill", "status"])
+            .returning(SkillsNeeded.id, SkillsNeeded.skill, SkillsNeeded.status)
+        )
+        return {
+            (skill, status): skill_id
+            for skill_id, skill, status in db.session.execute(statement)
+        }
+
+    db.session.execute(insert(SkillsNeeded), rows)
+    return {}
+
+
+def bump_table_version(name):
+    """
+    Increment a table's version (see app.utils.http_cache.table_version) in
+    the caller's transaction, creating its row on first use
+    """
+    now = datetime.now(timezone.utc)
+    dialect_insert = ON_CONFLICT_INSERTS.get(db.engine.dialect.name)
+
+    if dialect_insert is not None:
+        statement = dialect_insert(TableVersion).values(name=name, version=1, updated_at=now)
+        db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["name"],
+                set_={"version": TableVersion.version + 1, "updated_at": now},
+            )
+        )
+        return
+
+    result = db.session.execute(
+        update(TableVersion)
+        .where(TableVersion.name == name)
+        .values(version=TableVersion.version + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        db.session.execute(insert(TableVersion).values(name=name, version=1, updated_at=now))
+
+
+def resolve_skill_ids(pairs):
+    """
+    Get or create many skills at once
+    Args:
+        pairs (iterable): (skill, status) tuples, duplicates allowed
+    Returns:
+        dict: (skill, status) -> SkillsNeeded.id for every requested pair
+
+    Runs one SELECT for the existing skills and, when some are missing, one
+    multi-row INSERT plus the skills table version bump. Rows are flushed
+    but not committed, so the caller's transaction decides whether the new
+    skills are kept.
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return {}
+
+    skill_ids = _select_skill_ids(pairs)
+    missing = pairs - skill_ids.keys()
+    if not missing:
+        return skill_ids
+
+    skill_ids.update(
+        _insert_skills([{"skill": skill, "status": status} for skill, status in sorted(missing)])
+    )
+    # Invalidates the ETags of the skills list endpoints
+    bump_table_version(SKILLS_TABLE)
+
+    # Pairs inserted concurrently by another request, or any dialect
+    # without RETURNING, are read back in one more query
+    unresolved = pairs - skill_ids.keys()
+    if unresolved:
+        skill_ids.update(_select_skill_ids(unresolved))
+
+    return skill_ids
+
+
+def support_need_pairs(support_needs):
+    """
+    Flatten onboarding support needs into (skill, status, description) tuples
+    Args:
+        support_needs (dict): {"techSkills": [...], "nonTechSkills": [...]},
+            each item being {"value": skill name, "description": text}
+    """
+    needs = []
+    for key, status in (("nonTechSkills", "non-tech"), ("techSkills", "tech")):
+        for need in (support_needs or {}).get(key, []):
+            needs.append((need["value"], status, need.get("description")))
+    return needs
+
+
+def link_user_skills(user_id, skill_ids):
+    """
+    Link skills to a volunteer with one executemany
+    Args:
+        user_id (int): The volunteer's user id
+        skill_ids (iterable): Skill ids; ones the volunteer already has are skipped
+    """
+    existing = set(
+        db.session.execute(
+            select(user_skills.c.skill_id).where(user_skills.c.user_id == user_id)
+        ).scalars()
+    )
+    new_ids = set(skill_ids) - existing
+    if new_ids:
+        db.session.execute(
+            user_skills.insert(),
+            [{"user_id": user_id, "skill_id": skill_id} for skill_id in sorted(new_ids)],
+        )
@@ -0,0 +1,300 @@
+# Backend: app/utils/translation_cache.py
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.models import TranslationCache
+from app.utils.skill_resolver import ON_CONFLICT_INSERTS
+
+# Returned by TranslationMemoryCache.get when nothing usable is cached
+MISS = object()
+
+
+def normalize_text(text):
+    """Normalize text before keying: NFC form, trimmed, single spaces"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def translation_cache_key(text, source_language, target_language):
+    """
+    Build the TranslationCache key for a text and language pair
+    Returns:
+        str: 64 character SHA-256 hex digest, so key size and comparison
+        cost do not depend on the length of the text
+    """
+    payload = "\x1f".join((source_language, target_language, normalize_text(text)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_language_for(target_language):
+    """Translations go between English and Kiswahili"""
+    return 'en' if target_language == 'sw' else 'sw'
+
+
+class TranslationMemoryCache:
+    """
+    Bounded in-process LRU of translations with per-entry expiry
+
+    Failed translations can be stored as negative entries with a shorter
+    TTL so a failing text is not re-sent to Google on every request; they
+    are never written to the database.
+    """
+
+    def __init__(self, max_size=1000, ttl=3600, negative_ttl=60, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.stats = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up a key
+        Returns:
+            tuple: (translated_text or MISS, is_negative)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS, False
+
+            value, expires_at, is_negative = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.stats["expired"] += 1
+                return MISS, False
+
+            self._entries.move_to_end(key)
+            return value, is_negative
+
+    def set(self, key, value):
+        self._store(key, value, self.ttl, False)
+
+    def set_negative(self, key):
+        self._store(key, None, self.negative_ttl, True)
+
+    def _store(self, key, value, ttl, is_negative):
+        with self._lock:
+            self._entries[key] = (value, self.clock() + ttl, is_negative)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class TieredTranslationCache:
+    """
+    Translation lookups through an in-process LRU backed by TranslationCache
+
+    Lookups go memory -> database -> translator. Database rows past their
+    expires_at are treated as misses and replaced once re-translated.
+    """
+
+    def __init__(self, memory, db_ttl_days=30):
+        self.memory = memory
+        self.db_ttl = timedelta(days=db_ttl_days)
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name, amount=1):
+        if amount:
+            with self._stats_lock:
+                self.stats[name] += amount
+
+    def translate_many(self, texts, target_language, translator):
+        """
+        Translate many strings with at most one database lookup, one
+        translator pass over the misses and one commit
+        Args:
+            texts (list): Strings to translate (texts with the same
+                normalized form are translated once)
+            target_language (str): Target language code
+            translator (callable): translator(texts, target_language,
+                source_language) -> list of translated strings, raising on error
+        Returns:
+            dict: text -> {'translatedText': ..., 'fromCache': bool}
+        """
+        source_language = source_language_for(target_language)
+
+        # Group the requested texts by cache key
+        texts_by_key = {}
+        for text in texts:
+            key = translation_cache_key(text, source_language, target_language)
+            texts_by_key.setdefault(key, []).append(text)
+
+        results = {}
+
+        def resolve(key, translated_text, from_cache):
+            for text in texts_by_key[key]:
+                results[text] = {
+                    'translatedText': text if translated_text is None else translated_text,
+                    'fromCache': from_cache,
+                }
+
+        db_lookups = []
+        for key in texts_by_key:
+            value, is_negative = self.memory.get(key)
+            if value is MISS:
+                db_lookups.append(key)
+            elif is_negative:
+                # Recently failed; serve the original text without retrying
+                self._count("negative_hits")
+                resolve(key, None, False)
+            else:
+                self._count("memory_hits")
+                resolve(key, value, True)
+
+        if not db_lookups:
+            return results
+
+        # Resolve the remaining keys with a single indexed IN query
+        now = datetime.utcnow()
+        rows = (
+            db.session.query(
+                TranslationCache.key,
+                TranslationCache.translated_text,
+                TranslationCache.expires_at,
+            )
+            .filter(TranslationCache.key.in_(db_lookups))
+            .all()
+        )
+        stored = {row.key: row for row in rows}
+
+        misses = []
+        expired_keys = []
+        for key in db_lookups:
+            row = stored.get(key)
+            if row is not None and (row.expires_at is None or row.expires_at > now):
+                self._count("db_hits")
+                self.memory.set(key, row.translated_text)
+                resolve(key, row.translated_text, True)
+            else:
+                if row is not None:
+                    self._count("expired")
+                    expired_keys.append(key)
+                misses.append(key)
+
+        if not misses:
+            return results
+
+        self._count("misses", len(misses))
+        source_texts = [normalize_text(texts_by_key[key][0]) for key in misses]
+        try:
+            translated = translator(source_texts, target_language, source_language)
+        except Exception as e:
+            logging.error(f"Translation error: {str(e)}")
+            self._count("errors")
+            for key in misses:
+                self.memory.set_negative(key)
+                resolve(key, None, False)
+            return results
+
+        new_entries = []
+        expires_at = now + self.db_ttl
+        for key, source_text, translated_text in zip(misses, source_texts, translated):
+            self.memory.set(key, translated_text)
+            resolve(key, translated_text, False)
+            new_entries.append({
+                'key': key,
+                'source_text': source_text,
+                'translated_text': translated_text,
+                'source_language': source_language,
+                'target_language': target_language,
+                'created_at': now,
+                'expires_at': expires_at,
+            })
+
+        self._store(new_entries, expired_keys)
+        return results
+
+    def _store(self, new_entries, expired_keys):
+        """
+        Upsert the new translations, replacing expired rows for the same keys
+
+        A row another worker cached in the meantime is overwritten instead of
+        failing the whole batch. Dialects without ON CONFLICT fall back to
+        delete + insert, where a concurrent insert still rolls the batch back;
+        failed stores are counted as store_errors.
+        """
+        dialect_insert = ON_CONFLICT_INSERTS.get(db.engine.dialect.name)
+        try:
+            if dialect_insert is not None:
+                statement = dialect_insert(TranslationCache)
+                db.session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=["key"],
+                        set_={
+                            name: statement.excluded[name]
+                            for name in ("source_text", "translated_text", "created_at", "expires_at")
+                        },
+                    ),
+                    new_entries,
+                )
+            else:
+                if expired_keys:
+                    db.session.query(TranslationCache).filter(
+                        TranslationCache.key.in_(expired_keys)
+                    ).delete(synchronize_session=False)
+                db.session.execute(TranslationCache.__table__.insert(), new_entries)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            self._count("store_errors")
+            logging.warning(f"Could not store translations: {str(e)}")
+
+    def snapshot(self):
+        """Return the hit/miss/expiry counters of both tiers"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        lookups = sum(stats.get(name, 0) for name in ("memory_hits", "db_hits", "misses", "negative_hits"))
+        hits = stats.get("memory_hits", 0) + stats.get("db_hits", 0)
+
+        return {
+            "memory_hits": stats.get("memory_hits", 0),
+            "db_hits": stats.get("db_hits", 0),
+            "misses": stats.get("misses", 0),
+            "negative_hits": stats.get("negative_hits", 0),
+            "expired": stats.get("expired", 0) + self.memory.stats["expired"],
+            "errors": stats.get("errors", 0),
+            "store_errors": stats.get("store_errors", 0),
+            "evictions": self.memory.stats["evictions"],
+            "memory_size": len(self.memory),
+            "memory_max_size": self.memory.max_size,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+def init_translation_cache(app):
+    """Create the translation cache for an app and register it in app.extensions"""
+    memory = TranslationMemoryCache(
+        max_size=app.config.get("TRANSLATION_MEMORY_CACHE_SIZE", 1000),
+        ttl=app.config.get("TRANSLATION_MEMORY_CACHE_TTL", 3600),
+        negative_ttl=app.config.get("TRANSLATION_NEGATIVE_CACHE_TTL", 60),
+    )
+    cache = TieredTranslationCache(
+        memory, db_ttl_days=app.config.get("TRANSLATION_CACHE_TTL_DAYS", 30)
+    )
+    app.extensions["translation_cache"] = cache
+    return cache
+
+
+def get_translation_cache():
+    """Return the current app's translation cache"""
+    return current_app.extensions["translation_cache"]
@@ -0,0 +1,186 @@
+# Backend/benchmark_image_upload.py
+"""
+Benchmark the memory used to decode an uploaded image.
+
+Decodes each test image into the logo and cover photo sizes two ways, each
+in a fresh subprocess, and reports how far the decode raised the peak
+resident set size (VmHWM) above the resident size after the imports:
+
+- legacy:   the old path (the whole upload read into bytes, then
+            Image.open / thumbnail / convert with Pillow's own limits)
+- bounded:  open_bounded() on the spooled file with the configured
+            IMAGE_MAX_PIXELS and IMAGE_DECODE_BUDGET, as
+            ImageHandler.open_image does
+
+thumbnail() decodes JPEGs at a reduced scale too, but one that covers
+twice the target size, so a phone photo is decoded at full resolution for
+a cover photo; open_bounded() only covers the target size. PNGs are
+decoded at full size either way: ones within the limits cost the same,
+while a PNG over the decode budget or over IMAGE_MAX_PIXELS is decoded by
+the legacy path but rejected by the bounded one ("rejected" in the
+output) before any pixels are decoded.
+
+Linux only: the peak is reset after the imports through /proc/self/clear_refs.
+
+Usage:
+    python benchmark_image_upload.py [--width 6000] [--height 4000]
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+# image_type -> (max_size, min_size), as in ImageHandler.open_image
+SIZES = {
+    "logo": ((400, 400), (100, 100)),
+    "cover_photo": ((1920, 1080), (800, 400)),
+}
+
+
+def make_images(directory, width, height):
+    """
+    Write the test images: a noisy phone photo JPEG, a PNG within the
+    limits, a PNG over the decode budget and one over IMAGE_MAX_PIXELS
+    Returns:
+        dict: label -> path
+    """
+    from PIL import Image
+
+    images = {}
+
+    # Noise keeps the encoder from compressing the photo to nothing
+    photo = Image.effect_noise((width, height), 64).convert("RGB")
+    images[f"jpg {width}x{height}"] = os.path.join(directory, "photo.jpg")
+    photo.save(images[f"jpg {width}x{height}"], quality=85)
+
+    # Smooth content, so the PNGs stay under the upload size limit
+    for png_width, png_height in ((3000, 2000), (width, height), (9000, 6000)):
+        label = f"png {png_width}x{png_height}"
+        images[label] = os.path.join(directory, f"{png_width}x{png_height}.png")
+        photo.resize((png_width // 100, png_height // 100)).resize(
+            (png_width, png_height), Image.Resampling.BILINEAR
+        ).save(images[label])
+    return images
+
+
+def decode_legacy(path, image_type):
+    """Frozen copy of the pre-spooling decode path"""
+    from io import BytesIO
+    from PIL import Image
+
+    max_size, _ = SIZES[image_type]
+    with open(path, "rb") as upload:
+        data = upload.read()
+    image = Image.open(BytesIO(data))
+    image.thumbnail(max_size, Image.Resampling.LANCZOS)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+def decode_bounded(path, image_type):
+    """The current path, with the configured limits"""
+    from PIL import Image
+    from app.config import AppConfig
+    from app.utils.image_ingest import REDUCING_GAP, open_bounded
+
+    max_size, min_size = SIZES[image_type]
+    with open(path, "rb") as upload:
+        image = open_bounded(
+            upload, max_size, min_size,
+            max_pixels=AppConfig.IMAGE_MAX_PIXELS,
+            memory_budget=AppConfig.IMAGE_DECODE_BUDGET,
+        )
+        image.thumbnail(max_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+    return image
+
+
+def memory_status():
+    """Return this process's (resident, peak resident) size in KiB"""
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return int(fields["VmRSS"].split()[0]), int(fields["VmHWM"].split()[0])
+
+
+def measure(case, path, image_type):
+    """Run one decode in this process and print 'delta_kib seconds' as the last line"""
+    # Both cases import the same modules before the peak is reset
+    import PIL.Image  # noqa: F401
+    import app.config  # noqa: F401
+    import app.utils.image_ingest  # noqa: F401
+
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")  # Reset the peak to the current resident size
+    baseline, _ = memory_status()
+
+    decode = decode_legacy if case == "legacy" else decode_bounded
+    started = time.perf_counter()
+    try:
+        decode(path, image_type)
+    except ValueError:
+        print("rejected")
+        return
+    elapsed = time.perf_counter() - started
+    _, peak = memory_status()
+    print(f"{peak - baseline} {elapsed}")
+
+
+def run(case, path, image_type):
+    """Measure one decode in a fresh interpreter; returns a printable result"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", case, path, image_type],
+        check=True, capture_output=True, text=True,
+    ).stdout.splitlines()[-1].split()
+    if output == ["rejected"]:
+        return f"{'rejected':>19}"
+    return f"{int(output[0]) / 1024:7.1f} MiB {float(output[1]):6.2f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark image upload memory")
+    parser.add_argument("--width", type=int, default=6000)
+    parser.add_argument("--height", type=int, default=4000)
+    parser.add_argument("--measure", nargs=3, metavar=("CASE", "PATH", "IMAGE_TYPE"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger.info(f"Generating test images ({args.width}x{args.height} photo)")
+        images = make_images(directory, args.width, args.height)
+
+        logger.info("Decode memory above the import baseline:")
+        for label, path in images.items():
+            size = os.path.getsize(path) / (1024 * 1024)
+            for image_type in SIZES:
+                logger.info(
+                    f"{label:>14} ({size:5.1f} MB) {image_type:>12}: "
+                    f"legacy {run('legacy', path, image_type)}  "
+                    f"bounded {run('bounded', path, image_type)}"
+                )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("Benchmark interrupted by user")
+        sys.exit(1)
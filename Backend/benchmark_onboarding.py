@@ -0,0 +1,237 @@
+# Backend/benchmark_onboarding.py
+"""
+Benchmark storing onboarding content (projects, initiatives, skill needs).
+
+Seeds N organisations and stores the same generated onboarding payloads
+three ways, timing each and counting the SQL statements sent:
+
+- legacy:   the old per-row ORM path (one object per row, get-or-create
+            queries per skill need, one org_skills INSERT per need)
+- per-org:  store_onboarding_content() once per organisation, as the
+            /profile/org/projects_initiatives route does
+- batched:  store_onboarding_content() over --batch-size organisations
+            at a time, as a bulk import or seed would
+
+By default everything runs against an in-memory SQLite database. Pass
+--database-url to benchmark another backend; that database's tables are
+DROPPED and recreated, so only point it at a throwaway database.
+
+Usage:
+    python benchmark_onboarding.py [--orgs 10000] [--batch-size 1000] [--database-url URL]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+SKILL_POOL = [f"Skill {i}" for i in range(60)]
+
+
+def make_payload(rng, index):
+    """Generate one organisation's onboarding request body"""
+    def needs(count):
+        return [
+            {"value": skill, "description": f"Help with {skill.lower()}"}
+            for skill in rng.sample(SKILL_POOL, count)
+        ]
+
+    return {
+        "ongoingProjects": [
+            {"projectName": f"Org {index} project {i}", "description": "Ongoing work"}
+            for i in range(2)
+        ],
+        "previousProjects": [
+            {"projectName": f"Org {index} past project", "description": "Completed work"}
+        ],
+        "programInitiatives": [
+            {"initiativeName": f"Org {index} initiative {i}", "description": "A programme"}
+            for i in range(2)
+        ],
+        "supportNeeds": {"techSkills": needs(3), "nonTechSkills": needs(2)},
+    }
+
+
+def seed_orgs(count):
+    """Insert `count` admin users and organisation profiles; returns the org ids"""
+    from sqlalchemy import insert, select
+    from app import db
+    from app.models import OrgProfile, User
+
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "first_name": "Bench",
+                "last_name": "Admin",
+                "email": f"bench{i}@example.com",
+                "password": "password",
+                "is_admin": True,
+            }
+            for i in range(count)
+        ],
+    )
+    user_ids = db.session.execute(select(User.id).order_by(User.id)).scalars().all()
+    db.session.execute(
+        insert(OrgProfile),
+        [
+            {
+                "user_id": user_id,
+                "org_name": f"Org {i}",
+                "org_overview": "Overview",
+                "org_mission_statement": "Mission",
+                "org_email": f"org{i}@example.com",
+                "org_phone": "0700000000",
+                "org_district_town": "Town",
+                "org_county": "Nairobi",
+                "org_po_box": "00100",
+                "org_country": "Kenya",
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+    db.session.commit()
+    return db.session.execute(select(OrgProfile.id).order_by(OrgProfile.id)).scalars().all()
+
+
+def reset_content():
+    """Remove everything the runs write so each starts from the same state"""
+    from app import db
+    from app.models import OrgInitiatives, OrgProjects, SkillsNeeded, org_skills_connection
+
+    db.session.execute(org_skills_connection.delete())
+    db.session.query(OrgProjects).delete()
+    db.session.query(OrgInitiatives).delete()
+    db.session.query(SkillsNeeded).delete()
+    db.session.commit()
+
+
+def store_legacy(org_id, data):
+    """Frozen copy of the pre-bulk per-row onboarding path"""
+    from app import db
+    from app.models import OrgInitiatives, OrgProjects, SkillsNeeded, org_skills_connection
+
+    for key, status in (("ongoingProjects", "ongoing"), ("previousProjects", "completed")):
+        for project in data[key]:
+            db.session.add(OrgProjects(
+                org_id=org_id,
+                project_name=project["projectName"],
+                project_description=project["description"],
+                project_status=status,
+            ))
+
+    for initiative in data["programInitiatives"]:
+        db.session.add(OrgInitiatives(
+            org_id=org_id,
+            initiative_name=initiative["initiativeName"],
+            initiative_description=initiative["description"],
+        ))
+
+    for key, status in (("nonTechSkills", "non-tech"), ("techSkills", "tech")):
+        for need_data in data["supportNeeds"][key]:
+            need = need_data["value"]
+            skill = SkillsNeeded.query.filter_by(skill=need, status=status).first()
+            if skill is None:
+                db.session.add(SkillsNeeded(skill=need, status=status))
+                db.session.commit()
+            new_need = SkillsNeeded.query.filter_by(skill=need, status=status).first()
+            db.session.execute(org_skills_connection.insert().values(
+                org_id=org_id, skill_id=new_need.id, description=need_data["description"]
+            ))
+
+    db.session.commit()
+
+
+def run(name, work):
+    """Time `work()` and count the statements it sends"""
+    from sqlalchemy import event
+    from app import db
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    started = time.perf_counter()
+    try:
+        work()
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    logger.info(f"{name:>8}: {elapsed:8.2f}s  {len(statements):>8} statements")
+    return elapsed, len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk onboarding inserts")
+    parser.add_argument("--orgs", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Organisations stored per call in the batched run")
+    parser.add_argument("--database-url",
+                        help="Throwaway database to use instead of in-memory SQLite (tables are dropped)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Pick the database before the config module is imported
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        os.environ["CONFIG_CLASS"] = "app.config.TestConfig"
+
+    from app import create_app, db
+    from app.utils.org_onboarding import store_onboarding_content
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        logger.info(f"Seeding {args.orgs} organisations")
+        org_ids = seed_orgs(args.orgs)
+        rng = random.Random(args.seed)
+        payloads = [(org_id, make_payload(rng, i)) for i, org_id in enumerate(org_ids)]
+
+        def legacy():
+            for org_id, data in payloads:
+                store_legacy(org_id, data)
+
+        def per_org():
+            for payload in payloads:
+                store_onboarding_content([payload])
+                db.session.commit()
+
+        def batched():
+            for start in range(0, len(payloads), args.batch_size):
+                store_onboarding_content(payloads[start:start + args.batch_size])
+                db.session.commit()
+
+        results = {}
+        for name, work in (("legacy", legacy), ("per-org", per_org), ("batched", batched)):
+            reset_content()
+            db.session.expunge_all()
+            results[name] = run(name, work)
+
+    legacy_time = results["legacy"][0]
+    for name in ("per-org", "batched"):
+        logger.info(f"{name} is {legacy_time / results[name][0]:.1f}x faster than legacy")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("Benchmark interrupted by user")
+        sys.exit(1)
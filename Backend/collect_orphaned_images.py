@@ -0,0 +1,66 @@
+# Backend/collect_orphaned_images.py
+"""
+Delete stored org images that no profile refers to.
+
+Image jobs delete a replaced image right after committing the new one, but
+a delete can fail and a job can die between upload and commit, leaving
+objects nothing points at. This pages through the storage listing under
+logo/ and cover_photo/, compares each name against the profiles' filenames
+and variant manifests, and deletes unreferenced objects older than the
+grace period in batches.
+
+Safe to run repeatedly (e.g. daily from cron); anything that fails to
+delete is picked up by the next run.
+
+Usage:
+    python collect_orphaned_images.py [--grace-hours HOURS] [--batch-size 100] [--dry-run]
+"""
+import argparse
+import logging
+import sys
+from datetime import timedelta
+
+from app import create_app
+from app.utils.image_gc import collect_orphaned_images
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete unreferenced org images from storage")
+    parser.add_argument("--grace-hours", type=float,
+                        help="Only delete objects older than this, so in-flight uploads are kept "
+                             "(default: IMAGE_ORPHAN_GRACE_HOURS, 24)")
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="Objects deleted per storage request")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only report how many objects would be deleted")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        summary = collect_orphaned_images(
+            grace_period=timedelta(hours=args.grace_hours) if args.grace_hours is not None else None,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    logger.info(f"Image garbage collection finished: {summary}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("Image garbage collection interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        sys.exit(1)
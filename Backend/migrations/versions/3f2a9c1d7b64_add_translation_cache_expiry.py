@@ -0,0 +1,38 @@
+"""add_translation_cache_expiry
+
+Revision ID: 3f2a9c1d7b64
+Revises: dc8b189a250c
+Create Date: 2026-10-18 11:02:13.418520
+
+"""
+from datetime import datetime, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b64'
+down_revision = 'dc8b189a250c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_translation_cache_expires_at'), ['expires_at'], unique=False)
+
+    # Existing translations get a fresh 30 day lease
+    translation_cache = sa.table('translation_cache', sa.column('expires_at', sa.DateTime()))
+    op.execute(
+        translation_cache.update()
+        .where(translation_cache.c.expires_at.is_(None))
+        .values(expires_at=datetime.utcnow() + timedelta(days=30))
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_translation_cache_expires_at'))
+        batch_op.drop_column('expires_at')
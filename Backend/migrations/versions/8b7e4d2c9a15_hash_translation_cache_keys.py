@@ -0,0 +1,117 @@
+"""hash_translation_cache_keys
+
+Revision ID: 8b7e4d2c9a15
+Revises: 3f2a9c1d7b64
+Create Date: 2026-10-18 11:41:37.902114
+
+"""
+import hashlib
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b7e4d2c9a15'
+down_revision = '3f2a9c1d7b64'
+branch_labels = None
+depends_on = None
+
+
+translation_cache = sa.table(
+    'translation_cache',
+    sa.column('key', sa.String()),
+    sa.column('source_text', sa.Text()),
+    sa.column('source_language', sa.String()),
+    sa.column('target_language', sa.String()),
+)
+
+
+def hashed_key(text, source_language, target_language):
+    # Frozen copy of app.utils.translation_cache.translation_cache_key
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    payload = "\x1f".join((source_language, target_language, normalized))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest(), normalized
+
+
+def upgrade():
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('source_text', sa.Text(), nullable=True))
+
+    # Backfill: old keys are "<text>_<target_language>"
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            translation_cache.c.key,
+            translation_cache.c.source_language,
+            translation_cache.c.target_language,
+        )
+    ).all()
+
+    updates = []
+    duplicates = []
+    seen = set()
+    for old_key, source_language, target_language in rows:
+        suffix = f"_{target_language}"
+        text = old_key[:-len(suffix)] if old_key.endswith(suffix) else old_key
+        new_key, source_text = hashed_key(text, source_language, target_language)
+
+        # Texts that only differed in whitespace now share a key
+        if new_key in seen:
+            duplicates.append({'old_key': old_key})
+            continue
+        seen.add(new_key)
+        updates.append({'old_key': old_key, 'new_key': new_key, 'source_text': source_text})
+
+    if duplicates:
+        connection.execute(
+            translation_cache.delete().where(translation_cache.c.key == sa.bindparam('old_key')),
+            duplicates,
+        )
+    if updates:
+        connection.execute(
+            translation_cache.update()
+            .where(translation_cache.c.key == sa.bindparam('old_key'))
+            .values(key=sa.bindparam('new_key'), source_text=sa.bindparam('source_text')),
+            updates,
+        )
+
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.alter_column('key',
+               existing_type=sa.String(length=500),
+               type_=sa.String(length=64),
+               existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.alter_column('key',
+               existing_type=sa.String(length=64),
+               type_=sa.String(length=500),
+               existing_nullable=False)
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            translation_cache.c.key,
+            translation_cache.c.source_text,
+            translation_cache.c.target_language,
+        )
+    ).all()
+
+    restores = [
+        {'old_key': key, 'new_key': f"{source_text}_{target_language}"}
+        for key, source_text, target_language in rows
+        if source_text is not None
+    ]
+    if restores:
+        connection.execute(
+            translation_cache.update()
+            .where(translation_cache.c.key == sa.bindparam('old_key'))
+            .values(key=sa.bindparam('new_key')),
+            restores,
+        )
+
+    with op.batch_alter_table('translation_cache', schema=None) as batch_op:
+        batch_op.drop_column('source_text')
@@ -0,0 +1,40 @@
+"""index_hot_lookups
+
+Revision ID: a9e3d7b25c40
+Revises: f2c6a8d4b931
+Create Date: 2026-10-18 19:05:17.846213
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9e3d7b25c40'
+down_revision = 'f2c6a8d4b931'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns); skills_needed.skill is already covered by
+# ix_skills_needed_skill_status, which leads with it
+INDEXES = [
+    ('ix_org_profile_user_id', 'org_profile', ['user_id']),
+    ('ix_focus_area_name', 'focus_area', ['name']),
+    ('ix_org_projects_org_id', 'org_projects', ['org_id']),
+    ('ix_org_initiatives_org_id', 'org_initiatives', ['org_id']),
+    # Association table primary keys lead with the owner id; these serve
+    # the reverse lookups by skill / focus area
+    ('ix_org_skills_skill_id', 'org_skills', ['skill_id']),
+    ('ix_user_skills_skill_id', 'user_skills', ['skill_id']),
+    ('ix_org_focus_areas_focus_area_id', 'org_focus_areas', ['focus_area_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
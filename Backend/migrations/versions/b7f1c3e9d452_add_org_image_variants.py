@@ -0,0 +1,27 @@
+"""add_org_image_variants
+
+Revision ID: b7f1c3e9d452
+Revises: a9e3d7b25c40
+Create Date: 2026-10-18 19:48:26.503117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7f1c3e9d452'
+down_revision = 'a9e3d7b25c40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Images uploaded before this keep serving their single JPEG
+    with op.batch_alter_table('org_profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('org_image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('org_profile', schema=None) as batch_op:
+        batch_op.drop_column('org_image_variants')
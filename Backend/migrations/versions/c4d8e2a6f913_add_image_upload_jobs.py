@@ -0,0 +1,35 @@
+"""add_image_upload_jobs
+
+Revision ID: c4d8e2a6f913
+Revises: b7f1c3e9d452
+Create Date: 2026-10-18 21:12:40.318544
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8e2a6f913'
+down_revision = 'b7f1c3e9d452'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Upload job state, shared by every worker answering status polls
+    op.create_table(
+        'image_upload_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('org_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('results', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('image_upload_jobs')
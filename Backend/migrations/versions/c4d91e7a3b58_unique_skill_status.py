@@ -0,0 +1,86 @@
+"""unique_skill_status
+
+Revision ID: c4d91e7a3b58
+Revises: 8b7e4d2c9a15
+Create Date: 2026-10-18 14:05:12.318540
+
+"""
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d91e7a3b58'
+down_revision = '8b7e4d2c9a15'
+branch_labels = None
+depends_on = None
+
+
+skills_needed = sa.table(
+    'skills_needed',
+    sa.column('id', sa.Integer()),
+    sa.column('skill', sa.String()),
+    sa.column('status', sa.String()),
+)
+
+# Both association tables are keyed by (owner id, skill_id)
+association_tables = [
+    (sa.table('org_skills', sa.column('org_id', sa.Integer()), sa.column('skill_id', sa.Integer())), 'org_id'),
+    (sa.table('user_skills', sa.column('user_id', sa.Integer()), sa.column('skill_id', sa.Integer())), 'user_id'),
+]
+
+
+def merge_duplicate_skills(connection):
+    """Point links to duplicate (skill, status) rows at the lowest id, then drop the duplicates"""
+    ids_by_pair = defaultdict(list)
+    for skill_id, skill, status in connection.execute(
+        sa.select(skills_needed.c.id, skills_needed.c.skill, skills_needed.c.status)
+        .order_by(skills_needed.c.id)
+    ):
+        ids_by_pair[(skill, status)].append(skill_id)
+
+    for ids in ids_by_pair.values():
+        if len(ids) < 2:
+            continue
+        keep_id, duplicate_ids = ids[0], ids[1:]
+
+        for table, owner in association_tables:
+            owner_column = table.c[owner]
+            links = connection.execute(
+                sa.select(owner_column, table.c.skill_id)
+                .where(table.c.skill_id.in_(ids))
+                .order_by(owner_column, table.c.skill_id)
+            ).all()
+
+            # Each owner keeps a single link; extra links would collide on
+            # the primary key once repointed
+            linked_owners = set()
+            for owner_id, skill_id in links:
+                if owner_id in linked_owners:
+                    connection.execute(
+                        table.delete().where(owner_column == owner_id, table.c.skill_id == skill_id)
+                    )
+                    continue
+                linked_owners.add(owner_id)
+                if skill_id != keep_id:
+                    connection.execute(
+                        table.update()
+                        .where(owner_column == owner_id, table.c.skill_id == skill_id)
+                        .values(skill_id=keep_id)
+                    )
+
+        connection.execute(skills_needed.delete().where(skills_needed.c.id.in_(duplicate_ids)))
+
+
+def upgrade():
+    merge_duplicate_skills(op.get_bind())
+
+    with op.batch_alter_table('skills_needed', schema=None) as batch_op:
+        batch_op.create_index('ix_skills_needed_skill_status', ['skill', 'status'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('skills_needed', schema=None) as batch_op:
+        batch_op.drop_index('ix_skills_needed_skill_status')
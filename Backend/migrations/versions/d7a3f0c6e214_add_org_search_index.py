@@ -0,0 +1,42 @@
+"""add_org_search_index
+
+Revision ID: d7a3f0c6e214
+Revises: c4d91e7a3b58
+Create Date: 2026-10-18 16:22:48.104733
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a3f0c6e214'
+down_revision = 'c4d91e7a3b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Documents are filled in by the app at startup (see app.utils.org_search)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE TABLE IF NOT EXISTS org_search_documents ("
+            " org_id INTEGER PRIMARY KEY REFERENCES org_profile (id) ON DELETE CASCADE,"
+            " document TSVECTOR NOT NULL)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_org_search_documents_document"
+            " ON org_search_documents USING gin (document)"
+        )
+    elif op.get_bind().dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS org_search_fts USING fts5("
+            " org_name, focus_areas, skills, org_overview, org_mission_statement,"
+            " tokenize = 'porter unicode61')"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP TABLE IF EXISTS org_search_documents")
+    elif op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS org_search_fts")
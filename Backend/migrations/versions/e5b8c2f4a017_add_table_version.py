@@ -0,0 +1,36 @@
+"""add_table_version
+
+Revision ID: e5b8c2f4a017
+Revises: d7a3f0c6e214
+Create Date: 2026-10-18 17:41:09.552871
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b8c2f4a017'
+down_revision = 'd7a3f0c6e214'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table_version = op.create_table(
+        'table_version',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+    # Seed the skills row so resolve_skill_ids only ever has to UPDATE it
+    op.bulk_insert(table_version, [
+        {'name': 'skills_needed', 'version': 1, 'updated_at': datetime.now(timezone.utc)},
+    ])
+
+
+def downgrade():
+    op.drop_table('table_version')
@@ -0,0 +1,38 @@
+"""org_profile_version_and_timestamps
+
+Revision ID: f2c6a8d4b931
+Revises: e5b8c2f4a017
+Create Date: 2026-10-18 18:32:40.219604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6a8d4b931'
+down_revision = 'e5b8c2f4a017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Timestamps were filled from a value computed once per process; from
+    # now on the database sets them. Existing values are left as they are.
+    with op.batch_alter_table('org_profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+
+    with op.batch_alter_table('org_profile', schema=None) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+        batch_op.drop_column('version')
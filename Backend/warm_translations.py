@@ -0,0 +1,190 @@
+# Backend/warm_translations.py
+"""
+Pre-translate text every Kiswahili visitor would otherwise wait for.
+
+Collects the frontend's static phrases (STATIC_PHRASES and literal
+<DynamicTranslate> strings), every skill and focus area name and each
+organisation's overview and mission statement, then translates whatever
+is not already in TranslationCache in batches.
+
+Runs are incremental: cache keys are digests of the normalized text, so
+unchanged strings are skipped with a single lookup per batch and only new
+or edited org text is sent to Google Translate.
+
+Usage:
+    python warm_translations.py [--frontend-src ../Frontend/src] [--batch-size 100] [--dry-run]
+"""
+import argparse
+import glob
+import logging
+import os
+import re
+import sys
+from datetime import datetime
+
+from app import create_app, db
+from app.models import FocusArea, OrgProfile, SkillsNeeded, TranslationCache
+from app.utils.translation_cache import (
+    get_translation_cache,
+    normalize_text,
+    source_language_for,
+    translation_cache_key,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRONTEND_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Frontend", "src")
+
+# Literal children of <DynamicTranslate>, skipping JSX expressions
+DYNAMIC_TRANSLATE_PATTERN = re.compile(r"<DynamicTranslate>([^<{]+)</DynamicTranslate>")
+
+# Quoted keys of an object literal, e.g. 'Home': or "About Us":
+PHRASE_KEY_PATTERN = re.compile(r"""(['"])((?:\\.|(?!\1).)*)\1\s*:""")
+
+
+def collect_static_phrases(frontend_src):
+    """
+    Collect the English phrases the frontend translates
+    Args:
+        frontend_src (str): Path to Frontend/src
+    Returns:
+        list: English STATIC_PHRASES keys and literal DynamicTranslate strings
+    """
+    phrases = []
+
+    constants_path = os.path.join(frontend_src, "components", "utils", "translationConstants.js")
+    if os.path.exists(constants_path):
+        with open(constants_path, encoding="utf-8") as f:
+            source = f.read()
+        # Only the English block; its keys are the phrases being translated
+        english_block = source.split("sw: {", 1)[0]
+        phrases.extend(
+            match.group(2).replace("\\'", "'").replace('\\"', '"')
+            for match in PHRASE_KEY_PATTERN.finditer(english_block)
+        )
+    else:
+        logger.warning(f"STATIC_PHRASES not found at {constants_path}")
+
+    for path in glob.glob(os.path.join(frontend_src, "**", "*.js"), recursive=True):
+        with open(path, encoding="utf-8") as f:
+            phrases.extend(DYNAMIC_TRANSLATE_PATTERN.findall(f.read()))
+
+    return phrases
+
+
+def collect_database_text():
+    """
+    Collect skill and focus area names plus org overview/mission text
+    Returns:
+        list: Strings stored in the database that the frontend translates
+    """
+    texts = [skill for (skill,) in db.session.query(SkillsNeeded.skill)]
+    texts.extend(name for (name,) in db.session.query(FocusArea.name))
+    for overview, mission in db.session.query(
+        OrgProfile.org_overview, OrgProfile.org_mission_statement
+    ):
+        texts.extend([overview, mission])
+    return texts
+
+
+def find_uncached(texts, target_language, batch_size):
+    """
+    Return the texts with no valid TranslationCache row
+    Args:
+        texts (list): Normalized, de-duplicated texts
+        target_language (str): Target language code
+        batch_size (int): Keys checked per IN query
+    """
+    source_language = source_language_for(target_language)
+    keys = {translation_cache_key(text, source_language, target_language): text for text in texts}
+    key_list = list(keys)
+    now = datetime.utcnow()
+
+    cached = set()
+    for start in range(0, len(key_list), batch_size):
+        chunk = key_list[start:start + batch_size]
+        cached.update(
+            key for (key,) in db.session.query(TranslationCache.key).filter(
+                TranslationCache.key.in_(chunk),
+                db.or_(TranslationCache.expires_at.is_(None), TranslationCache.expires_at > now),
+            )
+        )
+
+    return [text for key, text in keys.items() if key not in cached]
+
+
+def warm_translations(frontend_src, target_language="sw", batch_size=100, dry_run=False):
+    """
+    Translate every uncached phrase and store it in TranslationCache
+    Returns:
+        dict: Counts of collected, already cached and translated texts
+    """
+    from app.main.routes import google_translate
+
+    texts = collect_static_phrases(frontend_src) + collect_database_text()
+    unique_texts = list(dict.fromkeys(
+        normalized for normalized in (normalize_text(text) for text in texts if text) if normalized
+    ))
+    logger.info(f"Collected {len(unique_texts)} unique texts")
+
+    uncached = find_uncached(unique_texts, target_language, batch_size)
+    logger.info(f"{len(unique_texts) - len(uncached)} already cached, {len(uncached)} to translate")
+
+    translated = 0
+    if not dry_run:
+        cache = get_translation_cache()
+        for start in range(0, len(uncached), batch_size):
+            batch = uncached[start:start + batch_size]
+            errors_before = cache.stats["errors"] + cache.stats["store_errors"]
+            cache.translate_many(batch, target_language, google_translate)
+            # Failed batches fall back to the original text, and batches that
+            # could not be written are translated again on the next run
+            if cache.stats["errors"] + cache.stats["store_errors"] == errors_before:
+                translated += len(batch)
+            logger.info(f"Translated {min(start + batch_size, len(uncached))}/{len(uncached)}")
+
+    return {
+        "collected": len(unique_texts),
+        "cached": len(unique_texts) - len(uncached),
+        "translated": translated,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-translate static phrases and org content")
+    parser.add_argument("--frontend-src", default=DEFAULT_FRONTEND_SRC,
+                        help="Path to Frontend/src, used to collect static phrases")
+    parser.add_argument("--target-language", default="sw")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only report how many texts would be translated")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        summary = warm_translations(
+            args.frontend_src,
+            target_language=args.target_language,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    logger.info(f"Translation warmup finished: {summary}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        logger.info("Translation warmup interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        sys.exit(1)
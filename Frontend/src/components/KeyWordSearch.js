@@ -1,22 +1,67 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import Select from 'react-select';
 import { Search, X, ChevronDown } from 'lucide-react';
 import { Translate, DynamicTranslate, useTranslation } from '../contexts/TranslationProvider';
+import { useApi } from '../contexts/ApiProvider';
 import { STATIC_PHRASES } from './utils/translationConstants';
 
+// Number of ranked results requested per page; "Load more" fetches the next
+// page from the next_offset the search endpoint returns
+const SEARCH_PAGE_SIZE = 100;
+
+/**
+ * Index /main/orgs/facets counts by focus area and skill name
+ */
+const countsByName = (facets) => {
+    const toMap = (items = []) => Object.fromEntries(items.map(({ name, count }) => [name, count]));
+    return {
+        focusAreas: toMap(facets.focus_areas),
+        skills: {
+            ...toMap(facets.skills?.tech),
+            ...toMap(facets.skills?.['non-tech']),
+        },
+    };
+};
+
+/**
+ * Render a select option label with the number of organizations it would match
+ */
+const withCount = (label, count) => (
+    <span className="flex items-center justify-between gap-2">
+        <span>{label}</span>
+        <span className="text-xs text-gray-500">{count || 0}</span>
+    </span>
+);
+
+/**
+ * Debounce helper function to limit the rate of search execution
+ */
+const debounce = (func, wait) => {
+    let timeout;
+    const debounced = (...args) => {
+        clearTimeout(timeout);
+        timeout = setTimeout(() => func(...args), wait);
+    };
+    debounced.cancel = () => clearTimeout(timeout);
+    return debounced;
+};
+
 /**
  * KeyWordSearch Component
  * 
- * A search interface for filtering organizations based on:
- * - Organization name (text search)
+ * A search interface for finding organizations by:
+ * - Keywords (ranked server-side over name, overview, mission, focus areas and skills)
  * - Focus areas (select from predefined list)
  * - Skills needed (select from technical and non-technical skills)
+ *
+ * Searches run on the server via /main/orgs/search, so the full directory
+ * is never downloaded just to filter it.
  * 
  * @param {Object} props
- * @param {Array<Object>} props.orgData - Array of organization objects
- * @param {Function} props.onSearchResults - Callback function that receives filtered results
+ * @param {Function} props.onSearchResults - Callback function that receives ranked results
  */
-export default function KeyWordSearch({ orgData = [], onSearchResults }) {    
+export default function KeyWordSearch({ onSearchResults }) {    
+    const apiClient = useApi();
     // Predefined options for focus areas and skills
     const focusAreaOptions = [
         { value: 'Education', label: <DynamicTranslate>Education</DynamicTranslate> },
@@ -78,56 +123,89 @@ export default function KeyWordSearch({ orgData = [], onSearchResults }) {
     const [selectedFocusArea, setSelectedFocusArea] = useState(null);
     const [selectedSkill, setSelectedSkill] = useState(null);
     const [isFiltersVisible, setIsFiltersVisible] = useState(false);
+    const [facetCounts, setFacetCounts] = useState({ focusAreas: {}, skills: {} });
+    // Offset of the next page of results, or null when every match is shown
+    const [nextOffset, setNextOffset] = useState(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const { currentLanguage } = useTranslation();
 
-    /**
-     * Debounce helper function to limit the rate of search execution
-     */
-    const debounce = (func, wait) => {
-        let timeout;
-        return (...args) => {
-            clearTimeout(timeout);
-            timeout = setTimeout(() => func(...args), wait);
-        };
-    };
+    // Ignore responses to searches that were superseded while in flight
+    const latestSearch = useRef(0);
+    // Filters of the search whose results are shown, for loading more pages
+    const latestFilters = useRef({});
+
+    // Read the latest callback without re-creating the debounced search
+    const onSearchResultsRef = useRef(onSearchResults);
+    onSearchResultsRef.current = onSearchResults;
 
     /**
-     * Main search function that filters organizations based on search term and filters
+     * Main search function that asks the server for orgs matching the search term and filters
      */
-    const performSearch = useCallback(
-        debounce((term, focusArea, skill) => {
-            if (!term && !focusArea && !skill) {
-                setSearchResults([]);
-                onSearchResults(null);
-                return;
-            }
+    const performSearch = useMemo(
+        () => debounce(async (term, focusArea, skill) => {
+            const searchId = ++latestSearch.current;
 
-            const filteredOrgs = orgData.filter((org) => {
-                // Name search
-                const nameMatch = !term || 
-                    (org?.org_name || '').toLowerCase().includes(term.toLowerCase());
+            const filters = {};
+            if (term.trim()) filters.q = term.trim();
+            if (focusArea) filters.focus_area = focusArea.value;
+            if (skill) filters.skill = skill.value;
 
-                // Focus area filter
-                const focusAreaMatch = !focusArea || 
-                    (org?.focus_areas || []).some(area =>
-                        area?.name === focusArea.value
-                    );
+            // Facet counts follow the current filters, even when they are cleared
+            const facetsRequest = apiClient.get('/main/orgs/facets', filters);
 
-                // Skills filter - matches against the database value
-                const skillMatch = !skill ||
-                    (org?.skills_needed || []).some(s =>
-                        s?.skill === skill.value
-                    );
+            latestFilters.current = filters;
+            if (!Object.keys(filters).length) {
+                setSearchResults([]);
+                setNextOffset(null);
+                onSearchResultsRef.current(null);
+            } else {
+                const response = await apiClient.get(
+                    '/main/orgs/search', { ...filters, limit: SEARCH_PAGE_SIZE }
+                );
+                if (searchId !== latestSearch.current) return;
 
-                return nameMatch && focusAreaMatch && skillMatch;
-            });
+                const results = response.ok ? response.body.orgs : [];
+                setSearchResults(results);
+                setNextOffset(response.ok ? response.body.next_offset ?? null : null);
+                onSearchResultsRef.current(results);
+            }
 
-            setSearchResults(filteredOrgs);
-            onSearchResults(filteredOrgs);
+            const facetsResponse = await facetsRequest;
+            if (searchId === latestSearch.current && facetsResponse.ok) {
+                setFacetCounts(countsByName(facetsResponse.body));
+            }
         }, 300),
-        [orgData, onSearchResults]
+        [apiClient]
     );
 
+    /**
+     * Append the next page of results of the current search
+     */
+    const loadMoreResults = async () => {
+        const searchId = latestSearch.current;
+        setIsLoadingMore(true);
+        try {
+            const response = await apiClient.get('/main/orgs/search', {
+                ...latestFilters.current, limit: SEARCH_PAGE_SIZE, offset: nextOffset,
+            });
+            if (searchId !== latestSearch.current || !response.ok) return;
+
+            const results = [...searchResults, ...response.body.orgs];
+            setSearchResults(results);
+            setNextOffset(response.body.next_offset ?? null);
+            onSearchResults(results);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
+    // Load the unfiltered facet counts once
+    useEffect(() => {
+        performSearch('', null, null);
+    }, [performSearch]);
+
+    useEffect(() => () => performSearch.cancel(), [performSearch]);
+
     // Event handlers
     const handleSearchChange = (event) => {
         const newTerm = event.target.value;
@@ -150,7 +228,10 @@ export default function KeyWordSearch({ orgData = [], onSearchResults }) {
         setSelectedFocusArea(null);
         setSelectedSkill(null);
         setSearchResults([]);
+        setNextOffset(null);
         onSearchResults(null);
+        // Reload the unfiltered facet counts
+        performSearch('', null, null);
     };
 
     // Custom styles for react-select
@@ -206,9 +287,20 @@ export default function KeyWordSearch({ orgData = [], onSearchResults }) {
                         <Translate>Find Organizations</Translate>
                     </h2>
                     {searchResults.length > 0 && (
-                        <span className="px-3 py-1 text-sm font-medium text-teal-800 bg-teal-50 rounded-full">
-                            {searchResults.length} <Translate>{searchResults.length === 1 ? 'result' : 'results'}</Translate>
-                        </span>
+                        <div className="flex items-center gap-3">
+                            <span className="px-3 py-1 text-sm font-medium text-teal-800 bg-teal-50 rounded-full">
+                                {searchResults.length}{nextOffset !== null && '+'} <Translate>{searchResults.length === 1 ? 'result' : 'results'}</Translate>
+                            </span>
+                            {nextOffset !== null && (
+                                <button
+                                    onClick={loadMoreResults}
+                                    disabled={isLoadingMore}
+                                    className="text-sm font-medium text-teal-600 hover:text-teal-700 disabled:opacity-50 transition-colors"
+                                >
+                                    <Translate>Load more results</Translate>
+                                </button>
+                            )}
+                        </div>
                     )}
                 </div>
 
@@ -269,7 +361,9 @@ export default function KeyWordSearch({ orgData = [], onSearchResults }) {
                                         onChange={handleFocusAreaChange}
                                         options={focusAreaOptions}
                                         placeholder={<Translate>Select focus area...</Translate>}
-                                        formatOptionLabel={(option) => option.label}
+                                        formatOptionLabel={(option) =>
+                                            withCount(option.label, facetCounts.focusAreas[option.value])
+                                        }
                                         styles={selectStyles}
                                         theme={(theme) => ({
                                             ...theme,
@@ -297,7 +391,9 @@ export default function KeyWordSearch({ orgData = [], onSearchResults }) {
                                         options={skillOptions}
                                         placeholder={<Translate>Select skill...</Translate>}
                                         formatGroupLabel={(group) => group.label}
-                                        formatOptionLabel={(option) => option.label}
+                                        formatOptionLabel={(option) =>
+                                            withCount(option.label, facetCounts.skills[option.value])
+                                        }
                                         styles={selectStyles}
                                         theme={(theme) => ({
                                             ...theme,
@@ -2,6 +2,7 @@ import React from "react";
 import { useNavigate } from 'react-router-dom';
 import { ArrowRight, MapPin, Users, Calendar, Briefcase } from 'lucide-react';
 import { Translate, DynamicTranslate } from '../contexts/TranslationProvider';
+import ResponsiveImage from './ResponsiveImage';
 import { techSkillOptions, nonTechSkillOptions } from "../components/utils/supportNeedsFocusAreaEntries";
 
 const categoryColors = {
@@ -49,8 +50,10 @@ export default function OrgDisplayCard({ org, isVolunteerPage = false }) {
                 <div className="relative w-24 h-24 sm:w-32 sm:h-32 flex-shrink-0">
                     <div className="w-full h-full rounded-lg bg-gradient-to-br from-gray-50 to-gray-100 border border-gray-200 flex items-center justify-center overflow-hidden">
                         {org.org_logo_filename ? (
-                            <img 
-                                src={org.org_logo_filename} 
+                            <ResponsiveImage
+                                srcsets={org.org_images?.logo}
+                                src={org.org_logo_filename}
+                                sizes="(min-width: 640px) 128px, 96px"
                                 alt={`${org.org_name} Logo`}
                                 className="w-full h-full object-cover"
                                 onError={(e) => {
@@ -9,6 +9,10 @@ import {
 import { useApi } from '../../contexts/ApiProvider';
 import { useAuth } from '../../contexts/AuthProvider';
 
+// How often and how long to poll a background image upload job
+const UPLOAD_POLL_INTERVAL_MS = 1000;
+const UPLOAD_POLL_MAX_ATTEMPTS = 120;
+
 export function ProfileImages({ 
         onEdit = false,
     }) {
@@ -74,6 +78,28 @@ export function ProfileImages({
         });
     };
 
+    const waitForUploadJob = async (jobId) => {
+        for (let attempt = 0; attempt < UPLOAD_POLL_MAX_ATTEMPTS; attempt++) {
+            await new Promise((resolve) => setTimeout(resolve, UPLOAD_POLL_INTERVAL_MS));
+            const response = await apiClient.get(
+                `/profile/upload-images/${jobId}`,
+                { user_id: user.id }
+            );
+            if (response.status === 404) {
+                // The job's record is gone (e.g. pruned); the upload may
+                // still have been saved, so let the caller reload the profile
+                return null;
+            }
+            if (!response.ok) {
+                throw new Error(response.body?.error || 'Upload failed');
+            }
+            if (response.body.done) {
+                return response.body;
+            }
+        }
+        throw new Error('Upload is taking longer than expected, please check back later');
+    };
+
     const handleSubmit = async () => {
         // Skip if no images selected
         if (!selectedImages.logo && !selectedImages.cover_photo) {
@@ -95,11 +121,22 @@ export function ProfileImages({
             }
 
             const response = await apiClient.post('/profile/upload-images', formData);
+            if (response.status !== 202) {
+                throw new Error(response.body?.error || 'Upload failed');
+            }
+
+            // Images are processed in the background; poll until the job finishes
+            const job = await waitForUploadJob(response.body.job_id);
+            if (!job) {
+                navigate("/org_profile", {
+                    state: { org: { user_id: user.id } },
+                });
+                return;
+            }
+            const { results } = job;
 
-            const { message, results } = response?.body;
-            
-            console.log('Upload successful:', {
-                message,
+            console.log('Upload finished:', {
+                status: job.status,
                 logoUrl: results.logo?.url,
                 coverUrl: results.cover_photo?.url
             });
@@ -107,11 +144,13 @@ export function ProfileImages({
             if (results.logo?.success || results.cover_photo?.success) {
                 setPreviews((prev) => ({
                     ...prev,
-                    logo: results.logo?.url,
-                    cover_photo: results.cover_photo?.url,
+                    logo: results.logo?.success ? results.logo.url : prev.logo,
+                    cover_photo: results.cover_photo?.success ? results.cover_photo.url : prev.cover_photo,
                 }));
             } else {
-                throw new Error(response.body.error || 'Upload failed');
+                throw new Error(
+                    results.logo?.error || results.cover_photo?.error || 'Upload failed'
+                );
             }
 
         } catch (err) {
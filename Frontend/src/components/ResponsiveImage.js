@@ -0,0 +1,27 @@
+import React from "react";
+
+// Renders an uploaded image from its variant srcsets (see org_images in the
+// org profile / directory responses), letting the browser pick the smallest
+// WebP or JPEG that fills `sizes`. Images uploaded before variants existed
+// have no srcsets and fall back to the single `src`.
+export default function ResponsiveImage({ srcsets, src, sizes, alt, className, onError }) {
+    if (!srcsets) {
+        return <img src={src} alt={alt} className={className} onError={onError} />;
+    }
+
+    return (
+        <picture>
+            <source type="image/webp" srcSet={srcsets.webp} sizes={sizes} />
+            <img
+                src={srcsets.src}
+                srcSet={srcsets.jpeg}
+                sizes={sizes}
+                alt={alt}
+                className={className}
+                loading="lazy"
+                decoding="async"
+                onError={onError}
+            />
+        </picture>
+    );
+}
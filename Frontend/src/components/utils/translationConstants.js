@@ -24,6 +24,7 @@ export const STATIC_PHRASES = {
         'Select skill...' : 'Select skill...',
         'organization(s)': 'organization(s)',
         'Loading organizations...': 'Loading organizations...',
+        'Load more results': 'Load more results',
         
         // Auth pages
         'Login': 'Login',
@@ -190,6 +191,7 @@ export const STATIC_PHRASES = {
 
         // Results
         'results': 'matokeo',
+        'Load more results': 'Pakia matokeo zaidi',
 
         // Volunteer Dashboard
         'Matched Organizations': 'Mashirika Yanayolingana na ujuzi wako',
@@ -5,6 +5,71 @@ import { useApi } from './ApiProvider';
 
 const TranslationContext = createContext();
 
+// DynamicTranslate requests made within this window are sent together
+const BATCH_DELAY_MS = 20;
+
+// Matches MAX_BATCH_TRANSLATIONS on the backend
+const MAX_BATCH_SIZE = 500;
+
+// language -> Map(text -> [resolve callbacks]) waiting for the next batch
+const pendingTranslations = new Map();
+let batchTimer = null;
+
+// Send every pending string to /main/translate/batch, one request per language
+async function flushTranslations(apiClient) {
+    batchTimer = null;
+    const batches = Array.from(pendingTranslations.entries());
+    pendingTranslations.clear();
+
+    for (const [language, textMap] of batches) {
+        const texts = Array.from(textMap.keys());
+
+        for (let start = 0; start < texts.length; start += MAX_BATCH_SIZE) {
+            const chunk = texts.slice(start, start + MAX_BATCH_SIZE);
+            let translations = {};
+
+            try {
+                const response = await apiClient.post('/main/translate/batch', {
+                    texts: chunk,
+                    targetLanguage: language
+                });
+
+                if (response.ok) {
+                    response.body.translations.forEach(({ text, translatedText }) => {
+                        translations[text] = translatedText;
+                    });
+                }
+            } catch (error) {
+                console.error('Translation error:', error);
+            }
+
+            // Fallback to original text if translation fails
+            chunk.forEach((text) => {
+                const translatedText = translations[text] ?? text;
+                textMap.get(text).forEach((resolve) => resolve(translatedText));
+            });
+        }
+    }
+}
+
+// Queue a string for translation; resolves with the translated text
+function requestTranslation(apiClient, text, language) {
+    return new Promise((resolve) => {
+        if (!pendingTranslations.has(language)) {
+            pendingTranslations.set(language, new Map());
+        }
+        const textMap = pendingTranslations.get(language);
+        if (!textMap.has(text)) {
+            textMap.set(text, []);
+        }
+        textMap.get(text).push(resolve);
+
+        if (!batchTimer) {
+            batchTimer = setTimeout(() => flushTranslations(apiClient), BATCH_DELAY_MS);
+        }
+    });
+}
+
 // Static content translation component
 export function Translate({ children }) {
     const { currentLanguage } = useContext(TranslationContext);
@@ -47,28 +112,26 @@ export function DynamicTranslate({ children }) {
             return;
         }
 
-        // Perform translation if not in cache
+        // Queue the translation; strings from every DynamicTranslate on the
+        // page are sent to the backend together
+        let cancelled = false;
         const translateText = async () => {
-            try {
-                const response = await apiClient.post('/main/translate', {
-                    text: children,
-                    targetLanguage: currentLanguage
-                });
+            const result = await requestTranslation(apiClient, children, currentLanguage);
+            if (cancelled) return;
 
-                if (response.ok) {
-                    setTranslatedText(response.body.translatedText.translatedText);
+            setTranslatedText(result);
 
-                    // Store in local storage
-                    localStorage.setItem(cacheKey, response.body.translatedText.translatedText);
-                }
-            } catch (error) {
-                console.error('Translation error:', error);
-                // Fallback to original text if translation fails
-                setTranslatedText(children);
+            // Store in local storage
+            if (result !== children) {
+                localStorage.setItem(cacheKey, result);
             }
         };
 
         translateText();
+
+        return () => {
+            cancelled = true;
+        };
     }, [children, currentLanguage, apiClient]);
 
     return translatedText;
@@ -86,7 +86,6 @@ export default function DisplayPage() {
                     <div className="container mx-auto px-4 relative -mb-8">
                         <div className="max-w-4xl mx-auto">
                             <KeyWordSearch 
-                                orgData={orgsData} 
                                 onSearchResults={handleSearch}
                                 onFilterOpen={setIsFilterOpen}
                             />
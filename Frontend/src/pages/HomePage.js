@@ -16,9 +16,14 @@ export default function HomePage() {
     useEffect(() => {
         const fetchOrgs = async () => {
             try {
-                const response = await apiClient.get("/main/orgs");
+                // Only the featured cards are shown, so fetch a single small page
+                // with just the fields OrgDisplayCard renders
+                const response = await apiClient.get("/main/orgs", {
+                    limit: 2,
+                    fields: "user_id,org_name,org_logo_filename,org_images,org_mission_statement,focus_areas,org_county,org_year_established",
+                });
                 if (response.ok) {
-                    setOrgsData(response.body);
+                    setOrgsData(response.body.orgs);
                 }
             } catch (error) {
                 console.error("Error fetching data: ", error);
@@ -5,6 +5,7 @@ import { useAuth } from '../contexts/AuthProvider';
 import Header from '../components/Header';
 import OrgProjects from './OrgProjects';
 import Sidebar from '../components/Sidebar';
+import ResponsiveImage from '../components/ResponsiveImage';
 import { Translate, DynamicTranslate } from '../contexts/TranslationProvider';
 import { PencilIcon } from '@heroicons/react/24/outline';
 import { useNavigate } from 'react-router-dom';
@@ -72,8 +73,10 @@ export default function OrgProfile() {
                 <div className="relative h-72">
                     <div className="absolute inset-0">
                         {onboardingFormData.orgProfile.org_cover_photo_filename ? (
-                            <img 
+                            <ResponsiveImage
+                                srcsets={onboardingFormData.orgProfile.org_images?.cover_photo}
                                 src={onboardingFormData.orgProfile.org_cover_photo_filename}
+                                sizes="(min-width: 1280px) 1216px, 100vw"
                                 alt="Organization Cover" 
                                 className="w-full h-full object-cover opacity-60"
                                 onError={(e) => (e.target.style.display = 'none')}
@@ -92,8 +95,10 @@ export default function OrgProfile() {
                     <div className="bg-white rounded-xl p-2 shadow-lg">
                         <div className="w-28 h-28 rounded-lg bg-white flex items-center justify-center overflow-hidden">
                         {onboardingFormData.orgProfile.org_logo_filename ? (
-                            <img 
+                            <ResponsiveImage
+                            srcsets={onboardingFormData.orgProfile.org_images?.logo}
                             src={onboardingFormData.orgProfile.org_logo_filename}
+                            sizes="112px"
                             alt="Organization Logo" 
                             className="w-full h-full object-cover"
                             onError={(e) => {